@@ -9,12 +9,13 @@ from domain.services.authentication_service import (
     AuthenticationService as DomainAuthService,
 )
 from infrastructure.django.repositories.account_repository import (
+    CachingAccountRepository,
     DjangoAccountRepository,
 )
 from api.serializers import RegisterSerializer
 
 # Dependency Injection
-account_repository = DjangoAccountRepository()
+account_repository = CachingAccountRepository(DjangoAccountRepository())
 domain_auth_service = DomainAuthService(account_repository)
 auth_service = AuthenticationService(domain_auth_service)
 
@@ -58,16 +59,22 @@ class LoginView(APIView):
     permission_classes = [AllowAny]
 
     def post(self, request):
-        identifier = request.data.get("username") or request.data.get("email")
+        username = request.data.get("username")
+        email = request.data.get("email")
         password = request.data.get("password")
 
-        if not identifier or not password:
+        if not (username or email) or not password:
             return Response(
                 {"error": "Email/Username and password are required."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        success, response_data = auth_service.login(identifier, password)
+        # Clients may send an email in the username field, so only an explicit
+        # email field skips the identifier dispatch
+        if username:
+            success, response_data = auth_service.login(username, password)
+        else:
+            success, response_data = auth_service.login_by_email(email, password)
 
         return Response(
             response_data,
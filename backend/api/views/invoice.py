@@ -17,7 +17,7 @@ from rest_framework.viewsets import ModelViewSet
 from django.db import transaction
 
 from api.serializers import InvoiceUploadSerializer, InvoiceConfirmationSerializer, InvoiceSerializer
-from domain.services.invoice_service import InvoiceService
+from domain.services.invoice_service import get_invoice_service
 from application.services.invoice_service import InvoiceProcessingService
 from domain.exceptions import StorageError, ProcessingError
 from infrastructure.storage.file_system import FileStorage
@@ -26,7 +26,7 @@ from infrastructure.django.repositories.invoice_repository import (
 )
 from infrastructure.django.models.invoice import Invoice
 
-from integrations.transformers.pdf.transformer import PDFTransformer
+from integrations.transformers.pdf.transformer import get_pdf_transformer
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
 
@@ -52,7 +52,7 @@ class BaseInvoiceView(APIView):
         self.storage_repository = FileStorage()
         self.invoice_repository = DjangoInvoiceRepository()
         # Initialize domain service
-        self.invoice_service = InvoiceService()
+        self.invoice_service = get_invoice_service()
         # Initialize application service
         self.invoice_processing_service = InvoiceProcessingService(
             invoice_service=self.invoice_service,
@@ -124,7 +124,7 @@ class InvoiceUploadView(BaseInvoiceView):
         """
         super().__init__(*args, **kwargs)
         # Initialize transformer for additional data extraction
-        self.transformer = PDFTransformer()
+        self.transformer = get_pdf_transformer()
 
     def post(self, request: Request) -> Response:
         """
@@ -385,15 +385,14 @@ class InvoicePreviewView(BaseInvoiceView):
         """
         logger.info("Preview requested for file: %s", file_path)
         try:
-            full_path = self.storage_repository.get_file_path(file_path)
-            logger.info("Full path resolved to: %s", full_path)
-
-            if not Path(full_path).exists():
-                logger.error("File not found at path: %s", full_path)
+            try:
+                stream = self.storage_repository.get_file_stream(file_path)
+            except StorageError as e:
+                logger.error("File not found: %s (%s)", file_path, str(e))
                 return Response({"error": "File not found"}, status=404)
 
-            logger.info("File exists, attempting to serve: %s", full_path)
-            response = FileResponse(open(full_path, "rb"), content_type="application/pdf")
+            logger.info("File opened, attempting to serve: %s", file_path)
+            response = FileResponse(stream, content_type="application/pdf")
             filename = Path(file_path).name
             response["Content-Disposition"] = f'inline; filename="{filename}"'
             logger.info("Successfully created response for file: %s", filename)
@@ -465,7 +464,7 @@ class InvoiceConfirmationView(BaseInvoiceView):
         # Check if invoice exists before proceeding
         try:
             # Try to get the invoice to verify it exists
-            print(f"Invoice ID: {invoice_id}")
+            logger.debug("Invoice ID: %s", invoice_id)
             self.invoice_repository.get_by_id(invoice_id)
         except (ValueError, TypeError, KeyError) as e:
             logger.warning(
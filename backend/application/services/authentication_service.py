@@ -1,5 +1,6 @@
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
 from rest_framework.authtoken.models import Token
+from domain.models.account import Account
 from domain.services.authentication_service import (
     AuthenticationService as DomainAuthService,
 )
@@ -47,8 +48,17 @@ class AuthenticationService:
         }
 
     def login(self, identifier: str, password: str) -> Tuple[bool, Dict[str, Any]]:
-        success, account, error_message = self.domain_auth_service.login(identifier, password)
+        return self._login_response(*self.domain_auth_service.login(identifier, password))
 
+    def login_by_email(self, email: str, password: str) -> Tuple[bool, Dict[str, Any]]:
+        return self._login_response(*self.domain_auth_service.login_by_email(email, password))
+
+    def login_by_username(self, username: str, password: str) -> Tuple[bool, Dict[str, Any]]:
+        return self._login_response(*self.domain_auth_service.login_by_username(username, password))
+
+    def _login_response(
+        self, success: bool, account: Optional[Account], error_message: str
+    ) -> Tuple[bool, Dict[str, Any]]:
         if not success:
             return False, {"error": error_message}
 
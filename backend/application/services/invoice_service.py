@@ -7,20 +7,25 @@ components.
 
 import os
 import mimetypes
-import contextlib
-from pathlib import Path
-from datetime import datetime
-from domain.exceptions import ProcessingError, StorageError
+from hashlib import sha256
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import strftime
+from domain.exceptions import ProcessingError, StorageError, ValidationError
 from domain.repositories.interfaces.invoice_repository import InvoiceRepository
 from domain.repositories.interfaces.storage_repository import StorageRepository
 from domain.repositories.interfaces.account_repository import AccountRepository
 from domain.services.invoice_service import InvoiceService
+from domain.models.invoice import Invoice
+from asgiref.sync import sync_to_async
+from django.db import transaction
 from integrations.transformers.pdf.transformer import (
     PDFTransformer,
     PDFTransformationError,
+    get_pdf_transformer,
 )
+from integrations.transformers.pdf.pool import submit_transform
 from logging import getLogger
-from typing import BinaryIO, Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, Iterable, List, Optional, Tuple
 from domain.models.value_objects import UrgencyLevel
 from infrastructure.storage.temporary_storage import TemporaryStorageAdapter
 from domain.exceptions import InvalidInvoiceError
@@ -32,6 +37,39 @@ from infrastructure.storage.object_storage import ObjectStorage
 # Module-level logger
 logger = getLogger(__name__)
 
+# Local-time stamp used in storage identifiers and file metadata
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Every stored invoice file's identifier starts with this prefix
+IDENTIFIER_PREFIX = "invoice_"
+
+# Files stored and parsed concurrently by process_invoices
+BATCH_PROCESSING_WORKERS = 8
+
+# Uploads larger than this are rejected before storage (matches InvoiceUploadSerializer)
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
+# Every PDF file starts with this header
+PDF_MAGIC = b"%PDF-"
+
+# Threads for best-effort file cleanup, run off the request path
+CLEANUP_WORKERS = 4
+
+_cleanup_pool = ThreadPoolExecutor(max_workers=CLEANUP_WORKERS, thread_name_prefix="invoice-cleanup")
+
+
+def _delete_files_quietly(storage_repository: StorageRepository, file_paths: List[str]) -> None:
+    """Delete stored files, logging instead of raising when cleanup fails."""
+    try:
+        failed = storage_repository.delete_files(file_paths)
+    except StorageError as e:
+        logger.warning("File cleanup failed for %s: %s", file_paths, str(e))
+        return
+    if failed:
+        logger.warning("File cleanup failed for %s", failed)
+    else:
+        logger.info("File cleanup successful")
+
 
 class InvoiceProcessingService:
     """Application service that orchestrates invoice processing workflows.
@@ -50,6 +88,7 @@ class InvoiceProcessingService:
         invoice_repository: InvoiceRepository,
         storage_repository: StorageRepository,
         account_repository: Optional[AccountRepository] = None,
+        pdf_transformer: Optional[PDFTransformer] = None,
     ) -> None:
         """Initialize service with required components.
 
@@ -58,6 +97,9 @@ class InvoiceProcessingService:
             invoice_repository: Repository for invoice persistence
             storage_repository: Repository for file storage
             account_repository: Repository for account validation (optional)
+            pdf_transformer: PDF transformer (optional). Without one, uploads
+                are transformed in the PDF process pool with the default
+                transformer; an injected one runs in-process instead.
 
         These dependencies are stored as instance attributes, allowing each
         instance of InvoiceProcessingService to have its own set of dependencies.
@@ -67,9 +109,30 @@ class InvoiceProcessingService:
         self.invoice_repository = invoice_repository
         self.storage_repository = storage_repository
         self.account_repository = account_repository
-        self.pdf_transformer = PDFTransformer()
+        self.pdf_transformer = pdf_transformer or get_pdf_transformer()
         self.temp_storage = TemporaryStorageAdapter(storage_repository)
 
+    def _submit_transform(self, content: bytes, file_name: str) -> Future:
+        """Start transforming an in-memory PDF with this service's transformer.
+
+        The default transformer runs in the PDF process pool. The pool's
+        workers cannot use an injected transformer, so one is run here and
+        its result (or error) is returned as an already completed future.
+
+        Returns:
+            Future: Resolves to the extracted invoice data, or raises
+                PDFTransformationError
+        """
+        if self.pdf_transformer is get_pdf_transformer():
+            return submit_transform(content, file_name)
+
+        future = Future()
+        try:
+            future.set_result(self.pdf_transformer.transform_bytes(content, file_name))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
     def _get_nested_attr(self, obj: Any, attr_path: str, default: Any = None) -> Any:
         """Safely get a nested attribute or return default if not found."""
         current = obj
@@ -128,35 +191,57 @@ class InvoiceProcessingService:
             - payment details: Method, currency, amounts, etc.
             - file metadata: Size, type, original filename
             - urgency: Information about invoice processing priority
+            - duplicate: Only set (True) when the user already uploaded the
+              same file; its invoice is returned without storing or parsing
+              the file again
 
         Raises:
             ProcessingError: For failures during processing
             StorageError: For failures storing the file
         """
         logger.info("Starting invoice processing for user_id=%s", user_id)
+        file_path = None
         try:
+            # Fail fast on garbage uploads, before paying for storage and parsing
+            self._validate_upload(file)
+
+            # Read the upload once; storing it (disk/S3 I/O) and extracting its
+            # data (CPU-bound parsing, in the PDF process pool) only need the
+            # bytes, so they run concurrently
+            content = file.read()
+            original_file_name = file.name
+
+            # A re-upload of the exact same file needs neither storage nor parsing
+            content_hash = sha256(content).hexdigest()
+            duplicate = self.invoice_repository.get_by_content_hash(content_hash, user_id)
+            if duplicate:
+                logger.info("File matches already processed invoice with ID: %s", duplicate.id)
+                return self._duplicate_response(duplicate)
+
             # Generate unique identifier for file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            identifier = f"invoice_{user_id}_{timestamp}"
+            timestamp = strftime(TIMESTAMP_FORMAT)
+            identifier = f"{IDENTIFIER_PREFIX}{user_id}_{timestamp}"
             logger.debug("Generated identifier: %s", identifier)
 
-            # Store file using storage repository
-            logger.info("Saving invoice file to storage")
-            file_path = self.storage_repository.save_file(file, identifier)
-            full_path = self.storage_repository.get_file_path(file_path)
-            logger.debug("File saved at path: %s", full_path)
+            upload = BytesIO(content)
+            upload.name = original_file_name
+
+            logger.info("Saving invoice file to storage and starting PDF transformation")
+            transform_future = self._submit_transform(content, original_file_name)
+            file_path = self.storage_repository.save_file(upload, identifier, size_hint=len(content))
+            logger.debug("File saved as: %s", file_path)
+            invoice_data = transform_future.result()
+
             # Extract file metadata
             logger.info("Extracting file metadata")
-            file_size = os.path.getsize(full_path)
-            file_type = mimetypes.guess_type(full_path)[0] or "unknown"
-            original_file_name = file.name
+            file_size = len(content)
+            # The stored identifier keeps the file extension, so there is no need
+            # to resolve its full path (a HEAD request on object storage)
+            file_type = mimetypes.guess_type(file_path)[0] or "unknown"
             logger.debug(
                 "File metadata: size=%s bytes, type=%s, name=%s", file_size, file_type, original_file_name
             )
 
-            # Extract data from PDF
-            logger.info("Starting PDF transformation to extract invoice data")
-            invoice_data = self.pdf_transformer.transform(Path(full_path))
             if invoice_data.get("invoice_number"):
                 logger.info(
                     "PDF transformation successful for invoice number: %s", invoice_data.get("invoice_number")
@@ -200,61 +285,276 @@ class InvoiceProcessingService:
                 original_file_name=original_file_name,
                 file_path=file_path,
                 user_id=user_id,
+                content_hash=content_hash,
             )
             logger.info("Invoice successfully processed and saved with ID: %s", saved_invoice.id)
 
-            logger.info("Retrieving urgency information")
-            urgency_info = self.invoice_service.get_urgency_info(saved_invoice)
-            logger.debug("Urgency information: %s", urgency_info)
+            response = self._invoice_response(saved_invoice)
+            logger.debug("Urgency information: %s", response["urgency"])
 
             # Invoice processing completed successfully
-            updated = getattr(saved_invoice, "is_updated", False)
             logger.info("Invoice processing completed successfully")
 
             return {
-                "invoice_id": saved_invoice.id,
-                "invoice_number": saved_invoice.invoice_number,
-                "status": saved_invoice.status,
-                "file_path": file_path,
-                "updated": updated,  # Use getattr to handle missing attribute
+                **response,
+                # Use getattr to handle missing attribute
+                "updated": getattr(saved_invoice, "is_updated", False),
                 **invoice_metadata,
-                "file_size": file_size,
-                "file_type": file_type,
-                "original_file_name": original_file_name,
-                "urgency": urgency_info,
             }
 
         except PDFTransformationError as e:
-            logger.error("PDF transformation failed: %s", str(e), exc_info=True)
+            logger.exception("PDF transformation failed: %s", str(e))
 
-            # Log the attempt to clean up
-            logger.info("Attempting to clean up file: %s", file_path)
-
-            # Use contextlib.suppress for cleaner error handling
-            # This is equivalent to try-except with a pass, but more explicit
-            with contextlib.suppress(StorageError):
-                self.storage_repository.delete_file(file_path)
-                logger.info("File cleanup successful")
+            if file_path is not None:
+                self._delete_in_background(file_path)
 
             # Include error type in message for better handling
             raise ProcessingError(f"PDF_TRANSFORMATION_ERROR: {str(e)}") from e
 
-        except Exception as e:
-            logger.error("Invoice processing failed: %s", str(e), exc_info=True)
-
-            # Log the attempt to clean up
-            logger.info("Attempting to clean up file: %s", file_path)
+        except (InvalidInvoiceError, ValidationError, KeyError, ValueError) as e:
+            # The upload or its extracted data was rejected
+            logger.error("Invoice processing failed: %s", str(e))
 
-            # Use contextlib.suppress for cleaner error handling
-            # This is equivalent to try-except with a pass, but more explicit
-            with contextlib.suppress(StorageError):
-                self.storage_repository.delete_file(file_path)
-                logger.info("File cleanup successful")
+            if file_path is not None:
+                self._delete_in_background(file_path)
 
             # Include more context about the error type
+            raise ProcessingError(f"Failed to process invoice ({type(e).__name__}): {str(e)}") from e
+
+        except Exception:
+            # Storage and unexpected errors reach the caller unchanged, so it can
+            # tell them apart (e.g. the upload view answers 503 on StorageError)
+            logger.exception("Invoice processing failed")
+
+            if file_path is not None:
+                self._delete_in_background(file_path)
+            raise
+
+    async def aprocess_invoice(self, file: BinaryIO, user_id: int) -> Dict[str, Any]:
+        """Async counterpart of process_invoice, for callers on an event loop.
+
+        The workflow runs on Django's sync thread, like other ORM code called
+        from async views, so it reuses that thread's database connection
+        instead of opening one per worker thread. The PDF parsing itself
+        still runs in the PDF process pool, off that thread.
+
+        Args:
+            file: The uploaded invoice file (binary file-like object)
+            user_id: The ID of the user who uploaded the invoice
+
+        Returns:
+            Dict containing the processed invoice information, as returned
+            by process_invoice
+
+        Raises:
+            ProcessingError: For failures during processing
+            StorageError: For failures storing the file
+        """
+        return await sync_to_async(self.process_invoice, thread_sensitive=True)(file, user_id)
+
+    def _invoice_response(self, saved_invoice: Invoice) -> Dict[str, Any]:
+        """Build the response fields shared by single and batch processing.
+
+        Args:
+            saved_invoice: The processed invoice, with the ID of its saved row
+
+        Returns:
+            Dict with the invoice identifiers, status, file metadata and
+            urgency information
+        """
+        file = saved_invoice.file
+        return {
+            "invoice_id": saved_invoice.id,
+            "invoice_number": saved_invoice.invoice_number,
+            "status": saved_invoice.status,
+            "file_path": file.path,
+            "file_size": file.size,
+            "file_type": file.file_type,
+            "original_file_name": file.original_name,
+            "urgency": self.invoice_service.get_urgency_info(saved_invoice),
+        }
+
+    def _duplicate_response(self, invoice: Invoice) -> Dict[str, Any]:
+        """Build the process_invoice response for an already processed file.
+
+        Mirrors a regular response, with the extracted metadata read back
+        from the stored invoice instead of a new PDF transformation.
+        """
+        buyer, seller, payment = invoice.buyer, invoice.seller, invoice.payment
+        return {
+            **self._invoice_response(invoice),
+            "updated": False,
+            "duplicate": True,
+            "buyer_name": buyer.name,
+            "buyer_address": buyer.address,
+            "buyer_email": buyer.email,
+            "buyer_vat": buyer.vat,
+            "seller_name": seller.name,
+            "seller_vat": seller.vat,
+            "payment_method": payment.method,
+            "currency": payment.currency,
+            "iban": payment.iban,
+            "bic": payment.bic,
+            "payment_processor": payment.processor,
+            "transaction_id": payment.transaction_id,
+            "subtotal": payment.subtotal,
+            "vat_amount": payment.vat_amount,
+            "total_amount": invoice.total_amount,
+            "due_date": invoice.due_date,
+        }
+
+    def _delete_in_background(self, *file_paths: str) -> None:
+        """Schedule best-effort deletion of stored files without waiting for it.
+
+        Cleanup failures are only logged, so callers do not block on disk or
+        S3 deletes the response does not depend on.
+        """
+        logger.info("Scheduling cleanup of files: %s", file_paths)
+        _cleanup_pool.submit(_delete_files_quietly, self.storage_repository, list(file_paths))
+
+    def _validate_upload(self, file: BinaryIO) -> None:
+        """Reject uploads that are too large or not PDFs before any work is done.
+
+        Only the size attribute and the first bytes of the file are read; the
+        file position is restored afterwards.
+
+        Raises:
+            InvalidInvoiceError: If the file is too large or not a PDF
+        """
+        size = getattr(file, "size", None)
+        if size is not None and size > MAX_UPLOAD_SIZE:
+            raise InvalidInvoiceError(f"Invoice file exceeds the maximum size of {MAX_UPLOAD_SIZE} bytes")
+
+        position = file.tell()
+        header = file.read(len(PDF_MAGIC))
+        file.seek(position)
+        if header != PDF_MAGIC:
+            raise InvalidInvoiceError("Invoice file is not a PDF")
+
+    def _store_and_transform(
+        self, content: bytes, file_name: str, identifier: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Store one uploaded invoice file and extract its data.
+
+        Returns:
+            Tuple of (stored file path, extracted invoice data)
+        """
+        upload = BytesIO(content)
+        upload.name = file_name
+        transform_future = self._submit_transform(content, file_name)
+        file_path = self.storage_repository.save_file(upload, identifier, size_hint=len(content))
+        try:
+            invoice_data = transform_future.result()
+        except Exception:
+            self._delete_in_background(file_path)
+            raise
+        return file_path, invoice_data
+
+    def process_invoices(self, files: Iterable[BinaryIO], user_id: int) -> List[Dict[str, Any]]:
+        """Process a batch of invoice files, saving the invoices together.
+
+        Bulk-import counterpart of process_invoice. Files the user already
+        uploaded (or that repeat earlier in the batch) are answered from the
+        stored invoice, as in process_invoice. The new files are stored and
+        parsed concurrently, then handed to the domain service's
+        process_invoices_batch inside a single transaction. If any file fails,
+        nothing is saved and the files stored so far are removed.
+
+        Args:
+            files: The uploaded invoice files (binary file-like objects)
+            user_id: The ID of the user who uploaded the invoices
+
+        Returns:
+            List of dicts with the processed invoice information, in the order
+            of files
+
+        Raises:
+            ProcessingError: For failures during processing
+        """
+        files = list(files)
+        logger.info("Starting batch processing of %d invoices for user_id=%s", len(files), user_id)
+        try:
+            for file in files:
+                self._validate_upload(file)
+        except InvalidInvoiceError as e:
+            raise ProcessingError(f"Failed to process invoices (InvalidInvoiceError): {str(e)}") from e
+
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(files)
+        # Position of the first file with each content hash, and of the files repeating it
+        first_by_hash: Dict[str, int] = {}
+        repeats: List[Tuple[int, int]] = []
+        new_files: List[Tuple[int, bytes, str]] = []
+        for index, file in enumerate(files):
+            content = file.read()
+            content_hash = sha256(content).hexdigest()
+            if content_hash in first_by_hash:
+                repeats.append((index, first_by_hash[content_hash]))
+                continue
+            first_by_hash[content_hash] = index
+            duplicate = self.invoice_repository.get_by_content_hash(content_hash, user_id)
+            if duplicate:
+                logger.info("File matches already processed invoice with ID: %s", duplicate.id)
+                responses[index] = self._duplicate_response(duplicate)
+            else:
+                new_files.append((index, content, content_hash))
+
+        timestamp = strftime(TIMESTAMP_FORMAT)
+        base_identifier = f"{IDENTIFIER_PREFIX}{user_id}_{timestamp}_"
+
+        stored_paths: List[str] = []
+        try:
+            with ThreadPoolExecutor(max_workers=BATCH_PROCESSING_WORKERS) as executor:
+                futures = [
+                    executor.submit(
+                        self._store_and_transform, content, files[index].name, f"{base_identifier}{index}"
+                    )
+                    for index, content, _ in new_files
+                ]
+                results = []
+                errors = []
+                for future in futures:
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # Keep collecting so every stored file can be cleaned up
+                        errors.append(e)
+                        continue
+                    stored_paths.append(result[0])
+                    results.append(result)
+            if errors:
+                raise errors[0]
+
+            items = [
+                {
+                    "invoice_data": invoice_data,
+                    "file_size": len(content),
+                    "file_type": mimetypes.guess_type(file_path)[0] or "unknown",
+                    "original_file_name": files[index].name,
+                    "file_path": file_path,
+                    "user_id": user_id,
+                    "content_hash": content_hash,
+                }
+                for (index, content, content_hash), (file_path, invoice_data) in zip(new_files, results)
+            ]
+            with transaction.atomic():
+                saved_invoices = self.invoice_service.process_invoices_batch(items) if items else []
+            logger.info("Batch of %d invoices saved", len(saved_invoices))
+
+            for (index, _, _), saved_invoice in zip(new_files, saved_invoices):
+                responses[index] = {
+                    **self._invoice_response(saved_invoice),
+                    "updated": getattr(saved_invoice, "is_updated", False),
+                }
+            for index, first_index in repeats:
+                responses[index] = {**responses[first_index], "updated": False, "duplicate": True}
+            return responses
+
+        except Exception as e:
+            logger.error("Batch invoice processing failed: %s", str(e), exc_info=True)
+            if stored_paths:
+                self._delete_in_background(*stored_paths)
             error_type = type(e).__name__
-            msg = f"Failed to process invoice ({error_type}): {str(e)}"
-            raise ProcessingError(msg) from e
+            raise ProcessingError(f"Failed to process invoices ({error_type}): {str(e)}") from e
 
     def finalize_invoice(
         self,
@@ -313,7 +613,7 @@ class InvoiceProcessingService:
 
             # Generate unique identifier for permanent file using both invoice_number and user_id
             # for consistency with process_invoice method
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = strftime(TIMESTAMP_FORMAT)
 
             # Determine effective user ID with proper validation
             effective_user_id = user_id or invoice.uploaded_by
@@ -339,7 +639,9 @@ class InvoiceProcessingService:
                 )
 
             logger.info("Invoice being finalized by user ID: %s", effective_user_id)
-            permanent_identifier = f"invoice_{invoice.invoice_number}_{effective_user_id}_{timestamp}"
+            permanent_identifier = (
+                f"{IDENTIFIER_PREFIX}{invoice.invoice_number}_{effective_user_id}_{timestamp}"
+            )
 
             # Verify temporary file exists before attempting transfer
             temp_full_path = self.storage_repository.get_file_path(temp_file_path)
@@ -386,7 +688,7 @@ class InvoiceProcessingService:
 
                 # Add urgency information to metadata if available
                 if urgency:
-                    file_metadata["urgency_level"] = str(urgency.value)
+                    file_metadata["urgency_level"] = str(urgency.db_value)
                     file_metadata["urgency_name"] = urgency.display_name
 
                 # Add additional metadata from the invoice if available
@@ -427,20 +729,22 @@ class InvoiceProcessingService:
                     if not os.getenv("DEBUG", "False").lower() in ["true", "1"]:
                         osb = ObjectStorage()
                         logger.info("Uploading to S3 as debug mode is disabled")
+                        # Upload the content read above instead of reading the file again
                         file_obj = BytesIO(content)
-                        file_obj.name = Path(temp_file_path).name
+                        file_obj.name = temp_full_path.name
                         permanent_path = osb.save_file(
-                            Path(temp_file_path), permanent_identifier, metadata=file_metadata
+                            file_obj, permanent_identifier, metadata=file_metadata, size_hint=len(content)
                         )
+
+                        # The upload leaves the temporary file behind, so delete it
+                        self.temp_storage._untrack_temporary_file(temp_file_path)
+                        self._delete_in_background(temp_file_path)
                     else:
                         logger.info("Saving locally as debug mode is enabled")
+                        # Promotion moves the file and untracks it; nothing is left to delete
                         permanent_path = self.temp_storage.promote_to_permanent(
                             temp_file_path, permanent_identifier
                         )
-
-                    # Delete the temporary file
-                    self.temp_storage._untrack_temporary_file(temp_file_path)
-                    self.storage_repository.delete_file(temp_file_path)
                 else:
                     # Fall back to standard promotion if metadata not supported
                     logger.info("Using standard promotion mechanism")
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from datetime import date
-from typing import Optional
+from typing import Any, Mapping, Optional
 from domain.exceptions import InvalidInvoiceError
 from domain.models.value_objects import UrgencyLevel, InvoiceStatus
 from django.utils import timezone
@@ -12,8 +12,24 @@ from logging import getLogger
 # Module-level logger
 logger = getLogger(__name__)
 
+# Amounts are stored with two decimal places (see the DecimalField definitions)
+AMOUNT_DECIMAL_PLACES = 2
 
-@dataclass
+_STATUS_DISPLAY = {status: status.display_name for status in InvoiceStatus}
+
+# Statuses from which each transition is allowed
+_TO_PAID_FROM = frozenset({InvoiceStatus.PENDING, InvoiceStatus.OVERDUE})
+_TO_OVERDUE_FROM = frozenset({InvoiceStatus.PENDING})
+
+
+def _to_cents(amount) -> int:
+    """Convert a monetary amount to an integer number of cents."""
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))
+    return int(amount.scaleb(AMOUNT_DECIMAL_PLACES).to_integral_value())
+
+
+@dataclass(slots=True)
 class BuyerInfo:
     name: Optional[str] = None
     address: Optional[str] = None
@@ -21,13 +37,13 @@ class BuyerInfo:
     email: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SellerInfo:
     name: Optional[str] = None
     vat: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentInfo:
     method: Optional[str] = None
     currency: Optional[str] = None
@@ -40,12 +56,36 @@ class PaymentInfo:
     total_amount: Optional[Decimal] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     path: Optional[str] = None
     size: Optional[int] = None
     file_type: Optional[str] = None
     original_name: Optional[str] = None
+    # SHA-256 of the file content, used to recognize re-uploads
+    content_hash: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class InvoiceExtract:
+    """The invoice fields extracted from a document that the domain acts on."""
+
+    total_amount: Decimal
+    due_date: date
+    invoice_number: str
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "InvoiceExtract":
+        """Pick the domain fields out of the transformer's extracted data.
+
+        Raises:
+            KeyError: If a required field is missing
+        """
+        return cls(
+            total_amount=data["total_amount"],
+            due_date=data["due_date"],
+            invoice_number=data["invoice_number"],
+        )
 
 
 class Invoice:
@@ -59,6 +99,7 @@ class Invoice:
         due_date (date): When payment is due
         invoice_number (str): Unique identifier
         status (InvoiceStatus): Current payment status
+        _total_amount_cents (int): Total amount stored as integer cents
         _manual_urgency (Optional[UrgencyLevel]): Manual urgency override
     """
 
@@ -113,6 +154,56 @@ class Invoice:
         invoice.validate()
         return invoice
 
+    @classmethod
+    def from_extract(cls, extract: InvoiceExtract) -> "Invoice":
+        """Create a new valid invoice from data extracted from a document.
+
+        Raises:
+            InvalidInvoiceError: If any of the data is invalid
+        """
+        return cls.create(
+            total_amount=extract.total_amount,
+            due_date=extract.due_date,
+            invoice_number=extract.invoice_number,
+        )
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Invoice":
+        """Build an invoice from already-persisted data without validation.
+
+        Positional counterpart of the constructor for repository hydration.
+        Data loaded from the database was validated when it was stored, so
+        keyword binding and validate() are skipped.
+
+        Args:
+            row (tuple): Values in the order (invoice_id, total_amount, due_date,
+                invoice_number, status, uploaded_by, buyer, seller, payment, file,
+                urgency)
+
+        Returns:
+            Invoice: The hydrated invoice instance
+        """
+        invoice = cls.__new__(cls)
+        (
+            invoice.id,
+            total_amount,
+            invoice.due_date,
+            invoice.invoice_number,
+            invoice.status,
+            invoice.uploaded_by,
+            buyer,
+            seller,
+            payment,
+            file,
+            invoice._manual_urgency,
+        ) = row
+        invoice._total_amount_cents = _to_cents(total_amount)
+        invoice.buyer = buyer or BuyerInfo()
+        invoice.seller = seller or SellerInfo()
+        invoice.payment = payment or PaymentInfo()
+        invoice.file = file or FileInfo()
+        return invoice
+
     def __init__(
         self,
         *,
@@ -134,7 +225,7 @@ class Invoice:
         logger.debug("  invoice_number: %s (%s)", invoice_number, type(invoice_number))
 
         self.id: Optional[int] = invoice_id
-        self.total_amount: Decimal = total_amount
+        self.total_amount = total_amount
         self.due_date: date = due_date
         self.invoice_number: str = invoice_number
         self.status: InvoiceStatus = status
@@ -146,9 +237,18 @@ class Invoice:
         self.file = file or FileInfo()
         self._manual_urgency: Optional[UrgencyLevel] = urgency  # Initialize urgency
 
+    @property
+    def total_amount(self) -> Decimal:
+        """Invoice total amount as a Decimal with two decimal places."""
+        return Decimal(self._total_amount_cents).scaleb(-AMOUNT_DECIMAL_PLACES)
+
+    @total_amount.setter
+    def total_amount(self, value: Decimal) -> None:
+        self._total_amount_cents = _to_cents(value)
+
     def validate(self) -> None:
         """Apply business rules to validate invoice data."""
-        if self.total_amount <= 0:
+        if self._total_amount_cents <= 0:
             raise InvalidInvoiceError("Invoice total_amount must be positive")
         self.validate_status()
 
@@ -158,13 +258,14 @@ class Invoice:
         Raises:
             InvalidInvoiceError: If status violates business rules
         """
-        if self.status == InvoiceStatus.OVERDUE and self.due_date > timezone.now().date():
-            raise InvalidInvoiceError("Invoice cannot be overdue if due date is in the future")
-        if not isinstance(self.status, InvoiceStatus):
+        status = self.status
+        # Cheap type check first; only OVERDUE needs the current date.
+        # InvoiceStatus is a str subclass, so plain strings like "pending" would
+        # compare equal to a member and must be rejected by type, not by value.
+        if not isinstance(status, InvoiceStatus):
             raise InvalidInvoiceError("Status must be an InvoiceStatus enum")
-        valid_statuses = (InvoiceStatus.PENDING, InvoiceStatus.OVERDUE, InvoiceStatus.PAID)
-        if self.status not in valid_statuses:
-            raise InvalidInvoiceError(f"Invalid status: {self.status}")
+        if status is InvoiceStatus.OVERDUE and self.due_date > timezone.localdate():
+            raise InvalidInvoiceError("Invoice cannot be overdue if due date is in the future")
 
     @property
     def is_paid(self) -> bool:
@@ -230,7 +331,7 @@ class Invoice:
 
     def get_status_display(self) -> str:
         """Return a human-readable status description."""
-        return self.status.display_name
+        return _STATUS_DISPLAY[self.status]
 
     def mark_as_paid(self) -> None:
         """Mark the invoice as paid.
@@ -244,18 +345,22 @@ class Invoice:
 
         The status change will be persisted through the repository pattern.
         """
-        if self.status == InvoiceStatus.PENDING or self.status == InvoiceStatus.OVERDUE:
+        if self.status in _TO_PAID_FROM:
             self.status = InvoiceStatus.PAID
 
-    def is_overdue(self) -> bool:
+    def is_overdue(self, as_of: Optional[date] = None) -> bool:
         """Check if the invoice is past its due date.
 
+        Args:
+            as_of (date, optional): The date to check against. Defaults to
+                                  today.
+
         Returns:
             bool: True if the invoice is past its due date, False otherwise.
         """
-        return self.due_date < timezone.now().date()
+        return self.due_date < (as_of or timezone.localdate())
 
-    def mark_as_overdue(self) -> None:
+    def mark_as_overdue(self, as_of: Optional[date] = None) -> None:
         """Mark the invoice as overdue if it's past due date and pending.
 
         This method will only mark the invoice as overdue if:
@@ -263,8 +368,12 @@ class Invoice:
         2. The current status is 'pending'
 
         The status change will be persisted through the repository pattern.
+
+        Args:
+            as_of (date, optional): The date to check against. Defaults to
+                                  today.
         """
-        if self.is_overdue() and self.status == InvoiceStatus.PENDING:
+        if self.status in _TO_OVERDUE_FROM and self.is_overdue(as_of):
             self.status = InvoiceStatus.OVERDUE
 
     def set_urgency_manually(self, new_urgency: UrgencyLevel) -> None:
@@ -1,6 +1,7 @@
 """Domain model representing the PontoConnect and its business rules."""
 
 from decimal import Decimal
+from functools import lru_cache
 from logging import getLogger
 from datetime import datetime, timezone
 
@@ -19,12 +20,43 @@ from config.settings.base import VALID_ISO_CURRENCY_CODES
 logger = getLogger(__name__)
 
 
+def _parse_expiration(value) -> datetime:
+    """Normalize an ISO 8601 expiration string from Ponto to an aware datetime.
+
+    Ponto returns timestamps such as "2025-01-01T00:00:00.000Z" while values
+    loaded from the database are already datetimes, so only strings are parsed.
+    Naive datetimes are assumed to be UTC.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime) and value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _parse_decimal(value) -> Decimal:
+    """Parse a balance into a Decimal, memoized since balances repeat across polls."""
+    return Decimal(str(value))
+
+
+def _to_decimal(value):
+    """Convert a balance from the Ponto API (str, int or float) to a Decimal.
+
+    Decimal and None values are returned unchanged.
+    """
+    if value is None or isinstance(value, Decimal):
+        return value
+    return _parse_decimal(value)
+
+
 class IbanityAccount:
     """
     Represents an Ibanity account in our system, containing all relevant
     business data and validation rules.
 
     Attributes:
+        id (int): Database ID, None until the account is stored
         user (User): Database user instance
         account_id (str): Ibanity Ponto Connect account id
         description (str): Ibanity Ponto Connect account description
@@ -39,6 +71,22 @@ class IbanityAccount:
         resource_id (str):
     """
 
+    __slots__ = (
+        "id",
+        "user",
+        "account_id",
+        "description",
+        "product",
+        "reference",
+        "currency",
+        "authorization_expiration_expected_at",
+        "current_balance",
+        "available_balance",
+        "subtype",
+        "holder_name",
+        "resource_id",
+    )
+
     @classmethod
     def create(
         cls,
@@ -116,42 +164,48 @@ class IbanityAccount:
         resource_id: str,
     ) -> None:
         logger.debug("IbanityAccount __init__ called")
-        logger.debug(f"  User: {user} ({type(user)})")
-        logger.debug(f"  Account ID: {account_id} ({type(account_id)})")
-        logger.debug(f"  Current balance: {current_balance} ({type(current_balance)})")
+        logger.debug("  User: %s (%s)", user, type(user))
+        logger.debug("  Account ID: %s (%s)", account_id, type(account_id))
+        logger.debug("  Current balance: %s (%s)", current_balance, type(current_balance))
+        # Database ID, set by the repository once the account is stored
+        self.id = None
         self.user = user
         self.account_id: str = account_id
         self.description: str = description
         self.product: str = product
         self.reference: str = reference
         self.currency: str = currency
-        self.authorization_expiration_expected_at: datetime = authorization_expiration_expected_at
-        self.current_balance: Decimal = current_balance
-        self.available_balance: Decimal = available_balance
+        self.authorization_expiration_expected_at: datetime = _parse_expiration(
+            authorization_expiration_expected_at
+        )
+        self.current_balance: Decimal = _to_decimal(current_balance)
+        self.available_balance: Decimal = _to_decimal(available_balance)
         self.subtype: str = subtype
         self.holder_name: str = holder_name
         self.resource_id: str = resource_id
 
     def validate(self) -> None:
-        """Apply business rules to validate IbanityAccount data."""
-        if not self.holder_name or not self.holder_name.strip():
-            raise InvalidIbanityAccountError("Missing holder name")
+        """Apply business rules to validate IbanityAccount data.
+
+        Checks run cheapest first; the clock is only read once all field checks pass.
+        """
+        if self.available_balance < 0:
+            raise NegativeBalanceError("IbanityAccount available balance can't be negative")
 
         if self.currency not in VALID_ISO_CURRENCY_CODES:
             raise InvalidCurrencyError(
                 f"Invalid currency code '{self.currency}'. Expected valid ISO 4217 codes."
             )
 
-        if self.available_balance < 0:
-            raise NegativeBalanceError("IbanityAccount available balance can't be negative")
+        if not self.holder_name or not self.holder_name.strip():
+            raise InvalidIbanityAccountError("Missing holder name")
 
         expire_at = self.authorization_expiration_expected_at
-        dt = datetime.fromisoformat(expire_at.replace("Z", "+00:00"))
         now = datetime.now(timezone.utc)
-        if dt <= now:
+        if expire_at <= now:
             raise ExpiredAuthorizationError(
                 f"Expiration time must be in the future. "
-                f"Expiration: {dt.isoformat()}, "
+                f"Expiration: {expire_at.isoformat()}, "
                 f"Current UTC: {now.isoformat()}"
             )
 
@@ -207,41 +261,22 @@ class IbanityAccount:
             )
         """
         # Update fields that are provided (not None)
-        if user is not None:
-            self.user = user
-
-        if account_id is not None:
-            self.account_id = account_id
-
-        if description is not None:
-            self.description = description
-
-        if product is not None:
-            self.product = product
-
-        if reference is not None:
-            self.reference = reference
-
-        if currency is not None:
-            self.currency = currency
-
-        if authorization_expiration_expected_at is not None:
-            self.authorization_expiration_expected_at = authorization_expiration_expected_at
-
-        if current_balance is not None:
-            self.current_balance = current_balance
-
-        if available_balance is not None:
-            self.available_balance = available_balance
-
-        if subtype is not None:
-            self.subtype = subtype
-
-        if holder_name is not None:
-            self.holder_name = holder_name
-
-        if resource_id is not None:
-            self.resource_id = resource_id
+        for name, value in (
+            ("user", user),
+            ("account_id", account_id),
+            ("description", description),
+            ("product", product),
+            ("reference", reference),
+            ("currency", currency),
+            ("authorization_expiration_expected_at", _parse_expiration(authorization_expiration_expected_at)),
+            ("current_balance", _to_decimal(current_balance)),
+            ("available_balance", _to_decimal(available_balance)),
+            ("subtype", subtype),
+            ("holder_name", holder_name),
+            ("resource_id", resource_id),
+        ):
+            if value is not None:
+                setattr(self, name, value)
 
         # Validate the updated IbanityAccount
         self.validate()
@@ -253,6 +288,7 @@ class PontoToken:
     business data and validation rules.
 
     Attributes:
+        id (int): Database ID, None until the token is stored
         user (User): Represents User that owns this Ponto token
         access_token (str): Access token for API access to Ponto
         refresh_token (str): Refresh token for API access to Ponto
@@ -261,6 +297,9 @@ class PontoToken:
         updated_at (datetime): Updated at timestamp for this record
     """
 
+    # _fingerprint: hash of the token data, kept in sync by __init__ and update
+    __slots__ = ("id", "user", "access_token", "refresh_token", "expires_in", "_fingerprint")
+
     @classmethod
     def create(
         cls,
@@ -306,14 +345,40 @@ class PontoToken:
         expires_in: int,
     ) -> None:
         logger.debug("PontoToken __init__ called")
-        logger.debug(f"  User: {user} ({type(user)})")
-        logger.debug(f"  Access Token: {access_token} ({type(access_token)})")
-        logger.debug(f"  Refresh Token: {refresh_token} ({type(refresh_token)})")
-        logger.debug(f"  Expires in: {expires_in} ({type(expires_in)})")
+        logger.debug("  User: %s (%s)", user, type(user))
+        logger.debug("  Access Token: %s (%s)", access_token, type(access_token))
+        logger.debug("  Refresh Token: %s (%s)", refresh_token, type(refresh_token))
+        logger.debug("  Expires in: %s (%s)", expires_in, type(expires_in))
+        # Database ID, set by the repository once the token is stored
+        self.id = None
         self.user = user
         self.access_token: str = access_token
         self.refresh_token: str = refresh_token
         self.expires_in: int = expires_in
+        self._fingerprint = hash((access_token, refresh_token, expires_in))
+
+    def has_data(self, access_token: str, refresh_token: str, expires_in: int) -> bool:
+        """Check whether the token already holds exactly this data.
+
+        The hash of the new data is compared with the stored fingerprint
+        first, so changed data is detected without comparing the long token
+        strings; the fields are only compared when the hashes match.
+
+        Args:
+            access_token (str): Access token for API access to Ponto
+            refresh_token (str): Refresh token for API access to Ponto
+            expires_in (int): Access token expiration time in milliseconds
+
+        Returns:
+            bool: True if all three values equal the token's current data
+        """
+        if hash((access_token, refresh_token, expires_in)) != self._fingerprint:
+            return False
+        return (self.access_token, self.refresh_token, self.expires_in) == (
+            access_token,
+            refresh_token,
+            expires_in,
+        )
 
     def validate(self) -> None:
         """Apply business rules to validate PontoToken data."""
@@ -321,7 +386,7 @@ class PontoToken:
             raise InvalidPontoTokenError("Missing access token")
         if not self.refresh_token:
             raise InvalidPontoTokenError("Missing refresh token")
-        if not self.expires_in or self.expires_in == 0:
+        if not self.expires_in:
             raise PontoTokenExpirationError("Expire time can't be null or zero")
 
     def update(
@@ -362,17 +427,15 @@ class PontoToken:
             )
         """
         # Update fields that are provided (not None)
-        if user is not None:
-            self.user = user
-
-        if access_token is not None:
-            self.access_token = access_token
-
-        if refresh_token is not None:
-            self.refresh_token = refresh_token
-
-        if expires_in is not None:
-            self.expires_in = expires_in
+        for name, value in (
+            ("user", user),
+            ("access_token", access_token),
+            ("refresh_token", refresh_token),
+            ("expires_in", expires_in),
+        ):
+            if value is not None:
+                setattr(self, name, value)
+        self._fingerprint = hash((self.access_token, self.refresh_token, self.expires_in))
 
         # Validate the updated PontoToken
         self.validate()
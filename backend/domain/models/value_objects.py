@@ -29,11 +29,21 @@ Usage:
     # Use with Django models
     choices = UrgencyLevel.choices()  # For model field choices
 """
-from enum import Enum
-from typing import Optional
+from bisect import bisect_right
+from enum import Enum, IntEnum
+from typing import Iterable, NamedTuple, Optional
 
 
-class UrgencyLevel(Enum):
+class UrgencyData(NamedTuple):
+    """Data used to define each UrgencyLevel member."""
+
+    db_value: int
+    color_code: str
+    min_days: Optional[int]
+    max_days: Optional[int]
+
+
+class UrgencyLevel(IntEnum):
     """Value object representing the urgency level of an invoice based on
     its due date.
 
@@ -58,45 +68,33 @@ class UrgencyLevel(Enum):
         level.display_name == "Overdue"  # UI display value
         level.color_code == "#8B0000"    # UI color
         level.day_range == (None, -1)    # Calculation range
+        level == 1                       # IntEnum: equal to its db_value
     """
 
-    OVERDUE = (1, "#8B0000", (None, -1))
-    CRITICAL = (2, "#FF0000", (0, 7))
-    HIGH = (3, "#FFA500", (8, 14))
-    MEDIUM = (4, "#FFD700", (15, 30))
-    LOW = (5, "#008000", (31, None))
-
-    # Type annotation for the value attribute of each enum member
-    # (db_value, color_code, (min_days, max_days))
-    value: tuple[int, str, tuple[Optional[int], Optional[int]]]
-
-    @property
-    def db_value(self) -> int:
-        """Returns the database value associated with this urgency level.
-
-        Returns:
-            int: The database value
-        """
-        return self.value[0]
-
-    @property
-    def color_code(self) -> str:
-        """Returns the hex color code associated with this urgency level.
-
-        Returns:
-            str: The hex color code (e.g., '#FF0000' for red)
-        """
-        return self.value[1]
-
-    @property
-    def day_range(self) -> tuple[Optional[int], Optional[int]]:
-        """Returns the day range tuple for this urgency level.
-
-        Returns:
-            tuple: A tuple of (min_days, max_days) where None represents
-                  no limit
-        """
-        return self.value[2]
+    OVERDUE = UrgencyData(1, "#8B0000", None, -1)
+    CRITICAL = UrgencyData(2, "#FF0000", 0, 7)
+    HIGH = UrgencyData(3, "#FFA500", 8, 14)
+    MEDIUM = UrgencyData(4, "#FFD700", 15, 30)
+    LOW = UrgencyData(5, "#008000", 31, None)
+
+    def __new__(
+        cls, db_value: int, color_code: str, min_days: Optional[int], max_days: Optional[int]
+    ) -> "UrgencyLevel":
+        member = int.__new__(cls, db_value)
+        member._value_ = db_value
+        return member
+
+    def __init__(
+        self, db_value: int, color_code: str, min_days: Optional[int], max_days: Optional[int]
+    ) -> None:
+        # Fixed per member, so stored as plain attributes rather than properties:
+        # db_value: the database value (e.g., 1)
+        # color_code: the hex color code (e.g., "#FF0000" for red)
+        # day_range: (min_days, max_days) where None represents no limit
+        self.db_value: int = db_value
+        self.color_code: str = color_code
+        self.day_range: tuple[Optional[int], Optional[int]] = (min_days, max_days)
+        self._display_name = self.name.replace("_", " ").title()
 
     @property
     def display_name(self) -> str:
@@ -121,7 +119,7 @@ class UrgencyLevel(Enum):
         Returns:
             str: The human-readable display name for this urgency level
         """
-        return self.name.title()  # OVERDUE -> Overdue, PAST_DUE -> "Past Due"
+        return self._display_name  # OVERDUE -> Overdue, PAST_DUE -> "Past Due"
 
     @classmethod
     def choices(cls) -> list[tuple[int, str]]:
@@ -145,7 +143,7 @@ class UrgencyLevel(Enum):
         Returns:
             list[tuple[int, str]]: List of (db_value, display_name) pairs
         """
-        return [(urgency.db_value, urgency.display_name) for urgency in cls]
+        return list(URGENCY_LEVEL_CHOICES)
 
     @classmethod
     def calculate_from_days(cls, days: int) -> "UrgencyLevel":
@@ -168,7 +166,7 @@ class UrgencyLevel(Enum):
             UrgencyLevel: The calculated urgency level
 
         Raises:
-            ValueError: If days is None or not a valid integer
+            TypeError: If days is None or not a number
 
         Examples:
             >>> UrgencyLevel.calculate_from_days(-5)
@@ -178,27 +176,90 @@ class UrgencyLevel(Enum):
             >>> UrgencyLevel.calculate_from_days(40)
             UrgencyLevel.LOW
         """
-        if days < 0:
-            return cls.OVERDUE
-        if 0 <= days <= 7:
-            return cls.CRITICAL
-        if 8 <= days <= 14:
-            return cls.HIGH
-        if 15 <= days <= 30:
-            return cls.MEDIUM
-        if days >= 31:
-            return cls.LOW
-        raise ValueError(f"Invalid days value: {days}")
+        return _URGENCY_BY_DAY[0 if days < 0 else min(days, _URGENCY_LAST_DAY) + 1]
+
+    @classmethod
+    def calculate_from_days_batch(cls, days_list: Iterable[int]) -> list["UrgencyLevel"]:
+        """Calculates urgency levels for many day counts at once.
+
+        Equivalent to calling calculate_from_days for every item, but the
+        lookup table is resolved once for the whole batch, which is what
+        callers classifying a full invoice list should use.
+
+        Args:
+            days_list (Iterable[int]): Days until due for each invoice
+
+        Returns:
+            list[UrgencyLevel]: The calculated urgency levels, in input order
+
+        Examples:
+            >>> UrgencyLevel.calculate_from_days_batch([-5, 3, 40])
+            [UrgencyLevel.OVERDUE, UrgencyLevel.CRITICAL, UrgencyLevel.LOW]
+        """
+        by_day = _URGENCY_BY_DAY
+        last_day = _URGENCY_LAST_DAY
+        return [by_day[0 if days < 0 else min(days, last_day) + 1] for days in days_list]
 
     @classmethod
     def from_db_value(cls, db_value: int) -> "UrgencyLevel":
-        for level in UrgencyLevel:
-            if db_value == level.db_value:
-                return level
-        raise ValueError(f"Invalid urgency db_value: {db_value}")
+        try:
+            return _URGENCY_BY_DB_VALUE[db_value]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid urgency db_value: {db_value}") from None
+
+
+# Lookup table for UrgencyLevel.calculate_from_days. The lower day bound of
+# every level after OVERDUE, e.g. (0, 8, 15, 31), is used once here to expand
+# the levels into one entry per day: index 0 is OVERDUE (any negative day
+# count), index d + 1 is the level for d days, and the last entry covers
+# every day count from the LOW lower bound upwards.
+_URGENCY_LEVELS = tuple(UrgencyLevel)
+_URGENCY_THRESHOLDS = tuple(level.day_range[0] for level in _URGENCY_LEVELS[1:])
+_URGENCY_LAST_DAY = _URGENCY_THRESHOLDS[-1]
+_URGENCY_BY_DAY = tuple(
+    _URGENCY_LEVELS[bisect_right(_URGENCY_THRESHOLDS, days)] for days in range(-1, _URGENCY_LAST_DAY + 1)
+)
+
+# Lookup table for UrgencyLevel.from_db_value
+_URGENCY_BY_DB_VALUE = {level.db_value: level for level in UrgencyLevel}
+
+# Frozen (db_value, display_name) pairs; UrgencyLevel.choices() returns a list copy
+URGENCY_LEVEL_CHOICES = tuple((level.db_value, level.display_name) for level in UrgencyLevel)
+
+# (db_value, color_code, display_name) per entry of _URGENCY_BY_DAY
+_URGENCY_INFO_BY_DAY = tuple(
+    (level.db_value, level.color_code, level.display_name) for level in _URGENCY_BY_DAY
+)
+
+
+def urgency_info_from_days(days: int) -> tuple[int, str, str]:
+    """Returns the presentation data for the urgency of an invoice due in `days`.
 
+    Shortcut for rendering loops that only need the values of
+    UrgencyLevel.calculate_from_days(days) rather than the enum member.
 
-class InvoiceStatus(Enum):
+    Args:
+        days (int): Number of days until due date (negative when overdue)
+
+    Returns:
+        tuple[int, str, str]: The level's (db_value, color_code, display_name)
+
+    Examples:
+        >>> urgency_info_from_days(3)
+        (2, '#FF0000', 'Critical')
+    """
+    return _URGENCY_INFO_BY_DAY[0 if days < 0 else min(days, _URGENCY_LAST_DAY) + 1]
+
+
+# Human-readable labels for each InvoiceStatus database value
+_STATUS_DISPLAY_NAMES = {
+    "pending": "Pending Payment",
+    "paid": "Payment Received",
+    "overdue": "Payment Overdue",
+}
+
+
+class InvoiceStatus(str, Enum):
     """Value object representing the payment status of an invoice.
 
     Provides status values and display names for invoice payment states.
@@ -214,50 +275,34 @@ class InvoiceStatus(Enum):
         status.name == "PENDING"           # Enum member name
         status.value == "pending"          # Database value
         status.display_name == "Pending Payment"  # UI display value
+        status == "pending"                # str subclass: equal to its value
     """
 
     PENDING = "pending"
     PAID = "paid"
     OVERDUE = "overdue"
 
-    value: str  # This indicates each enum member has a string value
+    def __init__(self, value: str) -> None:
+        # Resolve the display name once per member instead of on every access
+        self._display_name = _STATUS_DISPLAY_NAMES.get(value, f"Unknown Status: {value}")
 
     @property
     def display_name(self) -> str:
         """Returns a human-readable display name for the invoice status.
 
-        Uses a dictionary mapping to convert the enum's value (e.g., "pending")
-        to its display form (e.g., "Pending Payment").
-
-        The mapping is:
+        Maps the enum's value (e.g., "pending") to its display form
+        (e.g., "Pending Payment") using _STATUS_DISPLAY_NAMES:
             "pending" -> "Pending Payment"
             "paid" -> "Payment Received"
             "overdue" -> "Payment Overdue"
 
-        Technical Implementation:
-        This property uses Python's dictionary lookup syntax (dict[key]) to map
-        the enum's value to its display name. For example:
-        - If self.value is "pending", dict["pending"] returns "Pending Payment"
-        - If self.value is "paid", dict["paid"] returns "Payment Received"
-        - If self.value is "overdue", dict["overdue"] returns "Payment Overdue"
-
-        This is equivalent to writing:
-            mapping = {
-                'pending': 'Pending Payment',
-                'paid': 'Payment Received',
-                'overdue': 'Payment Overdue'
-            }
-            return mapping[self.value]
+        The name is looked up once when the enum member is created, so
+        accessing this property is a plain attribute read.
 
         Returns:
             str: The human-readable display name for this status
         """
-        status_display_names = {
-            "pending": "Pending Payment",
-            "paid": "Payment Received",
-            "overdue": "Payment Overdue",
-        }
-        return status_display_names.get(self.value, f"Unknown Status: {self.value}")
+        return self._display_name
 
     @classmethod
     def choices(cls) -> list[tuple[str, str]]:
@@ -279,11 +324,18 @@ class InvoiceStatus(Enum):
         Returns:
             list[tuple[str, str]]: List of (value, display_name) pairs
         """
-        return [(status.value, status.display_name) for status in cls]
+        return list(INVOICE_STATUS_CHOICES)
 
     @classmethod
     def from_db_value(cls, db_value: str) -> "InvoiceStatus":
-        for status in InvoiceStatus:
-            if db_value == status.value:
-                return status
-        raise ValueError(f"Invalid status db_value: {db_value}")
+        try:
+            return _STATUS_BY_DB_VALUE[db_value]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid status db_value: {db_value}") from None
+
+
+# Lookup table for InvoiceStatus.from_db_value
+_STATUS_BY_DB_VALUE = {status.value: status for status in InvoiceStatus}
+
+# Frozen (value, display_name) pairs; InvoiceStatus.choices() returns a list copy
+INVOICE_STATUS_CHOICES = tuple((status.value, status.display_name) for status in InvoiceStatus)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
 from domain.models.account import Account
 
 
@@ -9,24 +9,60 @@ class AccountRepository(ABC):
     @abstractmethod
     def find_by_id(self, id: int) -> Optional[Account]:
         """Find account by ID."""
-        pass
 
     @abstractmethod
     def find_by_username(self, username: str) -> Optional[Account]:
         """Find account by username."""
-        pass
 
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[Account]:
         """Find account by email."""
-        pass
+
+    @abstractmethod
+    def find_by_email_or_username(
+        self, email: str, username: str
+    ) -> Tuple[Optional[Account], Optional[Account]]:
+        """Find the accounts matching an email or a username in one lookup.
+
+        Returns a (by email, by username) pair; either side is None when
+        nothing matches, and both may be the same account.
+        """
 
     @abstractmethod
     def save(self, account: Account) -> Account:
         """Save account (create or update)."""
-        pass
 
     @abstractmethod
     def authenticate(self, username: str, password: str) -> Optional[Account]:
         """Authenticate user with username/email and password."""
-        pass
+
+    @abstractmethod
+    def authenticate_by_identifier(self, identifier: str, password: str) -> Tuple[Optional[Account], str]:
+        """Authenticate user with username or email and password in one lookup.
+
+        Identifiers containing "@" are matched against the email, others
+        against the username. The password is verified against the fetched
+        row, without a second query.
+
+        Returns:
+            Tuple containing:
+            - Optional[Account]: The account if authenticated, None otherwise
+            - str: Failure reason ("not_found", "inactive" or
+              "invalid_credentials"), empty string on success
+        """
+
+    @abstractmethod
+    def authenticate_by_email(self, email: str, password: str) -> Tuple[Optional[Account], str]:
+        """Authenticate user with email and password in one lookup.
+
+        Same result as authenticate_by_identifier, for callers that already
+        know the identifier is an email.
+        """
+
+    @abstractmethod
+    def authenticate_by_username(self, username: str, password: str) -> Tuple[Optional[Account], str]:
+        """Authenticate user with username and password in one lookup.
+
+        Same result as authenticate_by_identifier, for callers that already
+        know the identifier is a username.
+        """
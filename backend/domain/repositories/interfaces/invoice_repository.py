@@ -21,7 +21,7 @@ Example:
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from datetime import date
 from domain.models.invoice import Invoice
 from domain.models.value_objects import UrgencyLevel
@@ -56,6 +56,10 @@ class InvoiceRepository(ABC):
         based on the invoice number. It should handle the persistence details
         while maintaining the domain model's integrity.
 
+        Business rules are enforced by the domain model, which validates an
+        invoice when it is created or updated. Implementations should not
+        validate it again (e.g. with Django's full_clean()) before saving.
+
         Args:
             invoice (Invoice): The domain invoice model to persist
             user_id (int): ID of the user who uploaded/created the invoice
@@ -69,6 +73,48 @@ class InvoiceRepository(ABC):
             RepositoryError: If there's a persistence-related error
         """
 
+    @abstractmethod
+    def bulk_save(self, invoices: List[Invoice], user_id: int) -> List[Invoice]:
+        """Save several new invoices to the database in a single batch.
+
+        Implementations should insert all invoices with one statement (or as
+        few batches as the backend allows) instead of one query per invoice.
+        As with save, the invoices are already validated by the domain model.
+
+        Args:
+            invoices (List[Invoice]): The domain invoice models to persist
+            user_id (int): ID of the user who uploaded/created the invoices
+
+        Returns:
+            List[Invoice]: The persisted domain invoice models, in the same
+                          order as invoices
+
+        Raises:
+            InvalidInvoiceError: If any of the invoice data is invalid
+            RepositoryError: If there's a persistence-related error
+        """
+
+    @abstractmethod
+    def save_many(self, invoices: List[Invoice], user_id: Optional[int] = None) -> List[Invoice]:
+        """Save a mix of new and existing invoices with one query per kind.
+
+        Invoices without an ID are inserted in bulk; invoices with an ID
+        update their rows with a single bulk update of the fields document
+        processing changes (amount, due date, status and file metadata).
+
+        Args:
+            invoices (List[Invoice]): The domain invoice models to persist
+            user_id (int, optional): Owner for new invoices that have no
+                uploaded_by set
+
+        Returns:
+            List[Invoice]: The persisted domain invoice models, in the same
+                          order as invoices
+
+        Raises:
+            RepositoryError: If there's a persistence-related error
+        """
+
     @abstractmethod
     def get_by_id(self, invoice_id: int) -> Optional[Invoice]:
         """Retrieve an invoice by its ID.
@@ -84,6 +130,26 @@ class InvoiceRepository(ABC):
             RepositoryError: If there's a persistence-related error
         """
 
+    @abstractmethod
+    def bulk_get_by_ids(self, invoice_ids: Iterable[int]) -> List[Invoice]:
+        """Retrieve several invoices by their IDs in a single query.
+
+        Callers that need many invoices at once should use this instead of
+        calling get_by_id in a loop, so the lookup costs one round-trip
+        (e.g. ``WHERE id IN (...)``) rather than one query per ID.
+
+        Args:
+            invoice_ids (Iterable[int]): The unique identifiers of the invoices
+
+        Returns:
+            List[Invoice]: The domain invoice models found, in the order of
+                          invoice_ids. IDs without a matching invoice are
+                          skipped.
+
+        Raises:
+            RepositoryError: If there's a persistence-related error
+        """
+
     @abstractmethod
     def get_by_number(self, invoice_number: str) -> Optional[Invoice]:
         """Retrieve an invoice by its number.
@@ -99,6 +165,45 @@ class InvoiceRepository(ABC):
             RepositoryError: If there's a persistence-related error
         """
 
+    @abstractmethod
+    def get_by_numbers(self, invoice_numbers: Iterable[str]) -> Dict[str, Invoice]:
+        """Retrieve several invoices by their numbers in a single query.
+
+        Batch counterpart of get_by_number: when several invoices share a
+        number, the most recently created one is returned.
+
+        Args:
+            invoice_numbers (Iterable[str]): The business-specific invoice
+                numbers
+
+        Returns:
+            Dict[str, Invoice]: The domain invoice models keyed by invoice
+                number. Numbers without a matching invoice are omitted.
+
+        Raises:
+            RepositoryError: If there's a persistence-related error
+        """
+
+    @abstractmethod
+    def get_by_content_hash(self, content_hash: str, user_id: int) -> Optional[Invoice]:
+        """Retrieve an invoice a user uploaded by the hash of its file.
+
+        Used to recognize a re-upload of the exact same file before it is
+        parsed again. When several invoices match, the most recently created
+        one is returned.
+
+        Args:
+            content_hash (str): SHA-256 hex digest of the file content
+            user_id (int): ID of the user who uploaded the file
+
+        Returns:
+            Optional[Invoice]: The domain invoice model if found,
+                             None otherwise
+
+        Raises:
+            RepositoryError: If there's a persistence-related error
+        """
+
     @abstractmethod
     def list_by_status(self, status: str) -> List[Invoice]:
         """List all invoices with a given status.
@@ -148,6 +253,41 @@ class InvoiceRepository(ABC):
             RepositoryError: If there's a persistence-related error
         """
 
+    @abstractmethod
+    def bulk_update_status(self, invoice_ids: List[int], status: str) -> int:
+        """Update the status of several invoices with a single query.
+
+        Args:
+            invoice_ids (List[int]): The unique identifiers of the invoices
+            status (str): The new status value
+
+        Returns:
+            int: Number of invoices that were updated
+
+        Raises:
+            InvalidStatusError: If the status value is invalid
+            RepositoryError: If there's a persistence-related error
+        """
+
+    @abstractmethod
+    def bulk_mark_overdue(self, as_of: Optional[date] = None) -> int:
+        """Mark every pending invoice past its due date as overdue.
+
+        Implementations should apply this as a single set-based update
+        (e.g. ``UPDATE ... WHERE status = 'pending' AND due_date < ...``)
+        rather than loading and saving invoices one by one.
+
+        Args:
+            as_of (date, optional): The date to check against. Defaults to
+                                  today.
+
+        Returns:
+            int: Number of invoices that were marked as overdue
+
+        Raises:
+            RepositoryError: If there's a persistence-related error
+        """
+
     @abstractmethod
     def update(self, invoice: Invoice, user_id: int) -> Invoice:
         """Update an existing invoice.
@@ -23,11 +23,40 @@ Example:
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Tuple
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional, Dict, Any, Iterable, List, Mapping, Sequence, Tuple, TypedDict, Union
 
 from domain.models.ponto import IbanityAccount, PontoToken
 
 
+class IbanityAccountUpdate(TypedDict, total=False):
+    """Account data accepted by the IbanityAccount create/update methods.
+
+    Balances and the expiration may still be the raw strings returned by the
+    Ponto API; the repository converts them when storing.
+    """
+
+    description: str
+    product: str
+    reference: str
+    currency: str
+    authorization_expiration_expected_at: Union[datetime, str]
+    current_balance: Union[Decimal, str]
+    available_balance: Union[Decimal, str]
+    subtype: str
+    holder_name: str
+    resource_id: str
+
+
+class PontoTokenUpdate(TypedDict, total=False):
+    """Token data accepted by the PontoToken create/update methods."""
+
+    access_token: str
+    refresh_token: str
+    expires_in: int
+
+
 class IbanityAccountRepository(ABC):
     """Interface defining Ibanity account data access operations.
 
@@ -74,24 +103,68 @@ class IbanityAccountRepository(ABC):
         """
 
     @abstractmethod
-    def get_or_create(self, user, account_id: str, data: Dict[str, Any]) -> Tuple[IbanityAccount, bool]:
-        """Get an existing account or create a new one.
+    def bulk_save(self, ibanity_accounts: Sequence[IbanityAccount]) -> List[IbanityAccount]:
+        """Save several Ibanity accounts to the database in batches.
+
+        Accounts are matched on their Ponto account_id: new ones are
+        inserted and existing ones are overwritten. Implementations must
+        batch the writes (e.g. one multi-row INSERT ... ON CONFLICT per batch)
+        instead of issuing one statement per account.
+
+        Args:
+            ibanity_accounts (Sequence[IbanityAccount]): The domain Ibanity
+                account models to persist
+
+        Returns:
+            List[IbanityAccount]: The persisted domain IbanityAccount models,
+                in the same order as ibanity_accounts
+
+        Raises:
+            InvalidIbanityAccountError: If any IbanityAccount data is invalid
+            RepositoryError: If there's a persistence-related error
+        """
+
+    @abstractmethod
+    def get_or_create(
+        self, user, account_id: str, defaults: IbanityAccountUpdate
+    ) -> Tuple[IbanityAccount, bool, bool]:
+        """Get an existing account, creating or updating it from defaults.
+
+        A new account is created from defaults. An existing account is
+        updated with defaults only when at least one value differs, so an
+        unchanged account costs a single lookup.
 
         Args:
             user: The user who owns the account
             account_id: The Ponto account ID
-            data: The account data
+            defaults: The account data
 
         Returns:
-            Tuple[IbanityAccount, bool]: The account and whether it was created
+            Tuple[IbanityAccount, bool, bool]: The account, whether it was
+                created and whether an existing account was updated
         """
 
     @abstractmethod
-    def get_by_id(self, ibanity_account_id: int) -> Optional[IbanityAccount]:
+    def get_by_id(
+        self,
+        ibanity_account_id: int,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[IbanityAccount]:
         """Retrieve an IbanityAccount by id.
 
         Args:
             ibanity_account_id (int): IbanityAccount Model Id
+            select_related (Tuple[str, ...]): Extra relations to join in the
+                same query, e.g. ("user",)
+            prefetch_related (Tuple[str, ...]): Extra relations to load in
+                one additional query each instead of lazily per access
+            fields (Optional[Sequence[str]]): Columns to load, e.g.
+                ("account_id", "current_balance"); the rest are left unset.
+                None loads the full row. When combining with
+                prefetch_related, include the foreign key the prefetch
+                joins on (e.g. "user_id"), or it is fetched row by row.
 
         Returns:
             Optional[IbanityAccount]: The domain IbanityAccount model if found,
@@ -102,11 +175,26 @@ class IbanityAccountRepository(ABC):
         """
 
     @abstractmethod
-    def get_by_user(self, user) -> IbanityAccount:
+    def get_by_user(
+        self,
+        user,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+        fields: Optional[Sequence[str]] = None,
+    ) -> IbanityAccount:
         """Get an account by user.
 
         Args:
             user: The user who owns the account
+            select_related (Tuple[str, ...]): Extra relations to join in the
+                same query, e.g. ("user",)
+            prefetch_related (Tuple[str, ...]): Extra relations to load in
+                one additional query each instead of lazily per access
+            fields (Optional[Sequence[str]]): Columns to load, e.g.
+                ("account_id", "current_balance"); the rest are left unset.
+                None loads the full row. When combining with
+                prefetch_related, include the foreign key the prefetch
+                joins on (e.g. "user_id"), or it is fetched row by row.
 
         Returns:
             IbanityAccount: The account data
@@ -116,11 +204,41 @@ class IbanityAccountRepository(ABC):
         """
 
     @abstractmethod
-    def get_by_account_id(self, account_id: str) -> Optional[IbanityAccount]:
+    def get_by_users(self, users: Iterable) -> Dict[int, IbanityAccount]:
+        """Get the accounts of several users with a single query.
+
+        Use this instead of calling get_by_user in a loop when resolving
+        accounts for a batch of users.
+
+        Args:
+            users: The users who own the accounts
+
+        Returns:
+            Dict[int, IbanityAccount]: The most recent account of each user,
+                keyed by user id. Users without an account are omitted.
+        """
+
+    @abstractmethod
+    def get_by_account_id(
+        self,
+        account_id: str,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[IbanityAccount]:
         """Retrieve an IbanityAccount by Ibanity account id.
 
         Args:
             account_id (str): The Ponto-Connect account id.
+            select_related (Tuple[str, ...]): Extra relations to join in the
+                same query, e.g. ("user",)
+            prefetch_related (Tuple[str, ...]): Extra relations to load in
+                one additional query each instead of lazily per access
+            fields (Optional[Sequence[str]]): Columns to load, e.g.
+                ("account_id", "current_balance"); the rest are left unset.
+                None loads the full row. When combining with
+                prefetch_related, include the foreign key the prefetch
+                joins on (e.g. "user_id"), or it is fetched row by row.
 
         Returns:
             Optional[IbanityAccount]: The domain IbanityAccount model if found,
@@ -152,7 +270,7 @@ class IbanityAccountRepository(ABC):
         """
 
     @abstractmethod
-    def update_by_account_id(self, account_id: str, data: Dict[str, Any]) -> IbanityAccount:
+    def update_by_account_id(self, account_id: str, data: IbanityAccountUpdate) -> IbanityAccount:
         """Update an existing IbanityAccount.
 
         This method should update all fields of an existing IbanityAccount
@@ -160,7 +278,7 @@ class IbanityAccountRepository(ABC):
 
         Args:
             account_id (str): The IbanityAccount account_id
-            data (dict): New data or replace data
+            data (IbanityAccountUpdate): New data or replace data
                 - 'description': Description of IbanityAccount
                 - 'product': Product
                 - 'reference': Reference
@@ -182,6 +300,25 @@ class IbanityAccountRepository(ABC):
             RepositoryError: If there's a persistence-related error
         """
 
+    @abstractmethod
+    def bulk_update_by_account_id(
+        self, updates: Mapping[str, IbanityAccountUpdate]
+    ) -> List[IbanityAccount]:
+        """Update several existing IbanityAccounts in batches.
+
+        Args:
+            updates (Mapping[str, IbanityAccountUpdate]): New data keyed by IbanityAccount
+                account_id, with the same keys as update_by_account_id
+
+        Returns:
+            List[IbanityAccount]: The updated domain IbanityAccount models.
+                Account IDs without a matching IbanityAccount are skipped.
+
+        Raises:
+            InvalidIbanityAccountError: If any IbanityAccount data is invalid
+            RepositoryError: If there's a persistence-related error
+        """
+
     @abstractmethod
     def process_accounts_data(self, user, accounts_data: Dict[str, Any]) -> IbanityAccount:
         """Process raw accounts data from Ponto API and save or update
@@ -243,11 +380,20 @@ class PontoTokenRepository(ABC):
         """
 
     @abstractmethod
-    def get_by_id(self, ponto_token_id: int) -> Optional[PontoToken]:
+    def get_by_id(
+        self,
+        ponto_token_id: int,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+    ) -> Optional[PontoToken]:
         """Retrieve an PontoToken by id.
 
         Args:
             ponto_token_id (int): The PontoToken Model Id
+            select_related (Tuple[str, ...]): Extra relations to join in the
+                same query, e.g. ("user",)
+            prefetch_related (Tuple[str, ...]): Extra relations to load in
+                one additional query each instead of lazily per access
 
         Returns:
             Optional[PontoToken]: The domain PontoToken model if found,
@@ -258,23 +404,36 @@ class PontoTokenRepository(ABC):
         """
 
     @abstractmethod
-    def get_or_create_by_user(self, user, data: Dict[str, Any]) -> Tuple[PontoToken, bool]:
-        """Get an existing token or create a new one.
+    def get_or_create_by_user(self, user, defaults: PontoTokenUpdate) -> Tuple[PontoToken, bool, bool]:
+        """Get an existing token, creating or updating it from defaults.
+
+        A new token is created from defaults. An existing token is updated
+        with defaults only when at least one value differs.
 
         Args:
             user: The user who owns the token
-            data: The token data
+            defaults: The token data
 
         Returns:
-            Tuple[PontoToken, bool]: The token and whether it was created
+            Tuple[PontoToken, bool, bool]: The token, whether it was created
+                and whether an existing token was updated
         """
 
     @abstractmethod
-    def get_by_user(self, user) -> PontoToken:
+    def get_by_user(
+        self,
+        user,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+    ) -> PontoToken:
         """Get a token by user.
 
         Args:
             user: The user who owns the token
+            select_related (Tuple[str, ...]): Extra relations to join in the
+                same query, e.g. ("user",)
+            prefetch_related (Tuple[str, ...]): Extra relations to load in
+                one additional query each instead of lazily per access
 
         Returns:
             PontoToken: The token data
@@ -284,7 +443,22 @@ class PontoTokenRepository(ABC):
         """
 
     @abstractmethod
-    def update_by_user(self, user, data: Dict[str, Any]) -> PontoToken:
+    def get_by_users(self, users: Iterable) -> Dict[int, PontoToken]:
+        """Get the tokens of several users with a single query.
+
+        Use this instead of calling get_by_user in a loop, e.g. when
+        refreshing the tokens of a batch of users.
+
+        Args:
+            users: The users who own the tokens
+
+        Returns:
+            Dict[int, PontoToken]: The token of each user, keyed by user id.
+                Users without a token are omitted.
+        """
+
+    @abstractmethod
+    def update_by_user(self, user, data: PontoTokenUpdate) -> PontoToken:
         """Update a token by user.
 
         Args:
@@ -309,3 +483,77 @@ class PontoTokenRepository(ABC):
             PontoTokenNotFoundError: If no token exists for the user
             PontoTokenDecryptionError: If there's an error decrypting the token
         """
+
+    @abstractmethod
+    def invalidate_cache(self, user) -> None:
+        """Drop any cached copy of a user's token.
+
+        Implementations may cache the result of get_decrypted_access_token;
+        they must call this whenever the stored token of the user changes
+        (save, update_by_user) so stale tokens are not served.
+
+        Args:
+            user: The user whose token changed
+        """
+
+
+class AsyncPontoTokenRepository(ABC):
+    """Async interface for the Ponto token operations on the refresh path.
+
+    Token refreshes for many users are I/O bound (DB read, Ponto HTTP call,
+    DB write). Implementations of this interface let callers overlap them on
+    one event loop, e.g. with asyncio.gather bounded by a Semaphore matching
+    the Ponto rate limit, instead of serializing them or using a thread pool.
+    """
+
+    @abstractmethod
+    async def aget_by_user(
+        self,
+        user,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+    ) -> PontoToken:
+        """Get a token by user.
+
+        Args:
+            user: The user who owns the token
+            select_related (Tuple[str, ...]): Extra relations to join
+            prefetch_related (Tuple[str, ...]): Extra relations to prefetch
+
+        Returns:
+            PontoToken: The token data
+
+        Raises:
+            PontoTokenNotFoundError: If no token exists for the user
+        """
+
+    @abstractmethod
+    async def aupdate_by_user(self, user, data: PontoTokenUpdate) -> PontoToken:
+        """Update a token by user.
+
+        Args:
+            user: The user who owns the token
+            data: The updated token data (access_token, refresh_token,
+                expires_in)
+
+        Returns:
+            PontoToken: The updated token
+
+        Raises:
+            PontoTokenNotFoundError: If no token exists for the user
+        """
+
+    @abstractmethod
+    async def aget_decrypted_access_token(self, user) -> str:
+        """Get decrypted access token for a user.
+
+        Args:
+            user: The user to get the decrypted access token for
+
+        Returns:
+            str: The decrypted access token
+
+        Raises:
+            PontoTokenNotFoundError: If no token exists for the user
+            PontoTokenDecryptionError: If there's an error decrypting the token
+        """
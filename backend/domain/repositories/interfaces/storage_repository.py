@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, Iterable, List, Optional, Tuple
 from pathlib import Path
 
 
@@ -17,14 +17,28 @@ class StorageRepository(ABC):
     """
 
     @abstractmethod
-    def save_file(self, file: BinaryIO, identifier: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+    def save_file(
+        self,
+        file: BinaryIO,
+        identifier: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        size_hint: Optional[int] = None,
+        content_type: Optional[str] = None,
+    ) -> str:
         """
         Save a file to storage and return its path/identifier.
 
+        Implementations must stream the file in chunks (of at most 8 MiB)
+        rather than reading it into memory in one go, so memory use stays
+        bounded regardless of the file size.
+
         Args:
             file: The file object to store
             identifier: Unique identifier for the file (e.g., 'invoice_123')
             metadata: Optional metadata to associate with the file
+            size_hint: Optional size of the file in bytes, if known upfront;
+                lets backends pick a single-request or multipart upload
+            content_type: Optional MIME type of the file
 
         Returns:
             str: Storage path or identifier for future retrieval
@@ -32,7 +46,24 @@ class StorageRepository(ABC):
         Raises:
             StorageError: If file cannot be saved
         """
-        pass
+
+    @abstractmethod
+    def save_files(self, items: Iterable[Tuple[BinaryIO, str]]) -> List[str]:
+        """
+        Save several files to storage in one call.
+
+        Backends should use whatever batching they support (e.g. concurrent
+        uploads for cloud storage) rather than storing files one at a time.
+
+        Args:
+            items: (file, identifier) pairs, as accepted by save_file
+
+        Returns:
+            List[str]: Storage paths or identifiers, in the same order as items
+
+        Raises:
+            StorageError: If any file cannot be saved
+        """
 
     @abstractmethod
     def get_file_path(self, file_path) -> Path:
@@ -48,7 +79,25 @@ class StorageRepository(ABC):
         Raises:
             StorageError: If file cannot be found
         """
-        pass
+
+    @abstractmethod
+    def get_file_stream(self, identifier: str) -> BinaryIO:
+        """
+        Open a stored file for reading.
+
+        Unlike get_file_path, cloud backends can hand back the response body
+        directly instead of downloading the file to local disk first. The
+        caller is responsible for closing the returned stream.
+
+        Args:
+            identifier: The storage identifier returned by save_file
+
+        Returns:
+            BinaryIO: A readable binary stream of the file contents
+
+        Raises:
+            StorageError: If file cannot be found or opened
+        """
 
     @abstractmethod
     def delete_file(self, identifier: str) -> None:
@@ -61,7 +110,19 @@ class StorageRepository(ABC):
         Raises:
             StorageError: If file cannot be deleted
         """
-        pass
+
+    @abstractmethod
+    def delete_files(self, identifiers: Iterable[str]) -> List[str]:
+        """
+        Delete several stored files, using bulk deletes where the backend
+        supports them (e.g. S3 DeleteObjects, up to 1000 keys per request).
+
+        Args:
+            identifiers: Storage identifiers returned by save_file
+
+        Returns:
+            List[str]: The identifiers that could not be deleted
+        """
 
     @abstractmethod
     def move_file(self, source_identifier: str, target_identifier: str) -> str:
@@ -82,6 +143,8 @@ class StorageRepository(ABC):
         - Implementation note: Some storage systems may not support true atomic moves across
           different volumes or storage types. In these cases, implementers should document
           any limitations and potential race conditions.
+        - Fallback: Backends without a native move may implement it as copy_file followed
+          by delete_file.
 
         Args:
             source_identifier: The identifier of the source file
@@ -93,4 +156,23 @@ class StorageRepository(ABC):
         Raises:
             StorageError: If file cannot be moved
         """
-        pass
+
+    @abstractmethod
+    def copy_file(self, source_identifier: str, target_identifier: str) -> str:
+        """
+        Copy a file to another location within the storage system, keeping the source.
+
+        Cloud backends must use a server-side copy (e.g. S3 CopyObject) so the
+        file contents never travel through the application. The copy must be
+        independent of the source: changing or deleting one never affects the other.
+
+        Args:
+            source_identifier: The identifier of the source file
+            target_identifier: The identifier to use for the copy
+
+        Returns:
+            str: Storage identifier of the copy
+
+        Raises:
+            StorageError: If file cannot be copied
+        """
@@ -30,12 +30,11 @@ class AuthenticationService:
             - Optional[Account]: Created account if successful, None otherwise
             - str: Error message if unsuccessful, empty string otherwise
         """
-        # Check if email already exists
-        if self.account_repository.find_by_email(email):
+        # Check if email or username already exists
+        by_email, by_username = self.account_repository.find_by_email_or_username(email, username)
+        if by_email:
             return False, None, "Email already exists"
-
-        # Check if username already exists
-        if self.account_repository.find_by_username(username):
+        if by_username:
             return False, None, "Username already exists"
 
         # Create new account
@@ -55,32 +54,39 @@ class AuthenticationService:
             return False, None, "An unexpected error occurred. Please try again later."
 
     def login(self, identifier: str, password: str) -> Tuple[bool, Optional[Account], str]:
-        """Authenticate a user with identifier (username or email) and password."""
-        is_email = "@" in identifier
-
-        # Find account by identifier
-        account = (
-            self.account_repository.find_by_email(identifier)
-            if is_email
-            else self.account_repository.find_by_username(identifier)
-        )
+        """Authenticate a user with identifier (username or email) and password.
 
-        if not account:
-            return (
-                False,
-                None,
-                f"Account with this {'email' if is_email else 'username'} does not exist",
-            )
+        Dispatches to login_by_email or login_by_username; callers that know
+        which kind of identifier they hold should call those directly.
+        """
+        if "@" in identifier:
+            return self.login_by_email(identifier, password)
+        return self.login_by_username(identifier, password)
+
+    def login_by_email(self, email: str, password: str) -> Tuple[bool, Optional[Account], str]:
+        """Authenticate a user with email and password."""
+        account, reason = self.account_repository.authenticate_by_email(email, password)
+        return self._login_result(account, reason, "email")
+
+    def login_by_username(self, username: str, password: str) -> Tuple[bool, Optional[Account], str]:
+        """Authenticate a user with username and password."""
+        account, reason = self.account_repository.authenticate_by_username(username, password)
+        return self._login_result(account, reason, "username")
+
+    def _login_result(
+        self, account: Optional[Account], reason: str, identifier_kind: str
+    ) -> Tuple[bool, Optional[Account], str]:
+        """Translate a repository authentication result into the login result."""
+        if reason == "not_found":
+            return False, None, f"Account with this {identifier_kind} does not exist"
 
-        if not account.is_valid_for_authentication():
+        if reason == "inactive":
             return False, None, "Account is not active"
 
-        authenticated_account = self.account_repository.authenticate(account.username, password)
-
-        if not authenticated_account:
+        if not account:
             return False, None, "Invalid credentials"
 
-        return True, authenticated_account, ""
+        return True, account, ""
 
     def logout(self, account_id: int) -> bool:
         """Log out a user."""
@@ -13,16 +13,35 @@ post-MVP to better adhere to clean architecture principles.
 The current implementation was kept due to time constraints for the MVP release.
 """
 
+from datetime import date
 from typing import Dict, Any, List, Optional
-from domain.models.invoice import Invoice
-from domain.models.value_objects import InvoiceStatus
-from infrastructure.django.models.invoice import Invoice as DjangoInvoice  # Import the Django model
+from django.utils import timezone
+from domain.models.invoice import Invoice, InvoiceExtract
+from domain.models.value_objects import InvoiceStatus, UrgencyLevel
+from domain.repositories.interfaces.invoice_repository import InvoiceRepository
+
+# API presentation of each urgency level, built once; get_urgency_info adds is_manual
+_URGENCY_INFO = {
+    level: {"level": level.name, "display_name": level.display_name, "color_code": level.color_code}
+    for level in UrgencyLevel
+}
+_NO_URGENCY_INFO = {"level": None, "display_name": None, "color_code": None}
 
 
 class InvoiceService:
     """Domain service that implements business logic for invoice operations."""
 
-    def update(self, invoice: Invoice, extracted_data: Dict[str, Any]) -> Invoice:
+    def __init__(self, invoice_repository: Optional[InvoiceRepository] = None) -> None:
+        """Initialize the service.
+
+        Args:
+            invoice_repository: Repository used to look up existing invoices
+                by number (optional; without one, every processed invoice
+                is treated as new)
+        """
+        self.invoice_repository = invoice_repository
+
+    def update(self, invoice: Invoice, extract: InvoiceExtract) -> Invoice:
         """Update an invoice with data extracted from a document.
 
         This method applies business rules for updating an existing invoice
@@ -30,7 +49,7 @@ class InvoiceService:
 
         Args:
             invoice: The invoice to update
-            extracted_data: Data dictionary with extracted invoice information
+            extract: The invoice fields extracted from the document
 
         Returns:
             The updated invoice
@@ -40,35 +59,27 @@ class InvoiceService:
         """
         # Delegate to the domain model's update method
 
-        invoice.update(total_amount=extracted_data["total_amount"], due_date=extracted_data["due_date"])
+        invoice.update(total_amount=extract.total_amount, due_date=extract.due_date)
 
         return invoice
 
-    def create(self, extracted_data: Dict[str, Any]) -> Invoice:
+    def create(self, extract: InvoiceExtract) -> Invoice:
         """Create a new invoice from extracted document data.
 
         This method applies business rules for creating a new invoice
-        from extracted data, ensuring all required fields are present
-        and valid.
+        from extracted data, ensuring all fields are valid.
 
         Args:
-            extracted_data: Data dictionary with extracted invoice information
+            extract: The invoice fields extracted from the document
 
         Returns:
             A new Invoice instance
 
         Raises:
-            ValueError: If the extracted data is missing required fields
+            InvalidInvoiceError: If the extracted data is invalid
         """
-        # Remove any non-domain fields
-        extracted_data.pop("file_path", None)
-
         # Use the factory method to create and validate the invoice
-        return Invoice.create(
-            total_amount=extracted_data["total_amount"],
-            due_date=extracted_data["due_date"],
-            invoice_number=extracted_data["invoice_number"],
-        )
+        return Invoice.from_extract(extract)
 
     def update_statuses(self, invoices: List[Invoice]) -> None:
         """Recalculate status for a collection of invoices.
@@ -79,10 +90,26 @@ class InvoiceService:
         Args:
             invoices: List of invoices to update
         """
+        # Resolve today once instead of once per invoice
+        today = timezone.localdate()
         for invoice in invoices:
             # Using the domain model's built-in methods to update status
-            if invoice.status == InvoiceStatus.PENDING and invoice.is_overdue():
-                invoice.mark_as_overdue()
+            invoice.mark_as_overdue(today)
+
+    def mark_overdue(self, invoice_repository: InvoiceRepository, as_of: Optional[date] = None) -> int:
+        """Mark all stored pending invoices past their due date as overdue.
+
+        Unlike update_statuses, which only updates the given in-memory
+        invoices, this persists the change with a single bulk update.
+
+        Args:
+            invoice_repository: Repository holding the invoices
+            as_of: The date to check against. Defaults to today.
+
+        Returns:
+            Number of invoices marked as overdue
+        """
+        return invoice_repository.bulk_mark_overdue(as_of)
 
     def _calculate_status(self, invoice: Invoice, current_date) -> InvoiceStatus:
         """Determine the status of an invoice based on business rules.
@@ -125,27 +152,26 @@ class InvoiceService:
 
         # Return a dictionary with all relevant information
         return {
-            "level": urgency_level.name if urgency_level else None,
-            "display_name": urgency_level.display_name if urgency_level else None,
-            "color_code": urgency_level.color_code if urgency_level else None,
+            **(_URGENCY_INFO[urgency_level] if urgency_level else _NO_URGENCY_INFO),
             "is_manual": is_manually_set,
         }
 
-    def _find_existing_invoice(self, invoice_number: str) -> Optional[Invoice]:
-        """Find an existing invoice by number using repository.
+    def _find_existing_invoices(self, invoice_numbers: List[str]) -> Dict[str, Invoice]:
+        """Find existing invoices by number using the repository, in one lookup.
 
         This method abstracts the repository lookup to maintain separation of concerns
         and single responsibility principle.
 
         Args:
-            invoice_number: The business identifier of the invoice to find
+            invoice_numbers: The business identifiers of the invoices to find
 
         Returns:
-            The existing invoice if found, None otherwise
+            The existing invoices keyed by invoice number; numbers without an
+            invoice are omitted
         """
-        if hasattr(self, "invoice_repository") and self.invoice_repository:
-            return self.invoice_repository.find_by_invoice_number(invoice_number)
-        return None
+        if self.invoice_repository and invoice_numbers:
+            return self.invoice_repository.get_by_numbers(invoice_numbers)
+        return {}
 
     def _update_file_metadata(
         self,
@@ -154,11 +180,13 @@ class InvoiceService:
         file_size: Optional[int],
         file_type: Optional[str],
         original_file_name: Optional[str],
+        content_hash: Optional[str] = None,
     ) -> None:
         """Update invoice with file-related metadata.
 
-        This method handles the attachment of file metadata to the invoice model,
-        adapting to the structure of the invoice object.
+        This method handles the attachment of file metadata to the invoice model.
+        Every Invoice carries a FileInfo, so values are assigned directly;
+        metadata that was not provided leaves the current value in place.
 
         Args:
             invoice: The invoice to update
@@ -166,18 +194,19 @@ class InvoiceService:
             file_size: Size of the file in bytes
             file_type: MIME type of the file
             original_file_name: Original name of the uploaded file
+            content_hash: SHA-256 hex digest of the file content
         """
-        if hasattr(invoice, "file"):
-            if file_path:
-                invoice.file.path = file_path
-            if file_size:
-                invoice.file.size = file_size
-            if file_type:
-                invoice.file.file_type = file_type
-            if original_file_name:
-                invoice.file.original_name = original_file_name
-        elif hasattr(invoice, "file_path") and file_path:
-            invoice.file_path = file_path
+        file = invoice.file
+        if file_path:
+            file.path = file_path
+        if file_size:
+            file.size = file_size
+        if file_type:
+            file.file_type = file_type
+        if original_file_name:
+            file.original_name = original_file_name
+        if content_hash:
+            file.content_hash = content_hash
 
     def process_invoice(
         self,
@@ -187,11 +216,13 @@ class InvoiceService:
         original_file_name: Optional[str] = None,
         file_path: Optional[str] = None,
         user_id: Optional[int] = None,
-    ) -> DjangoInvoice:  # Return the Django model instance
+        content_hash: Optional[str] = None,
+    ) -> Invoice:
         """Process an invoice, creating a new one or updating existing.
 
         This method consolidates the create and update logic into a single method
         that handles both new and existing invoices based on the invoice number.
+        It is a single-item shortcut for process_invoices_batch.
 
         Args:
             invoice_data: Dictionary with extracted invoice information (total_amount, due_date, etc.)
@@ -200,56 +231,143 @@ class InvoiceService:
             original_file_name: Original name of the uploaded file
             file_path: Path where the file is stored
             user_id: ID of the user who uploaded the invoice
+            content_hash: SHA-256 hex digest of the file content
 
         Returns:
-            Processed Django Invoice instance (either created or updated)
+            Processed Invoice instance (either created or updated), with the
+            ID of the saved row
 
         Raises:
             ValueError: If the invoice data is missing required fields
         """
-        # Validate required data
-        invoice_number = invoice_data.get("invoice_number")
-        if not invoice_number:
-            raise ValueError("Missing required field: invoice_number")
+        return self.process_invoices_batch(
+            [
+                {
+                    "invoice_data": invoice_data,
+                    "file_size": file_size,
+                    "file_type": file_type,
+                    "original_file_name": original_file_name,
+                    "file_path": file_path,
+                    "user_id": user_id,
+                    "content_hash": content_hash,
+                }
+            ]
+        )[0]
+
+    def process_invoices_batch(self, items: List[Dict[str, Any]]) -> List[Invoice]:
+        """Process several invoices, looking up and saving them in bulk.
+
+        Existing invoices are fetched with a single query for all invoice
+        numbers and every invoice is created or updated in memory. With a
+        repository, new rows are written with one bulk insert and existing
+        rows with one bulk update; without one, every invoice is new and is
+        inserted directly.
 
-        # Find existing invoice
-        existing_invoice = self._find_existing_invoice(invoice_number)
+        Args:
+            items: One dict per invoice with the keyword arguments of
+                process_invoice (invoice_data, and optionally file_size,
+                file_type, original_file_name, file_path, user_id and
+                content_hash)
 
-        # Process invoice based on whether it exists
-        if existing_invoice:
-            invoice = self.update(existing_invoice, invoice_data)
-            setattr(invoice, "is_updated", True)
+        Returns:
+            Processed Invoice instances, in the order of items, each with the
+            ID of its saved row
+
+        Raises:
+            ValueError: If any invoice data is missing required fields
+        """
+        # Validate required data
+        invoice_numbers = []
+        for item in items:
+            invoice_number = item["invoice_data"].get("invoice_number")
+            if not invoice_number:
+                raise ValueError("Missing required field: invoice_number")
+            invoice_numbers.append(invoice_number)
+
+        # Find existing invoices
+        existing_invoices = self._find_existing_invoices(invoice_numbers)
+
+        invoices = []
+        for item, invoice_number in zip(items, invoice_numbers):
+            extract = InvoiceExtract.from_mapping(item["invoice_data"])
+            file_path = item.get("file_path")
+            file_size = item.get("file_size")
+            file_type = item.get("file_type")
+            original_file_name = item.get("original_file_name")
+            content_hash = item.get("content_hash")
+            user_id = item.get("user_id")
+
+            # Process invoice based on whether it exists
+            existing_invoice = existing_invoices.get(invoice_number)
+            if existing_invoice:
+                invoice = self.update(existing_invoice, extract)
+                setattr(invoice, "is_updated", True)
+            else:
+                invoice = self.create(extract)
+                setattr(invoice, "is_updated", False)
+
+            # Update file metadata
+            self._update_file_metadata(
+                invoice,
+                file_path,
+                file_size,
+                file_type,
+                original_file_name,
+                content_hash,
+            )
+
+            # Set user if not already set
+            if hasattr(invoice, "uploaded_by") and user_id and not invoice.uploaded_by:
+                invoice.uploaded_by = user_id
+
+            invoices.append(invoice)
+
+        if self.invoice_repository:
+            # One INSERT for the new invoices, one UPDATE for the existing ones
+            self.invoice_repository.save_many(invoices)
         else:
-            invoice = self.create(invoice_data)
-            setattr(invoice, "is_updated", False)
-
-        # Update file metadata
-        self._update_file_metadata(
-            invoice,
-            file_path,
-            file_size,
-            file_type,
-            original_file_name,
-        )
+            self._insert_invoices(invoices)
+        return invoices
 
-        # Set user if not already set
-        if hasattr(invoice, "uploaded_by") and user_id and not invoice.uploaded_by:
-            invoice.uploaded_by = user_id
-
-        # Convert domain model to Django model for saving
-        django_invoice = DjangoInvoice(
-            invoice_number=invoice.invoice_number,
-            total_amount=invoice.total_amount,
-            due_date=invoice.due_date,
-            status=invoice.status.value,
-            uploaded_by_id=user_id,
-            file_path=file_path,
-            file_size=file_size,
-            file_type=file_type,
-            original_file_name=original_file_name,
-        )
+    def _insert_invoices(self, invoices: List[Invoice]) -> None:
+        """Insert new invoices with one bulk INSERT, without a repository.
 
-        # Save the Django model instance
-        django_invoice.save()
-        invoice.id = django_invoice.id
-        return invoice
+        Args:
+            invoices: The invoices to insert; each gets the ID of its row
+        """
+        # Imported here so importing the domain service does not pull in the
+        # Django ORM and app registry
+        from infrastructure.django.models.invoice import Invoice as DjangoInvoice
+
+        django_invoices = [
+            DjangoInvoice(
+                invoice_number=invoice.invoice_number,
+                total_amount=invoice.total_amount,
+                due_date=invoice.due_date,
+                status=invoice.status.value,
+                uploaded_by_id=invoice.uploaded_by,
+                file_path=invoice.file.path,
+                file_size=invoice.file.size,
+                file_type=invoice.file.file_type,
+                original_file_name=invoice.file.original_name,
+                content_hash=invoice.file.content_hash,
+            )
+            for invoice in invoices
+        ]
+        for invoice, django_invoice in zip(invoices, DjangoInvoice.objects.bulk_create(django_invoices)):
+            invoice.id = django_invoice.id
+
+
+_invoice_service: Optional[InvoiceService] = None
+
+
+def get_invoice_service() -> InvoiceService:
+    """Return the InvoiceService shared by the whole process.
+
+    The service holds no per-request state, so views reuse one instance
+    instead of building a new one for every request.
+    """
+    global _invoice_service
+    if _invoice_service is None:
+        _invoice_service = InvoiceService()
+    return _invoice_service
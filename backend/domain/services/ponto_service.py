@@ -5,13 +5,16 @@ independent of infrastructure concerns like storage or data transformation.
 """
 
 import logging
+from decimal import InvalidOperation
 
 from typing import Dict, Any
 from domain.models.ponto import IbanityAccount, PontoToken
 from domain.exceptions import (
+    PontoTokenError,
     PontoTokenNotFoundError,
     PontoTokenDecryptionError,
     PontoTokenCreationError,
+    IbanityAccountError,
     IbanityAccountNotFoundError,
     IbanityAccountDataError,
 )
@@ -23,6 +26,28 @@ from domain.repositories.interfaces.ponto_repository import (
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.ERROR)
 
+# Fields an Ibanity account update or creation must provide
+_IBANITY_REQUIRED_FIELDS = frozenset(
+    (
+        "user",
+        "account_id",
+        "description",
+        "product",
+        "reference",
+        "currency",
+        "authorization_expiration_expected_at",
+        "current_balance",
+        "available_balance",
+        "subtype",
+        "holder_name",
+        "resource_id",
+    )
+)
+
+# Token fields received from the Ponto API, and those a token update or creation needs
+_PONTO_TOKEN_DATA_FIELDS = frozenset(("access_token", "refresh_token", "expires_in"))
+_PONTO_TOKEN_REQUIRED_FIELDS = _PONTO_TOKEN_DATA_FIELDS | {"user"}
+
 
 class IbanityAccountService:
     """
@@ -40,6 +65,9 @@ class IbanityAccountService:
                 accessing and persisting Ibanity account data.
         """
         self.ibanity_account_repository = ibanity_account_repository
+        # Repository methods used on every call, bound once
+        self._get_by_user = ibanity_account_repository.get_by_user
+        self._process_accounts_data = ibanity_account_repository.process_accounts_data
 
     def update(self, ibanity_account: IbanityAccount, extracted_data: Dict[str, Any]) -> IbanityAccount:
         """Update an Ibanity account with data extracted from a document.
@@ -71,47 +99,19 @@ class IbanityAccountService:
             IbanityAccountDataError: If the extracted data is invalid or
                 missing required fields
         """
-        required_fields = [
-            "user",
-            "account_id",
-            "description",
-            "product",
-            "reference",
-            "currency",
-            "authorization_expiration_expected_at",
-            "current_balance",
-            "available_balance",
-            "subtype",
-            "holder_name",
-            "resource_id",
-        ]
-
         # Validate that all required fields exist
-        missing_fields = [field for field in required_fields if field not in extracted_data]
+        missing_fields = _IBANITY_REQUIRED_FIELDS.difference(extracted_data)
         if missing_fields:
-            raise IbanityAccountDataError(f"Missing required fields: {', '.join(missing_fields)}")
+            raise IbanityAccountDataError(f"Missing required fields: {', '.join(sorted(missing_fields))}")
 
+        payload = {field: extracted_data[field] for field in _IBANITY_REQUIRED_FIELDS}
         try:
             # Delegate to the domain model's update method
-            ibanity_account.update(
-                user=extracted_data["user"],
-                account_id=extracted_data["account_id"],
-                description=extracted_data["description"],
-                product=extracted_data["product"],
-                reference=extracted_data["reference"],
-                currency=extracted_data["currency"],
-                authorization_expiration_expected_at=(extracted_data["authorization_expiration_expected_at"]),
-                current_balance=extracted_data["current_balance"],
-                available_balance=extracted_data["available_balance"],
-                subtype=extracted_data["subtype"],
-                holder_name=extracted_data["holder_name"],
-                resource_id=extracted_data["resource_id"],
-            )
+            ibanity_account.update(**payload)
 
             return ibanity_account
-        except KeyError as e:
-            raise IbanityAccountDataError(f"Missing required field: {str(e)}")
-        except Exception as e:
+        except (IbanityAccountError, InvalidOperation, ValueError, TypeError) as e:
+            # Business rule violations raised by the domain model
             raise IbanityAccountDataError(f"Error updating account: {str(e)}")
 
     def create(self, extracted_data: Dict[str, Any]) -> IbanityAccount:
@@ -145,45 +145,17 @@ class IbanityAccountService:
             IbanityAccountDataError: If the extracted data is missing
                 required fields
         """
-        required_fields = [
-            "user",
-            "account_id",
-            "description",
-            "product",
-            "reference",
-            "currency",
-            "authorization_expiration_expected_at",
-            "current_balance",
-            "available_balance",
-            "subtype",
-            "holder_name",
-            "resource_id",
-        ]
-
         # Validate that all required fields exist
-        missing_fields = [field for field in required_fields if field not in extracted_data]
+        missing_fields = _IBANITY_REQUIRED_FIELDS.difference(extracted_data)
         if missing_fields:
-            raise IbanityAccountDataError(f"Missing required fields: {', '.join(missing_fields)}")
+            raise IbanityAccountDataError(f"Missing required fields: {', '.join(sorted(missing_fields))}")
 
+        payload = {field: extracted_data[field] for field in _IBANITY_REQUIRED_FIELDS}
         try:
             # Use the factory method to create and validate the Ibanity account
-            return IbanityAccount.create(
-                user=extracted_data["user"],
-                account_id=extracted_data["account_id"],
-                description=extracted_data["description"],
-                product=extracted_data["product"],
-                reference=extracted_data["reference"],
-                currency=extracted_data["currency"],
-                authorization_expiration_expected_at=(extracted_data["authorization_expiration_expected_at"]),
-                current_balance=extracted_data["current_balance"],
-                available_balance=extracted_data["available_balance"],
-                subtype=extracted_data["subtype"],
-                holder_name=extracted_data["holder_name"],
-                resource_id=extracted_data["resource_id"],
-            )
-        except KeyError as e:
-            raise IbanityAccountDataError(f"Missing required field: {str(e)}")
-        except Exception as e:
+            return IbanityAccount.create(**payload)
+        except (IbanityAccountError, InvalidOperation, ValueError, TypeError) as e:
+            # Business rule violations raised by the domain model
             raise IbanityAccountDataError(f"Error creating account: {str(e)}")
 
     def add_or_update(
@@ -206,9 +178,7 @@ class IbanityAccountService:
         """
         try:
             # Process account data through the repository
-            return self.ibanity_account_repository.process_accounts_data(
-                user=user, accounts_data=accounts_data
-            )
+            return self._process_accounts_data(user=user, accounts_data=accounts_data)
         except IndexError as e:
             logger.error(f"Invalid account structure for user: {user.id}, error: {e}")
             raise IbanityAccountDataError(f"Invalid account data structure: {e}")
@@ -236,7 +206,7 @@ class IbanityAccountService:
                 account data
         """
         try:
-            return self.ibanity_account_repository.get_by_user(user=user)
+            return self._get_by_user(user=user)
         except IbanityAccountNotFoundError:
             # Log and re-raise domain exception directly
             logger.error(f"Account not found for user {user}")
@@ -278,6 +248,10 @@ class PontoTokenService:
             ponto_token_repository: Repository for Ponto token operations.
         """
         self.ponto_token_repository = ponto_token_repository
+        # Repository methods used on every call, bound once
+        self._get_by_user = ponto_token_repository.get_by_user
+        self._save = ponto_token_repository.save
+        self._get_decrypted_access_token = ponto_token_repository.get_decrypted_access_token
 
     def update(self, ponto_token: PontoToken, extracted_data: Dict[str, Any]) -> PontoToken:
         """Update a Ponto token with data extracted from a document.
@@ -300,26 +274,19 @@ class PontoTokenService:
             PontoTokenCreationError: If the extracted data is invalid or
                 missing required fields
         """
-        required_fields = ["user", "access_token", "refresh_token", "expires_in"]
-
         # Validate that all required fields exist
-        missing_fields = [field for field in required_fields if field not in extracted_data]
+        missing_fields = _PONTO_TOKEN_REQUIRED_FIELDS.difference(extracted_data)
         if missing_fields:
-            raise PontoTokenCreationError(f"Missing required fields: {', '.join(missing_fields)}")
+            raise PontoTokenCreationError(f"Missing required fields: {', '.join(sorted(missing_fields))}")
 
+        payload = {field: extracted_data[field] for field in _PONTO_TOKEN_REQUIRED_FIELDS}
         try:
             # Delegate to the domain model's update method
-            ponto_token.update(
-                user=extracted_data["user"],
-                access_token=extracted_data["access_token"],
-                refresh_token=extracted_data["refresh_token"],
-                expires_in=extracted_data["expires_in"],
-            )
+            ponto_token.update(**payload)
 
             return ponto_token
-        except KeyError as e:
-            raise PontoTokenCreationError(f"Missing required field: {str(e)}")
-        except Exception as e:
+        except (PontoTokenError, InvalidOperation, ValueError, TypeError) as e:
+            # Business rule violations raised by the domain model
             raise PontoTokenCreationError(f"Error updating token: {str(e)}")
 
     def create_token(self, extracted_data: Dict[str, Any]) -> PontoToken:
@@ -343,24 +310,17 @@ class PontoTokenService:
             PontoTokenCreationError: If the extracted data is missing
                 required fields
         """
-        required_fields = ["user", "access_token", "refresh_token", "expires_in"]
-
         # Validate that all required fields exist
-        missing_fields = [field for field in required_fields if field not in extracted_data]
+        missing_fields = _PONTO_TOKEN_REQUIRED_FIELDS.difference(extracted_data)
         if missing_fields:
-            raise PontoTokenCreationError(f"Missing required fields: {', '.join(missing_fields)}")
+            raise PontoTokenCreationError(f"Missing required fields: {', '.join(sorted(missing_fields))}")
 
+        payload = {field: extracted_data[field] for field in _PONTO_TOKEN_REQUIRED_FIELDS}
         try:
             # Use the factory method to create and validate the Ponto token
-            return PontoToken.create(
-                user=extracted_data["user"],
-                access_token=extracted_data["access_token"],
-                refresh_token=extracted_data["refresh_token"],
-                expires_in=extracted_data["expires_in"],
-            )
-        except KeyError as e:
-            raise PontoTokenCreationError(f"Missing required field: {str(e)}")
-        except Exception as e:
+            return PontoToken.create(**payload)
+        except (PontoTokenError, InvalidOperation, ValueError, TypeError) as e:
+            # Business rule violations raised by the domain model
             raise PontoTokenCreationError(f"Error creating token: {str(e)}")
 
     # Get access token from Ponto token model
@@ -380,7 +340,7 @@ class PontoTokenService:
         """
         try:
             # Use repository for decryption (proper layer separation)
-            return self.ponto_token_repository.get_decrypted_access_token(user=user)
+            return self._get_decrypted_access_token(user=user)
         except PontoToken.DoesNotExist:  # type: ignore
             logger.error(f"Access token not found for user {user}")
             raise PontoTokenNotFoundError(f"No token found for user {user}")
@@ -418,30 +378,28 @@ class PontoTokenService:
             PontoTokenDecryptionError: If existing token cannot be read
         """
         # 1. Validate input data structure
-        required_fields = ["access_token", "refresh_token", "expires_in"]
-        missing_fields = [f for f in required_fields if f not in data]
+        missing_fields = _PONTO_TOKEN_DATA_FIELDS.difference(data)
         if missing_fields:
-            raise PontoTokenCreationError(f"Missing required fields: {', '.join(missing_fields)}")
+            raise PontoTokenCreationError(f"Missing required fields: {', '.join(sorted(missing_fields))}")
+        access_token = data["access_token"]
+        refresh_token = data["refresh_token"]
+        expires_in = data["expires_in"]
 
         try:
             # 2. Check if token exists with domain-specific rules
             try:
-                existing_token = self.ponto_token_repository.get_by_user(user=user)
+                existing_token = self._get_by_user(user=user)
 
                 # 3. Apply domain logic - check if update is needed
-                if (
-                    existing_token.access_token != data["access_token"]
-                    or existing_token.refresh_token != data["refresh_token"]
-                    or existing_token.expires_in != data["expires_in"]
-                ):
+                if not existing_token.has_data(access_token, refresh_token, expires_in):
                     # 4. Update existing token through domain model
                     existing_token.update(
                         user=user,
-                        access_token=data["access_token"],
-                        refresh_token=data["refresh_token"],
-                        expires_in=data["expires_in"],
+                        access_token=access_token,
+                        refresh_token=refresh_token,
+                        expires_in=expires_in,
                     )
-                    return self.ponto_token_repository.save(existing_token, user)
+                    return self._save(existing_token, user)
 
                 return existing_token
 
@@ -449,11 +407,11 @@ class PontoTokenService:
                 # 5. Token doesn't exist, create new one using domain factory
                 new_token = PontoToken.create(
                     user=user,
-                    access_token=data["access_token"],
-                    refresh_token=data["refresh_token"],
-                    expires_in=data["expires_in"],
+                    access_token=access_token,
+                    refresh_token=refresh_token,
+                    expires_in=expires_in,
                 )
-                return self.ponto_token_repository.save(new_token, user)
+                return self._save(new_token, user)
 
         except PontoTokenNotFoundError:
             # Handle specific domain exception
@@ -481,7 +439,7 @@ class PontoTokenService:
                 the token.
         """
         try:
-            ponto_token = self.ponto_token_repository.get_by_user(user=user)
+            ponto_token = self._get_by_user(user=user)
             return ponto_token
         except PontoToken.DoesNotExist:  # type: ignore
             logger.error(f"Access token not found for user {user}")
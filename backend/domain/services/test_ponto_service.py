@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+
+from django.test import SimpleTestCase
+from domain.exceptions import IbanityAccountDataError
+from domain.services.ponto_service import IbanityAccountService
+
+
+class TestIbanityAccountService(SimpleTestCase):
+    """Test cases for IbanityAccountService"""
+
+    def setUp(self):
+        """Create the service with a stub repository and valid account data"""
+        self.service = IbanityAccountService(Mock())
+        self.account_data = {
+            "user": Mock(),
+            "account_id": "8ba2c6b6-180c-4c13-93e3-879a1f8d305d",
+            "description": "Main account",
+            "product": "Current account",
+            "reference": "BE68539007547034",
+            "currency": "EUR",
+            "authorization_expiration_expected_at": datetime.now(timezone.utc) + timedelta(days=30),
+            "current_balance": "100.50",
+            "available_balance": "100.50",
+            "subtype": "checking",
+            "holder_name": "Test Holder",
+            "resource_id": "resource-1",
+        }
+
+    def test_create_account(self):
+        """Test creating an account converts the balances to Decimal"""
+        account = self.service.create(self.account_data)
+
+        self.assertEqual(account.current_balance, Decimal("100.50"))
+        self.assertEqual(account.available_balance, Decimal("100.50"))
+
+    def test_create_account_with_invalid_balance(self):
+        """Test an unparseable balance raises IbanityAccountDataError"""
+        self.account_data["current_balance"] = "abc"
+
+        with self.assertRaises(IbanityAccountDataError):
+            self.service.create(self.account_data)
+
+    def test_update_account_with_invalid_balance(self):
+        """Test an unparseable balance on update raises IbanityAccountDataError"""
+        account = self.service.create(self.account_data)
+        self.account_data["available_balance"] = "abc"
+
+        with self.assertRaises(IbanityAccountDataError):
+            self.service.update(account, self.account_data)
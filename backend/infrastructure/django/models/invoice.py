@@ -133,6 +133,9 @@ class Invoice(models.Model):
     original_file_name: models.CharField = models.CharField(
         max_length=255, null=True, blank=True, help_text="Original name of the uploaded file."
     )
+    content_hash: models.CharField = models.CharField(
+        max_length=64, null=True, blank=True, help_text="SHA-256 hex digest of the uploaded file."
+    )
 
     class Meta:
         """Model configuration for database behavior and indexing.
@@ -141,6 +144,7 @@ class Invoice(models.Model):
             - invoice_number: For unique constraint lookups
             - status: For filtering and status-based queries
             - due_date: For overdue calculations and date-based filtering
+            - uploaded_by, content_hash: For detecting re-uploaded files
         """
 
         app_label = "infrastructure"
@@ -151,6 +155,7 @@ class Invoice(models.Model):
             models.Index(fields=["invoice_number"]),
             models.Index(fields=["status"]),
             models.Index(fields=["due_date"]),
+            models.Index(fields=["uploaded_by", "content_hash"]),
         ]
 
     @classmethod
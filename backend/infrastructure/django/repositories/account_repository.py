@@ -1,9 +1,21 @@
-from typing import Optional
+from typing import Optional, Tuple
 from django.contrib.auth import authenticate
+from django.db.models import Q
 from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
 from infrastructure.django.models.account import Account as DjangoAccount
 from domain.models.account import Account
 from domain.repositories.interfaces.account_repository import AccountRepository
+from infrastructure.django.request_cache import invalidate_request_cache, request_memoize
+
+# Seconds an account looked up by ID or username stays in the Django cache
+ACCOUNT_CACHE_TTL = 60
+
+# Seconds an email or username that matched no account is remembered as free
+MISSING_ACCOUNT_CACHE_TTL = 5
+
+# Cached in place of a missing account; None cannot be told apart from a cache miss
+_NOT_FOUND = "__not_found__"
 
 
 class DjangoAccountRepository(AccountRepository):
@@ -39,8 +51,9 @@ class DjangoAccountRepository(AccountRepository):
         """Hash password using Django's password hasher."""
         return make_password(password)
 
+    @request_memoize("account")
     def find_by_id(self, id: int) -> Optional[Account]:
-        """Find account by ID."""
+        """Find account by ID, memoized for the current request."""
         try:
             user = DjangoAccount.objects.get(id=id)
             return self._to_domain(user)
@@ -63,6 +76,19 @@ class DjangoAccountRepository(AccountRepository):
         except DjangoAccount.DoesNotExist:
             return None
 
+    def find_by_email_or_username(
+        self, email: str, username: str
+    ) -> Tuple[Optional[Account], Optional[Account]]:
+        """Find the accounts matching an email or a username with one query."""
+        by_email = by_username = None
+        # email and username are both unique, so at most two rows match
+        for user in DjangoAccount.objects.filter(Q(email=email) | Q(username=username))[:2]:
+            if user.email == email:
+                by_email = self._to_domain(user)
+            if user.username == username:
+                by_username = self._to_domain(user)
+        return by_email, by_username
+
     def save(self, account: Account) -> Account:
         """Save account (create or update)."""
         user_data = {
@@ -84,6 +110,7 @@ class DjangoAccountRepository(AccountRepository):
                 for key, value in user_data.items():
                     setattr(user, key, value)
                 user.save()
+                invalidate_request_cache("account", account.id)
                 return self._to_domain(user)
             except DjangoAccount.DoesNotExist:
                 raise ValueError(f"User with id {account.id} not found")
@@ -109,3 +136,141 @@ class DjangoAccountRepository(AccountRepository):
                 return None
 
         return self._to_domain(user)
+
+    def authenticate_by_identifier(self, identifier: str, password: str) -> Tuple[Optional[Account], str]:
+        """Authenticate user with username or email and password in one lookup."""
+        if "@" in identifier:
+            return self.authenticate_by_email(identifier, password)
+        return self.authenticate_by_username(identifier, password)
+
+    def authenticate_by_email(self, email: str, password: str) -> Tuple[Optional[Account], str]:
+        """Authenticate user with email and password in one lookup."""
+        return self._authenticate(password, email=email)
+
+    def authenticate_by_username(self, username: str, password: str) -> Tuple[Optional[Account], str]:
+        """Authenticate user with username and password in one lookup."""
+        return self._authenticate(password, username=username)
+
+    def _authenticate(self, password: str, **lookup: str) -> Tuple[Optional[Account], str]:
+        """Fetch the account matching lookup and verify its password."""
+        try:
+            user = DjangoAccount.objects.get(**lookup)
+        except DjangoAccount.DoesNotExist:
+            return None, "not_found"
+
+        account = self._to_domain(user)
+        if not account.is_valid_for_authentication():
+            return None, "inactive"
+
+        # check_password verifies (and upgrades, if needed) the stored hash in-process
+        if not user.check_password(password):
+            return None, "invalid_credentials"
+
+        return account, ""
+
+
+class CachingAccountRepository(AccountRepository):
+    """Account repository caching ID and username lookups in the Django cache.
+
+    Wraps another AccountRepository. Authenticated requests resolve the same
+    account on every call, so find_by_id and find_by_username results are kept
+    for ACCOUNT_CACHE_TTL seconds in the configured cache backend (in-process
+    by default, Memcached/Redis when CACHES points there). Entries are dropped
+    when the account is saved through this repository; all other methods,
+    including registration and login lookups, always hit the wrapped
+    repository.
+
+    Registration lookups that find nothing are remembered for
+    MISSING_ACCOUNT_CACHE_TTL seconds, so bursts of sign-up attempts probing
+    the same emails or usernames do not each reach the database.
+    """
+
+    def __init__(self, repository: AccountRepository):
+        self.repository = repository
+
+    @staticmethod
+    def _id_key(id: int) -> str:
+        return f"acct:id:{id}"
+
+    @staticmethod
+    def _username_key(username: str) -> str:
+        return f"acct:username:{username}"
+
+    @staticmethod
+    def _missing_email_key(email: str) -> str:
+        return f"acct:missing:email:{email}"
+
+    @staticmethod
+    def _missing_username_key(username: str) -> str:
+        return f"acct:missing:username:{username}"
+
+    def find_by_id(self, id: int) -> Optional[Account]:
+        """Find account by ID, served from the cache when possible."""
+        return cache.get_or_set(self._id_key(id), lambda: self.repository.find_by_id(id), ACCOUNT_CACHE_TTL)
+
+    def find_by_username(self, username: str) -> Optional[Account]:
+        """Find account by username, served from the cache when possible."""
+        return cache.get_or_set(
+            self._username_key(username),
+            lambda: self.repository.find_by_username(username),
+            ACCOUNT_CACHE_TTL,
+        )
+
+    def find_by_email(self, email: str) -> Optional[Account]:
+        """Find account by email."""
+        return self.repository.find_by_email(email)
+
+    def find_by_email_or_username(
+        self, email: str, username: str
+    ) -> Tuple[Optional[Account], Optional[Account]]:
+        """Find the accounts matching an email or a username in one lookup.
+
+        Skips the database when both were recently found to be unused.
+        """
+        email_key = self._missing_email_key(email)
+        username_key = self._missing_username_key(username)
+        if len(cache.get_many([email_key, username_key])) == 2:
+            return None, None
+
+        by_email, by_username = self.repository.find_by_email_or_username(email, username)
+        missing = {}
+        if by_email is None:
+            missing[email_key] = _NOT_FOUND
+        if by_username is None:
+            missing[username_key] = _NOT_FOUND
+        if missing:
+            cache.set_many(missing, MISSING_ACCOUNT_CACHE_TTL)
+        return by_email, by_username
+
+    def save(self, account: Account) -> Account:
+        """Save account and drop its cached lookups."""
+        keys = [
+            self._username_key(account.username),
+            self._missing_email_key(account.email),
+            self._missing_username_key(account.username),
+        ]
+        if account.id:
+            keys.append(self._id_key(account.id))
+            # The username may have changed, so also drop the previous one
+            previous = cache.get(self._id_key(account.id))
+            if previous is not None:
+                keys.append(self._username_key(previous.username))
+        saved = self.repository.save(account)
+        cache.delete_many(keys)
+        return saved
+
+    def authenticate(self, username: str, password: str) -> Optional[Account]:
+        """Authenticate user with username/email and password."""
+        return self.repository.authenticate(username, password)
+
+    def authenticate_by_identifier(self, identifier: str, password: str) -> Tuple[Optional[Account], str]:
+        """Authenticate user with username or email and password in one lookup."""
+        return self.repository.authenticate_by_identifier(identifier, password)
+
+    def authenticate_by_email(self, email: str, password: str) -> Tuple[Optional[Account], str]:
+        """Authenticate user with email and password in one lookup."""
+        return self.repository.authenticate_by_email(email, password)
+
+    def authenticate_by_username(self, username: str, password: str) -> Tuple[Optional[Account], str]:
+        """Authenticate user with username and password in one lookup."""
+        return self.repository.authenticate_by_username(username, password)
@@ -1,22 +1,39 @@
 """Django ORM implementation of the invoice repository interface."""
 
 from datetime import date, timedelta
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from itertools import chain
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Q
+from django.utils import timezone
 from domain.repositories.interfaces.invoice_repository import InvoiceRepository
 from domain.models.invoice import Invoice as DomainInvoice
 from domain.models.invoice import BuyerInfo, SellerInfo, PaymentInfo, FileInfo
 from domain.exceptions import InvalidInvoiceError
 from infrastructure.django.models.invoice import Invoice as DjangoInvoice
 from domain.models.value_objects import UrgencyLevel, InvoiceStatus
-from logging import getLogger
+from logging import DEBUG, getLogger
 from django.db import models
 
 # Module-level logger
 logger = getLogger(__name__)
 
+# Rows per INSERT statement in bulk_save
+BULK_SAVE_BATCH_SIZE = 500
+
+# Columns save_many writes for existing invoices (those document processing changes)
+SAVE_MANY_UPDATE_FIELDS = [
+    "total_amount",
+    "due_date",
+    "status",
+    "file_path",
+    "file_size",
+    "file_type",
+    "original_file_name",
+    "content_hash",
+    "updated_at",
+]
+
 
 class DjangoInvoiceRepository(InvoiceRepository):
     """Django ORM implementation of the invoice repository."""
@@ -79,26 +96,27 @@ class DjangoInvoiceRepository(InvoiceRepository):
             size=db_invoice.file_size,
             file_type=db_invoice.file_type,
             original_name=db_invoice.original_file_name,
+            content_hash=db_invoice.content_hash,
+        )
+
+        # Create domain invoice with core fields and nested objects,
+        # in the column order expected by DomainInvoice.from_row
+        row = (
+            db_invoice.id,
+            db_invoice.total_amount,
+            db_invoice.due_date,
+            db_invoice.invoice_number,
+            InvoiceStatus.from_db_value(db_invoice.status),
+            db_invoice.uploaded_by_id,
+            buyer_info,
+            seller_info,
+            payment_info,
+            file_info,
+            None,  # manual urgency: UrgencyLevel.from_db_value(db_invoice.manual_urgency)
         )
+        logger.debug("Created invoice row: %s", row)
 
-        # Create domain invoice with core fields and nested objects
-        invoice_args = {
-            "total_amount": db_invoice.total_amount,
-            "due_date": db_invoice.due_date,
-            "invoice_number": db_invoice.invoice_number,
-            "status": InvoiceStatus.from_db_value(db_invoice.status),
-            "uploaded_by": db_invoice.uploaded_by_id,
-            "buyer": buyer_info,
-            "seller": seller_info,
-            "payment": payment_info,
-            "file": file_info,
-            "invoice_id": db_invoice.id,
-        }
-        logger.debug("Created invoice args: %s", invoice_args)
-        # if db_invoice.manual_urgency is not None:
-        #     invoice_args["manual_urgency"] = UrgencyLevel.from_db_value(db_invoice.manual_urgency)
-
-        return DomainInvoice(**invoice_args)
+        return DomainInvoice.from_row(row)
 
     def _to_django(
         self,
@@ -130,7 +148,7 @@ class DjangoInvoiceRepository(InvoiceRepository):
             # When saving a new invoice:
             db_invoice = self._to_django(domain_invoice, user_id)
             db_invoice.save()
-            return self._to_domain(db_invoice)  # Convert back after saving
+            return self._mark_saved(domain_invoice, db_invoice)  # Pick up the new ID
         """
         # Get the db_value from the manual urgency if it exists
         manual_urgency_value = (
@@ -165,14 +183,60 @@ class DjangoInvoiceRepository(InvoiceRepository):
             file_size=domain_invoice.file.size,
             file_type=domain_invoice.file.file_type,
             original_file_name=domain_invoice.file.original_name,
+            content_hash=domain_invoice.file.content_hash,
         )
 
+    def _mark_saved(self, invoice: DomainInvoice, db_invoice: DjangoInvoice) -> DomainInvoice:
+        """Copy the values assigned on insert back onto the saved domain invoice.
+
+        Only the primary key and owner are new after a save; everything else
+        already matches the domain invoice, so it is not rebuilt from the row.
+        """
+        invoice.id = db_invoice.id
+        invoice.uploaded_by = db_invoice.uploaded_by_id
+        return invoice
+
     def save(self, invoice: DomainInvoice, user_id: int) -> DomainInvoice:
         """Save an invoice to the database."""
         # come back to this later
         db_invoice = self._to_django(invoice, user_id)
         db_invoice.save()
-        return self._to_domain(db_invoice)
+        return self._mark_saved(invoice, db_invoice)
+
+    def bulk_save(self, invoices: List[DomainInvoice], user_id: int) -> List[DomainInvoice]:
+        """Save several new invoices to the database with a single INSERT."""
+        db_invoices = DjangoInvoice.objects.bulk_create(
+            [self._to_django(invoice, user_id) for invoice in invoices], batch_size=BULK_SAVE_BATCH_SIZE
+        )
+        return [self._mark_saved(invoice, db_invoice) for invoice, db_invoice in zip(invoices, db_invoices)]
+
+    def save_many(self, invoices: List[DomainInvoice], user_id: Optional[int] = None) -> List[DomainInvoice]:
+        """Insert new invoices with one INSERT and update existing ones with one UPDATE."""
+        to_create = [invoice for invoice in invoices if invoice.id is None]
+        to_update = [invoice for invoice in invoices if invoice.id is not None]
+
+        if to_create:
+            db_invoices = DjangoInvoice.objects.bulk_create(
+                [self._to_django(invoice, invoice.uploaded_by or user_id) for invoice in to_create],
+                batch_size=BULK_SAVE_BATCH_SIZE,
+            )
+            for invoice, db_invoice in zip(to_create, db_invoices):
+                self._mark_saved(invoice, db_invoice)
+
+        if to_update:
+            # bulk_update skips auto_now, so the timestamp is set explicitly
+            now = timezone.now()
+            db_invoices = []
+            for invoice in to_update:
+                db_invoice = self._to_django(invoice, invoice.uploaded_by or user_id)
+                db_invoice.id = invoice.id
+                db_invoice.updated_at = now
+                db_invoices.append(db_invoice)
+            DjangoInvoice.objects.bulk_update(
+                db_invoices, SAVE_MANY_UPDATE_FIELDS, batch_size=BULK_SAVE_BATCH_SIZE
+            )
+
+        return invoices
 
     def get_by_id(self, invoice_id: int) -> Optional[DomainInvoice]:
         """Retrieve an invoice by its ID."""
@@ -182,14 +246,21 @@ class DjangoInvoiceRepository(InvoiceRepository):
         except ObjectDoesNotExist:
             return None
 
+    def bulk_get_by_ids(self, invoice_ids: Iterable[int]) -> List[DomainInvoice]:
+        """Retrieve several invoices by their IDs with a single query."""
+        invoice_ids = list(invoice_ids)
+        db_invoices = DjangoInvoice.objects.in_bulk(invoice_ids)
+        return [self._to_domain(db_invoices[pk]) for pk in invoice_ids if pk in db_invoices]
+
     def get_by_number(self, invoice_number: str) -> Optional[DomainInvoice]:
         """Retrieve an invoice by its number.
 
         If multiple invoices exist with the same number (due to OCR errors,
         different suppliers, etc.), returns the most recently created one.
         """
-        logger.debug("Searching for invoice with number: %s", invoice_number)
-        logger.debug("Type of invoice_number: %s", type(invoice_number))
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Searching for invoice with number: %s", invoice_number)
+            logger.debug("Type of invoice_number: %s", type(invoice_number))
         try:
             # Order by created_at descending and get the first one
             db_invoice = (
@@ -207,6 +278,31 @@ class DjangoInvoiceRepository(InvoiceRepository):
             logger.error("Error retrieving invoice: %s", str(e))
             return None
 
+    def get_by_numbers(self, invoice_numbers: Iterable[str]) -> Dict[str, DomainInvoice]:
+        """Retrieve several invoices by their numbers with one IN query.
+
+        Invoice numbers are not unique, so in_bulk(field_name=...) cannot be
+        used; rows are read newest first and the first one per number wins,
+        as in get_by_number.
+        """
+        invoices: Dict[str, DomainInvoice] = {}
+        db_invoices = DjangoInvoice.objects.filter(invoice_number__in=list(invoice_numbers)).order_by(
+            "-created_at"
+        )
+        for db_invoice in db_invoices:
+            if db_invoice.invoice_number not in invoices:
+                invoices[db_invoice.invoice_number] = self._to_domain(db_invoice)
+        return invoices
+
+    def get_by_content_hash(self, content_hash: str, user_id: int) -> Optional[DomainInvoice]:
+        """Retrieve the newest invoice a user uploaded with the given file hash."""
+        db_invoice = (
+            DjangoInvoice.objects.filter(uploaded_by_id=user_id, content_hash=content_hash)
+            .order_by("-created_at")
+            .first()
+        )
+        return self._to_domain(db_invoice) if db_invoice else None
+
     def list_by_status(self, status: str) -> List[DomainInvoice]:
         """List all invoices with a given status."""
         db_invoices = DjangoInvoice.objects.filter(status=status)
@@ -214,7 +310,7 @@ class DjangoInvoiceRepository(InvoiceRepository):
 
     def list_overdue(self, as_of: Optional[date] = None) -> List[DomainInvoice]:
         """List all overdue invoices."""
-        check_date = as_of or date.today()
+        check_date = as_of or timezone.localdate()
         db_invoices = DjangoInvoice.objects.filter(Q(due_date__lt=check_date) & Q(status="pending"))
         return [self._to_domain(invoice) for invoice in db_invoices]
 
@@ -228,6 +324,17 @@ class DjangoInvoiceRepository(InvoiceRepository):
         except ObjectDoesNotExist:
             return False
 
+    def bulk_update_status(self, invoice_ids: List[int], status: str) -> int:
+        """Update the status of several invoices with a single UPDATE."""
+        return DjangoInvoice.objects.filter(id__in=invoice_ids).update(status=status)
+
+    def bulk_mark_overdue(self, as_of: Optional[date] = None) -> int:
+        """Mark every pending invoice past its due date as overdue with one UPDATE."""
+        check_date = as_of or timezone.localdate()
+        return DjangoInvoice.objects.filter(
+            due_date__lt=check_date, status=InvoiceStatus.PENDING.value
+        ).update(status=InvoiceStatus.OVERDUE.value)
+
     def update(self, invoice: DomainInvoice, user_id: int) -> DomainInvoice:
         """Update an existing invoice.
 
@@ -1,10 +1,16 @@
 """Django ORM implementation of the Ponto-related repository interfaces."""
 
-from typing import Optional, Dict, Any, Tuple
+from threading import Lock
+from time import monotonic
+from typing import Optional, Dict, Any, Iterable, List, Mapping, Sequence, Tuple
 from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned
+from django.utils import timezone
 from domain.repositories.interfaces.ponto_repository import (
+    AsyncPontoTokenRepository,
     IbanityAccountRepository,
+    IbanityAccountUpdate,
     PontoTokenRepository,
+    PontoTokenUpdate,
 )
 from domain.models.ponto import (
     IbanityAccount as DomainIbanityAccount,
@@ -27,10 +33,109 @@ from logging import getLogger
 # Module-level logger
 logger = getLogger(__name__)
 
+# IbanityAccount columns written by the bulk save/update methods
+_ACCOUNT_DATA_FIELDS = (
+    "description",
+    "product",
+    "reference",
+    "currency",
+    "authorization_expiration_expected_at",
+    "current_balance",
+    "available_balance",
+    "subtype",
+    "holder_name",
+    "resource_id",
+)
+
+# Rows per INSERT/UPDATE statement for bulk operations
+_BULK_BATCH_SIZE = 100
+
+# Process-local cache of decrypted access tokens: {user id: (expiry, token)}.
+# Shared by all DjangoPontoTokenRepository instances, since repositories are
+# created per request. Entries are dropped whenever the token is written
+# through this process. Decrypted tokens are deliberately kept out of the
+# shared Django cache, so a token rewritten by another worker process can
+# still be served here until the entry expires: at most _TOKEN_CACHE_TTL
+# seconds, and never past the end of the cached token's own lifetime.
+_TOKEN_CACHE: Dict[Any, Tuple[float, str]] = {}
+_TOKEN_CACHE_LOCK = Lock()
+_TOKEN_CACHE_MAXSIZE = 10_000
+_TOKEN_CACHE_TTL = 60
+
+
+def _get_cached_token(user) -> Optional[str]:
+    """Return the cached decrypted access token of a user, if still fresh."""
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(getattr(user, "pk", user))
+    if cached is not None and cached[0] > monotonic():
+        return cached[1]
+    return None
+
+
+def _cache_token(user, access_token: str, db_ponto_token: DjangoPontoToken) -> None:
+    """Cache a decrypted access token until it expires, for at most _TOKEN_CACHE_TTL seconds.
+
+    The token's lifetime (expires_in seconds) counts from when its row was
+    last written, so a token that is about to expire is cached only briefly
+    and an expired one not at all.
+    """
+    cache_key = getattr(user, "pk", user)
+    ttl = _TOKEN_CACHE_TTL
+    if db_ponto_token.expires_in:
+        age = (timezone.now() - db_ponto_token.updated_at).total_seconds()
+        ttl = min(ttl, db_ponto_token.expires_in - age)
+    if ttl <= 0:
+        return
+    with _TOKEN_CACHE_LOCK:
+        if cache_key not in _TOKEN_CACHE and len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _TOKEN_CACHE[next(iter(_TOKEN_CACHE))]
+        _TOKEN_CACHE[cache_key] = (monotonic() + ttl, access_token)
+
+
+def _apply_defaults(db_object: Any, defaults: Dict[str, Any]) -> bool:
+    """Copy the values in defaults that differ onto db_object and save them.
+
+    Values are converted with each field's to_python first, so e.g. an ISO
+    date string or a float balance compares equal to the stored value.
+
+    Returns:
+        bool: Whether anything changed and was saved
+    """
+    opts = db_object._meta
+    changed = []
+    for field_name, value in defaults.items():
+        value = opts.get_field(field_name).to_python(value)
+        if getattr(db_object, field_name) != value:
+            setattr(db_object, field_name, value)
+            changed.append(field_name)
+    if not changed:
+        return False
+    db_object.save(update_fields=[*changed, "updated_at"])
+    return True
+
 
 class DjangoIbanityAccountRepository(IbanityAccountRepository):
     """Django ORM implementation of the IbanityAccount repository."""
 
+    def _queryset(
+        self,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+        fields: Optional[Sequence[str]] = None,
+    ):
+        """Base queryset joining the owning user, which _to_domain always reads.
+
+        When fields is given, only those columns (plus the joined relations,
+        which Django refuses to defer) are loaded.
+        """
+        queryset = DjangoIbanityAccount.objects.select_related("user", *select_related).prefetch_related(
+            *prefetch_related
+        )
+        if fields:
+            queryset = queryset.only("user", *select_related, *fields)
+        return queryset
+
     def _to_domain(self, db_ibanity_account: DjangoIbanityAccount) -> DomainIbanityAccount:
         """Convert Django model to domain model.
 
@@ -61,26 +166,22 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
             return domain_ibanity_account  # Ready for business logic
         """
         logger.debug("Converting DB IbanityAccount to domain model: %s", db_ibanity_account)
-        # All Django models have an id field by default
+        # Columns left out by a `fields` projection map to None rather than
+        # triggering one lazy query each
+        deferred = db_ibanity_account.get_deferred_fields()
         ibanity_account_args = {
             "user": db_ibanity_account.user,
-            "account_id": db_ibanity_account.account_id,
-            "description": db_ibanity_account.description,
-            "product": db_ibanity_account.product,
-            "reference": db_ibanity_account.reference,
-            "currency": db_ibanity_account.currency,
-            "authorization_expiration_expected_at": (db_ibanity_account.authorization_expiration_expected_at),
-            "current_balance": db_ibanity_account.current_balance,
-            "available_balance": db_ibanity_account.available_balance,
-            "subtype": db_ibanity_account.subtype,
-            "holder_name": db_ibanity_account.holder_name,
-            "resource_id": db_ibanity_account.resource_id,
-            # Map Django's auto-generated id to domain model's
-            # ibanity_account_id parameter. Domain model stores it as self.id
-            "ibanity_account_id": db_ibanity_account.id,  # type: ignore
+            "account_id": None if "account_id" in deferred else db_ibanity_account.account_id,
+            **{
+                field: None if field in deferred else getattr(db_ibanity_account, field)
+                for field in _ACCOUNT_DATA_FIELDS
+            },
         }
 
-        return DomainIbanityAccount(**ibanity_account_args)
+        domain_ibanity_account = DomainIbanityAccount(**ibanity_account_args)
+        # The constructor takes no ID; keep Django's auto-generated id on the domain model
+        domain_ibanity_account.id = db_ibanity_account.id
+        return domain_ibanity_account
 
     def _to_django(
         self,
@@ -136,13 +237,31 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
         db_ibanity_account.save()
         return self._to_domain(db_ibanity_account)
 
-    def get_or_create(self, user, account_id, data) -> Tuple[DomainIbanityAccount, bool]:
-        """Get or create by user or account_id and saves with the provided data
+    def bulk_save(
+        self, domain_ibanity_accounts: Sequence[DomainIbanityAccount]
+    ) -> List[DomainIbanityAccount]:
+        """Insert or overwrite several IbanityAccounts, matched on account_id."""
+        db_ibanity_accounts = DjangoIbanityAccount.objects.bulk_create(
+            [self._to_django(account) for account in domain_ibanity_accounts],
+            batch_size=_BULK_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["account_id"],
+            update_fields=["user", *_ACCOUNT_DATA_FIELDS, "updated_at"],
+        )
+        return [self._to_domain(db_ibanity_account) for db_ibanity_account in db_ibanity_accounts]
+
+    def get_or_create(
+        self, user, account_id, defaults: IbanityAccountUpdate
+    ) -> Tuple[DomainIbanityAccount, bool, bool]:
+        """Get or create by user and account_id, saving the provided data
+
+        An existing account is only written back when a value in defaults
+        differs from what is stored.
 
         Args:
             user (User): Ibanity account owner
             account_id (str): Ibanity account ID
-            data (dict): New data or replace data
+            defaults (IbanityAccountUpdate): New data or replace data
                 - 'description': Description of IbanityAccount
                 - 'product': Product
                 - 'reference': Reference
@@ -155,32 +274,51 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
                 - 'resource_id': Resource ID
 
         Returns:
-            Tuple[DomainIbanityAccount, bool]: (Account domain model, created flag)
+            Tuple[DomainIbanityAccount, bool, bool]: (Account domain model,
+                created flag, updated flag)
         """
         ibanity_account, created = DjangoIbanityAccount.objects.get_or_create(
-            user=user, account_id=account_id, defaults=data
+            user=user, account_id=account_id, defaults=defaults
         )
+        updated = not created and _apply_defaults(ibanity_account, defaults)
 
-        return self._to_domain(ibanity_account), created
+        return self._to_domain(ibanity_account), created, updated
 
-    def get_by_id(self, ibanity_account_id: int) -> Optional[DomainIbanityAccount]:
+    def get_by_id(
+        self,
+        ibanity_account_id: int,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[DomainIbanityAccount]:
         """Retrieve an IbanityAccount by its ID."""
         try:
-            db_ibanity_account = DjangoIbanityAccount.objects.get(id=ibanity_account_id)
+            db_ibanity_account = self._queryset(select_related, prefetch_related, fields).get(
+                id=ibanity_account_id
+            )
             return self._to_domain(db_ibanity_account)
         except ObjectDoesNotExist as exc:
             raise IbanityAccountNotFoundError(
                 f"IbanityAccount not found with the ID {ibanity_account_id}"
             ) from exc
 
-    def get_by_account_id(self, account_id: str) -> Optional[DomainIbanityAccount]:
+    def get_by_account_id(
+        self,
+        account_id: str,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[DomainIbanityAccount]:
         """Retrieve an IbanityAccount by its account ID."""
         logger.debug(f"Searching for IbanityAccount with Account ID: {account_id}")
         logger.debug(f"Type of account ID: {account_id}")
         try:
             # Order by created_at descending and get the first one
             db_ibanity_account = (
-                DjangoIbanityAccount.objects.filter(account_id=account_id).order_by("-created_at").first()
+                self._queryset(select_related, prefetch_related, fields)
+                .filter(account_id=account_id)
+                .order_by("-created_at")
+                .first()
             )
 
             if db_ibanity_account:
@@ -196,13 +334,21 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
                 f"IbanityAccount not found with the account ID {account_id}"
             ) from e
 
-    def get_by_user(self, user) -> DomainIbanityAccount:
+    def get_by_user(
+        self,
+        user,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+        fields: Optional[Sequence[str]] = None,
+    ) -> DomainIbanityAccount:
         """Retrieve an IbanityAccount by its user."""
         logger.debug(f"Searching for IbanityAccount of User: {user}")
         logger.debug(f"Type of user: {user}")
         try:
             # Order by created_at descending and get the first one
-            db_ibanity_account = DjangoIbanityAccount.objects.filter(user=user).first()
+            db_ibanity_account = (
+                self._queryset(select_related, prefetch_related, fields).filter(user=user).first()
+            )
 
             if db_ibanity_account:
                 logger.debug(f"Found IbanityAccount in DB: {db_ibanity_account}")
@@ -215,6 +361,15 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
             logger.error(f"Error retrieving IbanityAccount: {str(e)}")
             raise IbanityAccountNotFoundError(f"IbanityAccount not found with the user {user}") from e
 
+    def get_by_users(self, users: Iterable) -> Dict[int, DomainIbanityAccount]:
+        """Retrieve the most recent IbanityAccount of each user in one query."""
+        accounts: Dict[int, DomainIbanityAccount] = {}
+        # Ordered by -created_at, so the first account seen per user is the newest
+        for db_ibanity_account in self._queryset().filter(user__in=users):
+            if db_ibanity_account.user_id not in accounts:
+                accounts[db_ibanity_account.user_id] = self._to_domain(db_ibanity_account)
+        return accounts
+
     def update(self, domain_ibanity_account: DomainIbanityAccount, user) -> DomainIbanityAccount:
         """Update an existing IbanityAccount.
 
@@ -254,7 +409,7 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
                 f"IbanityAccount {domain_ibanity_account.account_id} not found"
             ) from exc
 
-    def update_by_account_id(self, account_id: str, data) -> DomainIbanityAccount:
+    def update_by_account_id(self, account_id: str, data: IbanityAccountUpdate) -> DomainIbanityAccount:
         """Update an existing IbanityAccount.
 
         This method should update all fields of an existing IbanityAccount
@@ -262,7 +417,7 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
 
         Args:
             account_id (str): The IbanityAccount account_id
-            data (dict): New data or replace data
+            data (IbanityAccountUpdate): New data or replace data
                 - 'description': Description of IbanityAccount
                 - 'product': Product
                 - 'reference': Reference
@@ -286,22 +441,9 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
         try:
             ibanity_account = DjangoIbanityAccount.objects.get(account_id=account_id)
 
-            field_mapping = {
-                "description": "description",
-                "product": "product",
-                "reference": "reference",
-                "currency": "currency",
-                "authorization_expiration_expected_at": ("authorization_expiration_expected_at"),
-                "current_balance": "current_balance",
-                "available_balance": "available_balance",
-                "subtype": "subtype",
-                "holder_name": "holder_name",
-                "resource_id": "resource_id",
-            }
-
-            # Update account fields
-            for data_field, model_field in field_mapping.items():
-                setattr(ibanity_account, model_field, data[data_field])
+            # Update account fields; the payload keys match the model fields
+            for field in _ACCOUNT_DATA_FIELDS:
+                setattr(ibanity_account, field, data[field])
 
             ibanity_account.save()
             return self._to_domain(ibanity_account)
@@ -312,6 +454,39 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
         except MultipleObjectsReturned as e:
             raise InvalidIbanityAccountError(f"Error while updating IbanityAccount: {str(e)}") from e
 
+    def bulk_update_by_account_id(
+        self, updates: Mapping[str, IbanityAccountUpdate]
+    ) -> List[DomainIbanityAccount]:
+        """Update several existing IbanityAccounts with one query per batch.
+
+        Args:
+            updates: New data keyed by IbanityAccount account_id, with the
+                same keys as update_by_account_id
+
+        Returns:
+            List[DomainIbanityAccount]: The updated domain IbanityAccounts
+
+        Raises:
+            InvalidIbanityAccountError: If the data is missing a field
+        """
+        db_ibanity_accounts = list(DjangoIbanityAccount.objects.filter(account_id__in=updates.keys()))
+        now = timezone.now()
+        try:
+            for db_ibanity_account in db_ibanity_accounts:
+                data = updates[db_ibanity_account.account_id]
+                for field in _ACCOUNT_DATA_FIELDS:
+                    setattr(db_ibanity_account, field, data[field])
+                db_ibanity_account.updated_at = now
+        except KeyError as e:
+            raise InvalidIbanityAccountError(f"Missing field while updating IbanityAccounts: {e}") from e
+
+        DjangoIbanityAccount.objects.bulk_update(
+            db_ibanity_accounts,
+            fields=[*_ACCOUNT_DATA_FIELDS, "updated_at"],
+            batch_size=_BULK_BATCH_SIZE,
+        )
+        return [self._to_domain(db_ibanity_account) for db_ibanity_account in db_ibanity_accounts]
+
     def process_accounts_data(self, user: Any, accounts_data: Dict[str, Any]) -> DomainIbanityAccount:
         """Process raw accounts data from Ponto API and save or update
            in repository.
@@ -332,11 +507,8 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
         # Transform API data to domain model format
         account_data = self._transform_to_account_data(account_info)
 
-        # Create or update the account
-        account, created = self.get_or_create(user=user, account_id=account_info["id"], data=account_data)
-
-        if not created:
-            account = self.update_by_account_id(account_id=account_info["id"], data=account_data)
+        # Create the account, or update it if any value changed
+        account, _, _ = self.get_or_create(user=user, account_id=account_info["id"], defaults=account_data)
 
         return account
 
@@ -396,14 +568,14 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
 
         return account_info
 
-    def _transform_to_account_data(self, account_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _transform_to_account_data(self, account_info: Dict[str, Any]) -> IbanityAccountUpdate:
         """Transform the validated API data into domain model format.
 
         Args:
             account_info: Validated account info from Ponto API
 
         Returns:
-            Dict: Data ready for domain model creation/update
+            IbanityAccountUpdate: Data ready for domain model creation/update
         """
         return {
             "description": account_info["attributes"]["description"],
@@ -421,8 +593,18 @@ class DjangoIbanityAccountRepository(IbanityAccountRepository):
         }
 
 
-class DjangoPontoTokenRepository(PontoTokenRepository):
-    """Django ORM implementation of the PontoToken repository."""
+class DjangoPontoTokenRepository(PontoTokenRepository, AsyncPontoTokenRepository):
+    """Django ORM implementation of the PontoToken repository.
+
+    Implements both the sync and async interfaces; the async methods use
+    Django's native async ORM and share the decrypted-token cache.
+    """
+
+    def _queryset(self, select_related: Tuple[str, ...] = (), prefetch_related: Tuple[str, ...] = ()):
+        """Base queryset joining the owning user, which _to_domain always reads."""
+        return DjangoPontoToken.objects.select_related("user", *select_related).prefetch_related(
+            *prefetch_related
+        )
 
     def _to_domain(self, db_ponto_token: DjangoPontoToken) -> DomainPontoToken:
         """Convert Django model to domain model.
@@ -454,19 +636,18 @@ class DjangoPontoTokenRepository(PontoTokenRepository):
             return domain_ponto_token  # Ready for business logic
         """
         logger.debug("Converting DB PontoToken to domain model: %s", db_ponto_token)
-        # All Django models have an id field by default
         pontoToken_args = {
             "user": db_ponto_token.user,
             "access_token": db_ponto_token.access_token,
             "refresh_token": db_ponto_token.refresh_token,
             "expires_in": db_ponto_token.expires_in,
-            # Map Django's auto-generated id to domain model's
-            # pontoToken_id parameter. Domain model stores it as self.id
-            "pontoToken_id": db_ponto_token.id,  # type:ignore
         }
         logger.debug("Created PontoToken args: %s", pontoToken_args)
 
-        return DomainPontoToken(**pontoToken_args)
+        domain_ponto_token = DomainPontoToken(**pontoToken_args)
+        # The constructor takes no ID; keep Django's auto-generated id on the domain model
+        domain_ponto_token.id = db_ponto_token.id
+        return domain_ponto_token
 
     def _to_django(self, domain_ponto_token: DomainPontoToken, user) -> DjangoPontoToken:
         """Convert domain model to Django model.
@@ -506,29 +687,40 @@ class DjangoPontoTokenRepository(PontoTokenRepository):
         # come back to this later
         db_ponto_token = self._to_django(domain_ponto_token, user)
         db_ponto_token.save()
+        self.invalidate_cache(db_ponto_token.user)
         return self._to_domain(db_ponto_token)
 
-    def get_by_id(self, pontoToken_id: int) -> DomainPontoToken:
+    def get_by_id(
+        self,
+        pontoToken_id: int,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+    ) -> DomainPontoToken:
         """Retrieve an PontoToken by its ID."""
         try:
-            db_ponto_token = DjangoPontoToken.objects.filter(id=pontoToken_id).first()
+            db_ponto_token = self._queryset(select_related, prefetch_related).filter(id=pontoToken_id).first()
             if db_ponto_token is None:
                 raise ObjectDoesNotExist("PontoToken not found")
             return self._to_domain(db_ponto_token)
         except ObjectDoesNotExist as exc:
             raise PontoTokenNotFoundError(f"PontoToken not found with ID {pontoToken_id}") from exc
 
-    def get_or_create_by_user(self, user, data) -> Tuple[DomainPontoToken, bool]:
-        """Retrieve an PontoToken by its user."""
+    def get_or_create_by_user(
+        self, user, defaults: PontoTokenUpdate
+    ) -> Tuple[DomainPontoToken, bool, bool]:
+        """Retrieve an PontoToken by its user, creating or updating it from defaults."""
         logger.debug(f"Searching for PontoToken of User: {user}")
         logger.debug(f"Type of user: {user}")
         try:
             # Order by created_at descending and get the first one
-            db_ponto_token, created = DjangoPontoToken.objects.get_or_create(user=user, defaults=data)
+            db_ponto_token, created = DjangoPontoToken.objects.get_or_create(user=user, defaults=defaults)
 
             if db_ponto_token:
                 logger.debug(f"Found PontoToken in DB: {db_ponto_token}")
-                return self._to_domain(db_ponto_token), created
+                updated = not created and _apply_defaults(db_ponto_token, defaults)
+                if updated:
+                    self.invalidate_cache(user)
+                return self._to_domain(db_ponto_token), created, updated
             else:
                 logger.debug("No PontoToken found of that user")
                 raise PontoTokenNotFoundError(f"No PontoToken found for user {user}")
@@ -537,11 +729,18 @@ class DjangoPontoTokenRepository(PontoTokenRepository):
             logger.error(f"Error retrieving PontoToken: {str(e)}")
             raise InvalidPontoTokenError("Invalid PontoToken error")
 
-    def get_by_user(self, user) -> DomainPontoToken:
+    def get_by_user(
+        self,
+        user,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+    ) -> DomainPontoToken:
         """Get a token by user.
 
         Args:
             user: The user who owns the token
+            select_related: Extra relations to join in the same query
+            prefetch_related: Extra relations to prefetch
 
         Returns:
             DomainPontoToken: The token data
@@ -550,19 +749,26 @@ class DjangoPontoTokenRepository(PontoTokenRepository):
             PontoTokenNotFoundError: If no token exists for the user
         """
         try:
-            db_ponto_token = DjangoPontoToken.objects.filter(user=user).first()
+            db_ponto_token = self._queryset(select_related, prefetch_related).filter(user=user).first()
             if db_ponto_token is None:
                 raise ObjectDoesNotExist("PontoToken not found")
             return self._to_domain(db_ponto_token)
         except ObjectDoesNotExist as exc:
             raise PontoTokenNotFoundError(f"PontoToken not found with User {user}") from exc
 
-    def update_by_user(self, user, data) -> DomainPontoToken:
+    def get_by_users(self, users: Iterable) -> Dict[int, DomainPontoToken]:
+        """Retrieve the PontoToken of each user in one query."""
+        return {
+            db_ponto_token.user_id: self._to_domain(db_ponto_token)
+            for db_ponto_token in self._queryset().filter(user__in=users)
+        }
+
+    def update_by_user(self, user, data: PontoTokenUpdate) -> DomainPontoToken:
         """Update an existing PontoToken.
 
         Args:
             user (User): User instance performing the update
-            data (dict): A dictionary containing the following keys:
+            data (PontoTokenUpdate): The token data with the following keys:
                 - access_token (str): The access token.
                 - refresh_token (str): The refresh token.
                 - expires_in (int): The expiration time in seconds.
@@ -585,6 +791,7 @@ class DjangoPontoTokenRepository(PontoTokenRepository):
             db_ponto_token.expires_in = data["expires_in"]
             # Save the changes to the database
             db_ponto_token.save()
+            self.invalidate_cache(user)
             return self._to_domain(db_ponto_token)
         except ObjectDoesNotExist as exc:
             raise InvalidPontoTokenError(f"PontoToken with user {user} not found") from exc
@@ -602,14 +809,74 @@ class DjangoPontoTokenRepository(PontoTokenRepository):
             PontoTokenNotFoundError: If no token exists for the user
             PontoTokenDecryptionError: If there's an error decrypting the token
         """
+        access_token = _get_cached_token(user)
+        if access_token is not None:
+            return access_token
+
+        db_ponto_token = self._queryset().filter(user=user).first()
+        if db_ponto_token is None:
+            raise PontoTokenNotFoundError(f"No token found for user {user}")
+        return self._decrypt_and_cache(user, db_ponto_token)
+
+    def _decrypt_and_cache(self, user, db_ponto_token: DjangoPontoToken) -> str:
+        """Decrypt the access token of a token row and cache it.
+
+        Raises:
+            PontoTokenDecryptionError: If the token cannot be decrypted
+        """
         from integrations.providers.ponto import PontoProvider
 
         try:
-            ponto_token = self.get_by_user(user=user)
-            if ponto_token is None:
-                raise PontoTokenNotFoundError(f"No token found for user {user}")
-            return PontoProvider.decrypt_token(ponto_token.access_token)
-        except ObjectDoesNotExist:
-            raise PontoTokenNotFoundError(f"No token found for user {user}")
+            access_token = PontoProvider.decrypt_token(db_ponto_token.access_token)
         except Exception as e:
             raise PontoTokenDecryptionError(f"Error decrypting token: {str(e)}") from e
+
+        _cache_token(user, access_token, db_ponto_token)
+        return access_token
+
+    def invalidate_cache(self, user) -> None:
+        """Drop the cached decrypted access token of a user, if any.
+
+        Args:
+            user: The user whose token changed
+        """
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE.pop(getattr(user, "pk", user), None)
+
+    async def aget_by_user(
+        self,
+        user,
+        select_related: Tuple[str, ...] = (),
+        prefetch_related: Tuple[str, ...] = (),
+    ) -> DomainPontoToken:
+        """Async variant of get_by_user."""
+        db_ponto_token = await self._queryset(select_related, prefetch_related).filter(user=user).afirst()
+        if db_ponto_token is None:
+            raise PontoTokenNotFoundError(f"PontoToken not found with User {user}")
+        return self._to_domain(db_ponto_token)
+
+    async def aupdate_by_user(self, user, data: PontoTokenUpdate) -> DomainPontoToken:
+        """Async variant of update_by_user, writing only the token columns."""
+        db_ponto_token = await self._queryset().filter(user=user).afirst()
+        if db_ponto_token is None:
+            raise PontoTokenNotFoundError(f"PontoToken with user {user} not found")
+
+        db_ponto_token.access_token = data["access_token"]
+        db_ponto_token.refresh_token = data["refresh_token"]
+        db_ponto_token.expires_in = data["expires_in"]
+        await db_ponto_token.asave(
+            update_fields=["access_token", "refresh_token", "expires_in", "updated_at"]
+        )
+        self.invalidate_cache(user)
+        return self._to_domain(db_ponto_token)
+
+    async def aget_decrypted_access_token(self, user) -> str:
+        """Async variant of get_decrypted_access_token, sharing its cache."""
+        access_token = _get_cached_token(user)
+        if access_token is not None:
+            return access_token
+
+        db_ponto_token = await self._queryset().filter(user=user).afirst()
+        if db_ponto_token is None:
+            raise PontoTokenNotFoundError(f"No token found for user {user}")
+        return self._decrypt_and_cache(user, db_ponto_token)
@@ -0,0 +1,73 @@
+from django.core.cache import cache
+from django.test import TestCase
+from domain.models.account import Account
+from infrastructure.django.models.account import Account as DjangoAccount
+from infrastructure.django.repositories.account_repository import (
+    CachingAccountRepository,
+    DjangoAccountRepository,
+)
+
+
+class TestCachingAccountRepository(TestCase):
+    """Test cases for CachingAccountRepository"""
+
+    def setUp(self):
+        """Create test account repository and test user"""
+        cache.clear()
+        self.repository = CachingAccountRepository(DjangoAccountRepository())
+        self.test_user = DjangoAccount.objects.create_user(
+            id=1, username="abdul", email="abdul@example.com", password="password123"
+        )
+
+    def test_find_by_id_is_cached(self):
+        """Test a looked up account is served from the cache"""
+        self.repository.find_by_id(1)
+        DjangoAccount.objects.filter(id=1).update(first_name="Changed")
+
+        account = self.repository.find_by_id(1)
+
+        self.assertEqual(account.first_name, "")
+
+    def test_save_invalidates_cached_lookups(self):
+        """Test saving an account drops its cached ID and username lookups"""
+        account = self.repository.find_by_id(1)
+        self.repository.find_by_username("abdul")
+        account.username = "abdul2"
+
+        self.repository.save(account)
+
+        self.assertEqual(self.repository.find_by_id(1).username, "abdul2")
+        self.assertIsNone(self.repository.find_by_username("abdul"))
+        self.assertEqual(self.repository.find_by_username("abdul2").id, 1)
+
+    def test_save_invalidates_missing_account_lookups(self):
+        """Test registering an account drops the cached 'unused' email and username"""
+        self.assertEqual(self.repository.find_by_email_or_username("new@example.com", "new"), (None, None))
+
+        new_account = Account(id=None, username="new", email="new@example.com", password="password123")
+        self.repository.save(new_account)
+
+        by_email, by_username = self.repository.find_by_email_or_username("new@example.com", "new")
+        self.assertEqual(by_email.username, "new")
+        self.assertEqual(by_username.email, "new@example.com")
+
+    def test_authenticate_by_identifier(self):
+        """Test authenticating by username or email reports the failure reason"""
+        account, reason = self.repository.authenticate_by_identifier("abdul@example.com", "password123")
+        self.assertEqual(account.id, 1)
+        self.assertEqual(reason, "")
+
+        self.assertEqual(
+            self.repository.authenticate_by_identifier("abdul", "wrong"), (None, "invalid_credentials")
+        )
+        self.assertEqual(
+            self.repository.authenticate_by_identifier("nobody", "password123"), (None, "not_found")
+        )
+
+    def test_cached_account_has_no_password_hash(self):
+        """Test accounts put in the cache do not carry the stored password hash"""
+        self.repository.find_by_id(1)
+
+        cached = cache.get(CachingAccountRepository._id_key(1))
+
+        self.assertNotIn(self.test_user.password, vars(cached).values())
@@ -3,9 +3,10 @@ from domain.models.invoice import Invoice as DomainInvoice
 from infrastructure.django.models.invoice import Invoice as DjangoInvoice
 from infrastructure.django.repositories.invoice_repository import DjangoInvoiceRepository
 from decimal import Decimal
-from datetime import date
+from datetime import date, timedelta
 from django.contrib.auth import get_user_model
 from domain.models.invoice import BuyerInfo, SellerInfo, PaymentInfo, FileInfo
+from domain.models.value_objects import InvoiceStatus
 
 
 class TestInvoiceRepository(TestCase):
@@ -15,7 +16,21 @@ class TestInvoiceRepository(TestCase):
         """Create test invoice repository and test user"""
         self.repository = DjangoInvoiceRepository()
         User = get_user_model()
-        self.test_user = User.objects.create_user(id=1, username="abdul", password="password123")
+        self.test_user = User.objects.create_user(
+            id=1, username="abdul", email="abdul@example.com", password="password123"
+        )
+
+    def _create_invoice(self, invoice_number, due_date=None, file=None):
+        """Build a new domain invoice for the tests"""
+        return DomainInvoice.create(
+            invoice_number=invoice_number,
+            total_amount=Decimal("100.50"),
+            due_date=due_date or date.today(),
+            buyer=BuyerInfo(name="Test Buyer"),
+            seller=SellerInfo(name="Test Vendor"),
+            payment=PaymentInfo(total_amount=Decimal("100.50")),
+            file=file or FileInfo(path="test_file.pdf"),
+        )
 
     def test_save_invoice(self):
         """Test saving an invoice in the repository"""
@@ -40,3 +55,83 @@ class TestInvoiceRepository(TestCase):
 
         db_invoice = DjangoInvoice.objects.get(invoice_number="INV-12345")
         self.assertIsNotNone(db_invoice)
+
+    def test_get_by_content_hash_is_scoped_to_user(self):
+        """Test a file hash only matches invoices uploaded by the same user"""
+        other_user = get_user_model().objects.create_user(
+            id=2, username="other", email="other@example.com", password="password123"
+        )
+        invoice = self._create_invoice("INV-HASH", file=FileInfo(path="hash.pdf", content_hash="abc123"))
+        self.repository.save(invoice, user_id=1)
+
+        duplicate = self.repository.get_by_content_hash("abc123", user_id=1)
+
+        self.assertIsNotNone(duplicate)
+        self.assertEqual(duplicate.invoice_number, "INV-HASH")
+        self.assertIsNone(self.repository.get_by_content_hash("abc123", user_id=other_user.id))
+        self.assertIsNone(self.repository.get_by_content_hash("unknown", user_id=1))
+
+    def test_bulk_save_invoices(self):
+        """Test saving several new invoices at once assigns their IDs"""
+        invoices = [self._create_invoice(f"INV-BULK-{index}") for index in range(3)]
+
+        saved_invoices = self.repository.bulk_save(invoices, user_id=1)
+
+        self.assertEqual(len(saved_invoices), 3)
+        self.assertTrue(all(invoice.id is not None for invoice in saved_invoices))
+        self.assertEqual(DjangoInvoice.objects.filter(invoice_number__startswith="INV-BULK-").count(), 3)
+
+    def test_save_many_creates_and_updates(self):
+        """Test save_many inserts new invoices and updates existing ones in place"""
+        existing = self.repository.save(self._create_invoice("INV-EXISTING"), user_id=1)
+        existing.file = FileInfo(path="updated.pdf", content_hash="def456")
+        new_invoice = self._create_invoice("INV-NEW")
+
+        self.repository.save_many([existing, new_invoice], user_id=1)
+
+        self.assertIsNotNone(new_invoice.id)
+        self.assertEqual(DjangoInvoice.objects.count(), 2)
+        db_invoice = DjangoInvoice.objects.get(id=existing.id)
+        self.assertEqual(db_invoice.file_path, "updated.pdf")
+        self.assertEqual(db_invoice.content_hash, "def456")
+
+    def test_get_by_numbers(self):
+        """Test looking up several invoices by number in one call"""
+        self.repository.bulk_save([self._create_invoice("INV-A"), self._create_invoice("INV-B")], user_id=1)
+
+        invoices = self.repository.get_by_numbers(["INV-A", "INV-B", "INV-MISSING"])
+
+        self.assertEqual(set(invoices), {"INV-A", "INV-B"})
+
+    def test_bulk_update_status(self):
+        """Test updating the status of several invoices at once"""
+        saved_invoices = self.repository.bulk_save(
+            [self._create_invoice("INV-PAID-1"), self._create_invoice("INV-PAID-2")], user_id=1
+        )
+
+        updated = self.repository.bulk_update_status(
+            [invoice.id for invoice in saved_invoices], InvoiceStatus.PAID.value
+        )
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(DjangoInvoice.objects.filter(status=InvoiceStatus.PAID.value).count(), 2)
+
+    def test_bulk_mark_overdue(self):
+        """Test only pending invoices past their due date are marked overdue"""
+        today = date.today()
+        past_due, not_due, paid = self.repository.bulk_save(
+            [
+                self._create_invoice("INV-PAST-DUE", due_date=today - timedelta(days=1)),
+                self._create_invoice("INV-NOT-DUE", due_date=today + timedelta(days=1)),
+                self._create_invoice("INV-PAID", due_date=today - timedelta(days=1)),
+            ],
+            user_id=1,
+        )
+        self.repository.bulk_update_status([paid.id], InvoiceStatus.PAID.value)
+
+        updated = self.repository.bulk_mark_overdue(as_of=today)
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(DjangoInvoice.objects.get(id=past_due.id).status, InvoiceStatus.OVERDUE.value)
+        self.assertEqual(DjangoInvoice.objects.get(id=not_due.id).status, InvoiceStatus.PENDING.value)
+        self.assertEqual(DjangoInvoice.objects.get(id=paid.id).status, InvoiceStatus.PAID.value)
@@ -0,0 +1,283 @@
+from datetime import timedelta
+from decimal import Decimal
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from domain.models.ponto import IbanityAccount as DomainIbanityAccount
+from domain.models.ponto import PontoToken as DomainPontoToken
+from infrastructure.django.models.ponto import IbanityAccount as DjangoIbanityAccount
+from infrastructure.django.models.ponto import PontoToken as DjangoPontoToken
+from infrastructure.django.repositories.ponto_repository import (
+    DjangoIbanityAccountRepository,
+    DjangoPontoTokenRepository,
+)
+from integrations.providers.ponto import PontoProvider
+
+
+class TestIbanityAccountRepository(TestCase):
+    """Test cases for DjangoIbanityAccountRepository"""
+
+    def setUp(self):
+        """Create test Ibanity account repository and test user"""
+        self.repository = DjangoIbanityAccountRepository()
+        User = get_user_model()
+        self.test_user = User.objects.create_user(
+            id=1, username="abdul", email="abdul@example.com", password="password123"
+        )
+
+    def _account_data(self, **overrides):
+        """Build the data of an Ibanity account, without its user and account_id"""
+        return {
+            "description": "Main account",
+            "product": "Current account",
+            "reference": "BE68539007547034",
+            "currency": "EUR",
+            "authorization_expiration_expected_at": timezone.now() + timedelta(days=30),
+            "current_balance": Decimal("100.50"),
+            "available_balance": Decimal("100.50"),
+            "subtype": "checking",
+            "holder_name": "Test Holder",
+            "resource_id": "resource-1",
+            **overrides,
+        }
+
+    def _create_account(self, account_id, **overrides):
+        """Build a new domain Ibanity account owned by the test user"""
+        return DomainIbanityAccount.create(
+            user=self.test_user, account_id=account_id, **self._account_data(**overrides)
+        )
+
+    def test_save_keeps_the_database_id(self):
+        """Test a saved account carries the ID of its row"""
+        saved_account = self.repository.save(self._create_account("account-1"))
+
+        self.assertEqual(saved_account.id, DjangoIbanityAccount.objects.get(account_id="account-1").id)
+        self.assertEqual(saved_account.current_balance, Decimal("100.50"))
+
+    def test_bulk_save_inserts_and_overwrites(self):
+        """Test bulk_save inserts new accounts and overwrites those with a known account_id"""
+        self.repository.save(self._create_account("account-1"))
+
+        saved_accounts = self.repository.bulk_save(
+            [
+                self._create_account("account-1", description="Renamed"),
+                self._create_account("account-2"),
+            ]
+        )
+
+        self.assertEqual([account.account_id for account in saved_accounts], ["account-1", "account-2"])
+        self.assertEqual(DjangoIbanityAccount.objects.count(), 2)
+        self.assertEqual(DjangoIbanityAccount.objects.get(account_id="account-1").description, "Renamed")
+
+    def test_bulk_update_by_account_id(self):
+        """Test updating several accounts by account_id at once"""
+        self.repository.bulk_save([self._create_account("account-1"), self._create_account("account-2")])
+
+        updated_accounts = self.repository.bulk_update_by_account_id(
+            {
+                "account-1": self._account_data(current_balance=Decimal("1.00")),
+                "account-2": self._account_data(current_balance=Decimal("2.00")),
+            }
+        )
+
+        self.assertEqual(
+            {account.account_id: account.current_balance for account in updated_accounts},
+            {"account-1": Decimal("1.00"), "account-2": Decimal("2.00")},
+        )
+        self.assertEqual(
+            DjangoIbanityAccount.objects.get(account_id="account-2").current_balance, Decimal("2.00")
+        )
+
+
+    def test_get_by_users(self):
+        """Test looking up the newest account of several users in one call"""
+        other_user = get_user_model().objects.create_user(
+            id=2, username="other", email="other@example.com", password="password123"
+        )
+        self.repository.save(self._create_account("account-1"))
+        DjangoIbanityAccount.objects.filter(account_id="account-1").update(
+            created_at=timezone.now() - timedelta(days=1)
+        )
+        newest = self.repository.save(self._create_account("account-2"))
+
+        accounts = self.repository.get_by_users([self.test_user, other_user])
+
+        self.assertEqual(list(accounts), [self.test_user.id])
+        self.assertEqual(accounts[self.test_user.id].id, newest.id)
+
+
+    def test_get_or_create_reports_created_and_updated(self):
+        """Test get_or_create only writes an existing account when its data changed"""
+        data = self._account_data()
+        account, created, updated = self.repository.get_or_create(self.test_user, "account-1", data)
+        self.assertEqual((created, updated), (True, False))
+
+        same, created, updated = self.repository.get_or_create(self.test_user, "account-1", data)
+        self.assertEqual((same.id, created, updated), (account.id, False, False))
+
+        changed, created, updated = self.repository.get_or_create(
+            self.test_user, "account-1", {**data, "description": "Renamed"}
+        )
+        self.assertEqual((changed.description, created, updated), ("Renamed", False, True))
+
+    def test_process_accounts_data(self):
+        """Test raw Ponto API account data is stored as an Ibanity account"""
+        accounts_data = {
+            "data": [
+                {
+                    "id": "account-1",
+                    "attributes": {
+                        "description": "Main account",
+                        "product": "Current account",
+                        "reference": "BE68539007547034",
+                        "currency": "EUR",
+                        "authorizationExpirationExpectedAt": "2099-01-01T00:00:00.000Z",
+                        "currentBalance": 100.5,
+                        "availableBalance": 100.5,
+                        "subtype": "checking",
+                        "holderName": "Test Holder",
+                    },
+                    "meta": {"latestSynchronization": {"attributes": {"resourceId": "resource-1"}}},
+                }
+            ]
+        }
+
+        account = self.repository.process_accounts_data(self.test_user, accounts_data)
+
+        self.assertEqual(account.account_id, "account-1")
+        self.assertEqual(account.id, DjangoIbanityAccount.objects.get(account_id="account-1").id)
+        self.assertEqual(
+            DjangoIbanityAccount.objects.get(account_id="account-1").current_balance, Decimal("100.50")
+        )
+
+
+    def test_get_by_id_with_fields_projection(self):
+        """Test a fields projection loads only the requested columns, in one query"""
+        saved_account = self.repository.save(self._create_account("account-1"))
+
+        with self.assertNumQueries(1):
+            account = self.repository.get_by_id(saved_account.id, fields=["current_balance", "currency"])
+
+        self.assertEqual(account.id, saved_account.id)
+        self.assertEqual(account.current_balance, Decimal("100.50"))
+        self.assertEqual(account.currency, "EUR")
+        self.assertIsNone(account.description)
+        self.assertIsNone(account.account_id)
+
+
+class TestPontoTokenRepository(TestCase):
+    """Test cases for the decrypted access token cache of DjangoPontoTokenRepository"""
+
+    def setUp(self):
+        """Create test Ponto token repository, test user and its token"""
+        self.repository = DjangoPontoTokenRepository()
+        User = get_user_model()
+        self.test_user = User.objects.create_user(id=1, username="abdul", password="password123")
+        self.repository.invalidate_cache(self.test_user)
+        self.repository.save(self._create_token("access-1", "refresh-1"), self.test_user)
+
+    def _create_token(self, access_token, refresh_token):
+        """Build a domain token holding the encrypted tokens"""
+        return DomainPontoToken.create(
+            user=self.test_user,
+            access_token=PontoProvider.encrypt_token(access_token),
+            refresh_token=PontoProvider.encrypt_token(refresh_token),
+            expires_in=3600,
+        )
+
+    def test_decrypted_access_token_is_cached(self):
+        """Test the decrypted access token is served from the cache"""
+        self.assertEqual(self.repository.get_decrypted_access_token(self.test_user), "access-1")
+        DjangoPontoToken.objects.filter(user=self.test_user).update(
+            access_token=PontoProvider.encrypt_token("access-2")
+        )
+
+        self.assertEqual(self.repository.get_decrypted_access_token(self.test_user), "access-1")
+
+    def test_update_by_user_invalidates_cache(self):
+        """Test updating the token drops the cached access token"""
+        self.repository.get_decrypted_access_token(self.test_user)
+
+        self.repository.update_by_user(
+            self.test_user,
+            {
+                "access_token": PontoProvider.encrypt_token("access-2"),
+                "refresh_token": PontoProvider.encrypt_token("refresh-2"),
+                "expires_in": 3600,
+            },
+        )
+
+        self.assertEqual(self.repository.get_decrypted_access_token(self.test_user), "access-2")
+
+    def test_save_invalidates_cache(self):
+        """Test saving a new token drops the cached access token"""
+        self.repository.get_decrypted_access_token(self.test_user)
+        DjangoPontoToken.objects.filter(user=self.test_user).delete()
+
+        self.repository.save(self._create_token("access-3", "refresh-3"), self.test_user)
+
+        self.assertEqual(self.repository.get_decrypted_access_token(self.test_user), "access-3")
+
+    def test_expired_access_token_is_not_cached(self):
+        """Test a token past its lifetime is decrypted again on every call"""
+        DjangoPontoToken.objects.filter(user=self.test_user).update(
+            updated_at=timezone.now() - timedelta(seconds=3600)
+        )
+        self.assertEqual(self.repository.get_decrypted_access_token(self.test_user), "access-1")
+        DjangoPontoToken.objects.filter(user=self.test_user).update(
+            access_token=PontoProvider.encrypt_token("access-2")
+        )
+
+        self.assertEqual(self.repository.get_decrypted_access_token(self.test_user), "access-2")
+
+    def test_get_by_user_keeps_the_database_id(self):
+        """Test the domain token carries the ID of its row"""
+        ponto_token = self.repository.get_by_user(self.test_user)
+
+        self.assertEqual(ponto_token.id, DjangoPontoToken.objects.get(user=self.test_user).id)
+
+    def test_get_by_users(self):
+        """Test looking up the tokens of several users in one call"""
+        other_user = get_user_model().objects.create_user(
+            id=2, username="other", email="other@example.com", password="password123"
+        )
+
+        tokens = self.repository.get_by_users([self.test_user, other_user])
+
+        self.assertEqual(list(tokens), [self.test_user.id])
+        self.assertEqual(PontoProvider.decrypt_token(tokens[self.test_user.id].access_token), "access-1")
+
+    def test_get_or_create_by_user_reports_updates(self):
+        """Test get_or_create_by_user updates a changed token and drops the cached access token"""
+        self.repository.get_decrypted_access_token(self.test_user)
+        defaults = {
+            "access_token": PontoProvider.encrypt_token("access-2"),
+            "refresh_token": PontoProvider.encrypt_token("refresh-2"),
+            "expires_in": 3600,
+        }
+
+        ponto_token, created, updated = self.repository.get_or_create_by_user(self.test_user, defaults)
+
+        self.assertEqual((created, updated), (False, True))
+        self.assertEqual(ponto_token.access_token, defaults["access_token"])
+        self.assertEqual(self.repository.get_decrypted_access_token(self.test_user), "access-2")
+
+    def test_async_variants(self):
+        """Test the async get, update and decrypt methods share the token cache"""
+        aget_decrypted_access_token = async_to_sync(self.repository.aget_decrypted_access_token)
+        ponto_token = async_to_sync(self.repository.aget_by_user)(self.test_user)
+        self.assertEqual(ponto_token.id, DjangoPontoToken.objects.get(user=self.test_user).id)
+        self.assertEqual(aget_decrypted_access_token(self.test_user), "access-1")
+
+        async_to_sync(self.repository.aupdate_by_user)(
+            self.test_user,
+            {
+                "access_token": PontoProvider.encrypt_token("access-2"),
+                "refresh_token": PontoProvider.encrypt_token("refresh-2"),
+                "expires_in": 3600,
+            },
+        )
+
+        self.assertEqual(aget_decrypted_access_token(self.test_user), "access-2")
+        self.assertEqual(self.repository.get_decrypted_access_token(self.test_user), "access-2")
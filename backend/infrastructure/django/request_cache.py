@@ -0,0 +1,67 @@
+"""Request-scoped memoization for repository lookups.
+
+A single API request often resolves the same row several times, e.g. the
+current account in both the view and a service. RequestCacheMiddleware opens
+a per-thread cache for the duration of each request, and repository methods
+decorated with request_memoize reuse results from it. Outside a request (for
+example in management commands) no cache is active and calls go straight to
+the database.
+"""
+
+from functools import wraps
+from threading import local
+from typing import Any, Callable, Hashable
+
+_state = local()
+
+
+def _active_cache():
+    """Return the cache of the current request, or None outside a request."""
+    return getattr(_state, "cache", None)
+
+
+def request_memoize(namespace: str) -> Callable:
+    """Memoize a single-key repository method for the current request.
+
+    Results are cached under (namespace, key), where key is the first
+    positional argument after self.
+
+    Args:
+        namespace: Name separating this method's keys from other entries
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, key: Hashable, *args, **kwargs) -> Any:
+            cache = _active_cache()
+            if cache is None or args or kwargs:
+                return method(self, key, *args, **kwargs)
+            cache_key = (namespace, key)
+            if cache_key not in cache:
+                cache[cache_key] = method(self, key)
+            return cache[cache_key]
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_request_cache(namespace: str, key: Hashable) -> None:
+    """Drop a memoized entry, e.g. after the underlying row was saved."""
+    cache = _active_cache()
+    if cache is not None:
+        cache.pop((namespace, key), None)
+
+
+class RequestCacheMiddleware:
+    """Open a fresh request cache per request and discard it afterwards."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        _state.cache = {}
+        try:
+            return self.get_response(request)
+        finally:
+            del _state.cache
@@ -14,13 +14,16 @@ from domain.repositories.interfaces.storage_repository import (
 )
 from django.core.files.uploadedfile import UploadedFile
 from logging import getLogger
-from typing import BinaryIO, Union, Optional, Tuple, Dict, Any
+from typing import BinaryIO, Iterable, List, Union, Optional, Tuple, Dict, Any
 import shutil
 import json
 
 # Module-level logger
 logger = getLogger(__name__)
 
+# Chunk size used when streaming plain file objects to disk
+WRITE_CHUNK_SIZE = 1024 * 1024
+
 
 class FileStorageService:
     """Service for handling file system operations.
@@ -98,8 +101,8 @@ class FileStorageService:
                     for chunk in file.chunks():
                         destination.write(chunk)
                 else:
-                    # Standard BinaryIO
-                    destination.write(file.read())
+                    # Standard BinaryIO, streamed to avoid buffering the whole file
+                    shutil.copyfileobj(file, destination, WRITE_CHUNK_SIZE)
 
             logger.info("File written successfully to: %s", filepath)
 
@@ -135,6 +138,29 @@ class FileStorageService:
             logger.error("Failed to move file: %s", str(e))
             raise StorageError(f"Failed to move file: {str(e)}") from e
 
+    def copy_file(self, source_path: Path, target_path: Path) -> None:
+        """Copy a file from source to target path.
+
+        The copy is independent of the source, so changing or deleting one
+        never affects the other.
+
+        Args:
+            source_path: Full path to the source file
+            target_path: Full path to the target destination
+
+        Raises:
+            StorageError: If the copy operation fails
+        """
+        try:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source_path, target_path)
+
+            logger.info("File copied successfully from %s to %s", source_path, target_path)
+
+        except Exception as e:
+            logger.error("Failed to copy file: %s", str(e))
+            raise StorageError(f"Failed to copy file: {str(e)}") from e
+
     def delete_file(self, filepath: Path) -> None:
         """Delete a file from the file system.
 
@@ -182,7 +208,12 @@ class FileStorage(StorageRepository):
         logger.debug("FileStorage repository initialized")
 
     def save_file(
-        self, file: Union[BinaryIO, UploadedFile], identifier: str, metadata: Optional[Dict[str, Any]] = None
+        self,
+        file: Union[BinaryIO, UploadedFile],
+        identifier: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        size_hint: Optional[int] = None,
+        content_type: Optional[str] = None,
     ) -> str:
         """
         Save an invoice file to the storage system.
@@ -194,6 +225,8 @@ class FileStorage(StorageRepository):
             file: The invoice file to store
             identifier: The identifier for the file
             metadata: Optional metadata to associate with the file
+            size_hint: Unused; the file is always streamed to disk in chunks
+            content_type: Unused; the type follows from the file extension
 
         Returns:
             str: The relative path where the file was stored (for db storage)
@@ -233,6 +266,24 @@ class FileStorage(StorageRepository):
             logger.error("Repository failed to save file: %s", str(e))
             raise StorageError(f"Failed to save file: {str(e)}") from e
 
+    def save_files(self, items: Iterable[Tuple[Union[BinaryIO, UploadedFile], str]]) -> List[str]:
+        """
+        Save several invoice files to the storage system.
+
+        Local writes gain nothing from concurrency, so files are written one
+        after the other through save_file.
+
+        Args:
+            items: (file, identifier) pairs to store
+
+        Returns:
+            List[str]: The relative paths where the files were stored
+
+        Raises:
+            StorageError: If any file cannot be saved
+        """
+        return [self.save_file(file, identifier) for file, identifier in items]
+
     def move_file(self, source_identifier: str, target_identifier: str) -> str:
         """
         Move a file from one location to another within the storage system.
@@ -296,6 +347,48 @@ class FileStorage(StorageRepository):
             logger.error("Repository failed to move file: %s", str(e))
             raise StorageError(f"Failed to move file: {str(e)}") from e
 
+    def copy_file(self, source_identifier: str, target_identifier: str) -> str:
+        """
+        Copy a file to another location within the storage system.
+
+        Args:
+            source_identifier: The relative path of the source file
+            target_identifier: The identifier to use for the copy
+
+        Returns:
+            str: Relative path of the copy
+
+        Raises:
+            StorageError: If file cannot be copied
+        """
+        try:
+            source_full_path = self.storage_service.get_full_path(source_identifier)
+            (
+                target_relative_path,
+                target_full_path,
+            ) = self.storage_service.generate_storage_path(target_identifier, Path(source_identifier).name)
+
+            self.storage_service.copy_file(source_full_path, target_full_path)
+
+            # Copy metadata file if it exists
+            metadata_path = source_full_path.with_suffix(source_full_path.suffix + ".meta")
+            if metadata_path.exists():
+                try:
+                    target_metadata_path = target_full_path.with_suffix(target_full_path.suffix + ".meta")
+                    shutil.copy2(metadata_path, target_metadata_path)
+                except Exception as meta_error:
+                    logger.warning(
+                        "Non-critical error: Failed to copy metadata file for %s: %s",
+                        source_identifier,
+                        str(meta_error),
+                    )
+
+            return target_relative_path
+
+        except Exception as e:
+            logger.error("Repository failed to copy file: %s", str(e))
+            raise StorageError(f"Failed to copy file: {str(e)}") from e
+
     def get_file_path(self, relative_path: str) -> Path:
         """
         Get the full system path for a stored file.
@@ -312,6 +405,26 @@ class FileStorage(StorageRepository):
         logger.debug("Getting file path for: %s", relative_path)
         return self.storage_service.get_full_path(relative_path)
 
+    def get_file_stream(self, relative_path: str) -> BinaryIO:
+        """
+        Open a stored file for reading.
+
+        Args:
+            relative_path: The path relative to base directory
+
+        Returns:
+            BinaryIO: The file opened in binary read mode
+
+        Raises:
+            StorageError: If the file cannot be opened
+        """
+        full_path = self.storage_service.get_full_path(relative_path)
+        try:
+            return full_path.open("rb")
+        except OSError as e:
+            logger.error("Failed to open file %s: %s", full_path, str(e))
+            raise StorageError(f"Failed to open file: {str(e)}") from e
+
     def get_file_metadata(self, relative_path: str) -> Dict[str, Any]:
         """
         Retrieve metadata associated with a stored file.
@@ -423,3 +536,21 @@ class FileStorage(StorageRepository):
         except Exception as e:
             logger.error("Repository failed to delete file: %s", str(e))
             raise StorageError(f"Failed to delete file: {str(e)}") from e
+
+    def delete_files(self, file_paths: Iterable[str]) -> List[str]:
+        """
+        Delete several stored files.
+
+        Args:
+            file_paths: Relative paths to the files from base_dir
+
+        Returns:
+            List[str]: The relative paths that could not be deleted
+        """
+        failed = []
+        for file_path in file_paths:
+            try:
+                self.delete_file(file_path)
+            except StorageError:
+                failed.append(file_path)
+        return failed
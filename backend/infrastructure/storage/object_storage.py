@@ -7,6 +7,8 @@ storage, retrieval, and URL generation while maintaining proper file
 organization and access control.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike
 from pathlib import Path
 from datetime import datetime
 from django.conf import settings
@@ -16,13 +18,23 @@ from domain.exceptions import StorageError
 from domain.repositories.interfaces.storage_repository import (
     StorageRepository,
 )
-from typing import Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, Iterable, List, Optional, Tuple, Union
 import json
 import logging
 
 # Module-level logger
 logger = logging.getLogger(__name__)
 
+# Maximum number of concurrent uploads in save_files
+MAX_UPLOAD_CONCURRENCY = 10
+
+# Maximum number of keys accepted by a single S3 DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+
+# Files of known size below this are sent with a single PutObject request;
+# larger or unknown-size files use a streaming multipart upload
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+
 
 class ObjectStorage(StorageRepository):
     """
@@ -80,14 +92,28 @@ class ObjectStorage(StorageRepository):
 
         return s3_metadata
 
-    def save_file(self, file: str, identifier: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+    def save_file(
+        self,
+        file: Union[str, PathLike, BinaryIO],
+        identifier: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        size_hint: Optional[int] = None,
+        content_type: Optional[str] = None,
+    ) -> str:
         """
         Save a file to Digital Ocean Spaces with associated metadata.
 
+        Local paths are uploaded with boto3's managed transfer, which streams
+        from disk. File objects are sent with a single PutObject when
+        size_hint says they are small, and streamed as a multipart upload
+        otherwise, so the file is never read into memory as a whole.
+
         Args:
-            file: The file object to store
+            file: Path to the file, or the file object to store
             identifier: Unique identifier for the file
             metadata: Optional metadata to associate with the file (e.g., urgency level)
+            size_hint: Optional size of the file in bytes
+            content_type: Optional MIME type stored as the object's Content-Type
 
         Returns:
             str: Storage path or identifier for future retrieval
@@ -111,8 +137,16 @@ class ObjectStorage(StorageRepository):
                 if s3_metadata:
                     extra_args["Metadata"] = s3_metadata
                     logger.debug("Uploading file with metadata: %s", s3_metadata)
+            if content_type:
+                extra_args["ContentType"] = content_type
+
             # Upload file
-            self.client.upload_file(file, self.bucket, storage_path, ExtraArgs=extra_args)
+            if isinstance(file, (str, PathLike)):
+                self.client.upload_file(str(file), self.bucket, storage_path, ExtraArgs=extra_args)
+            elif size_hint is not None and size_hint < MULTIPART_THRESHOLD:
+                self.client.put_object(Bucket=self.bucket, Key=storage_path, Body=file, **extra_args)
+            else:
+                self.client.upload_fileobj(file, self.bucket, storage_path, ExtraArgs=extra_args)
             logger.info("File uploaded successfully to: %s", storage_path)
 
             return storage_path
@@ -121,6 +155,31 @@ class ObjectStorage(StorageRepository):
             logger.error(error_msg)
             raise StorageError(error_msg) from e
 
+    def save_files(self, items: Iterable[Tuple[BinaryIO, str]]) -> List[str]:
+        """
+        Save several files to Digital Ocean Spaces with concurrent uploads.
+
+        The boto3 client is thread-safe, so uploads run in a thread pool and
+        overlap their network round-trips instead of running back to back.
+
+        Args:
+            items: (file, identifier) pairs to store
+
+        Returns:
+            List[str]: Storage paths, in the same order as items
+
+        Raises:
+            StorageError: If any file cannot be saved
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_CONCURRENCY, len(items))) as executor:
+            futures = [executor.submit(self.save_file, file, identifier) for file, identifier in items]
+            # save_file already wraps failures in StorageError
+            return [future.result() for future in futures]
+
     def get_file_metadata(self, storage_path: str) -> Dict[str, Any]:
         """
         Retrieve metadata associated with a stored file.
@@ -258,6 +317,29 @@ class ObjectStorage(StorageRepository):
             logger.error(error_msg)
             raise StorageError(error_msg) from e
 
+    def get_file_stream(self, identifier: str) -> BinaryIO:
+        """
+        Open a stored file for reading without downloading it to disk.
+
+        Args:
+            identifier: The storage identifier returned by save_file
+
+        Returns:
+            BinaryIO: The streaming body of the object
+
+        Raises:
+            StorageError: If the file cannot be found or opened
+        """
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=identifier)["Body"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                error_msg = f"File not found in storage: {identifier}"
+            else:
+                error_msg = f"Failed to open file: {str(e)}"
+            logger.error(error_msg)
+            raise StorageError(error_msg) from e
+
     def delete_file(self, identifier: str) -> None:
         """
         Delete a stored file.
@@ -276,6 +358,37 @@ class ObjectStorage(StorageRepository):
             logger.error(error_msg)
             raise StorageError(error_msg) from e
 
+    def delete_files(self, identifiers: Iterable[str]) -> List[str]:
+        """
+        Delete several stored files with batched DeleteObjects requests.
+
+        Args:
+            identifiers: The storage identifiers returned by save_file
+
+        Returns:
+            List[str]: The identifiers that could not be deleted
+        """
+        identifiers = list(identifiers)
+        failed: List[str] = []
+        for start in range(0, len(identifiers), DELETE_BATCH_SIZE):
+            batch = identifiers[start:start + DELETE_BATCH_SIZE]
+            try:
+                response = self.client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except Exception as e:
+                logger.error("Failed to delete batch of %d files: %s", len(batch), str(e))
+                failed.extend(batch)
+                continue
+
+            for error in response.get("Errors", []):
+                logger.error("Failed to delete file %s: %s", error.get("Key"), error.get("Message"))
+                failed.append(error.get("Key"))
+
+        logger.info("Deleted %d of %d files", len(identifiers) - len(failed), len(identifiers))
+        return failed
+
     def move_file(self, source_identifier: str, target_identifier: str) -> str:
         """
         Move a file from one location to another within the storage system.
@@ -311,3 +424,35 @@ class ObjectStorage(StorageRepository):
             error_msg = f"Failed to move file: {str(e)}"
             logger.error(error_msg)
             raise StorageError(error_msg) from e
+
+    def copy_file(self, source_identifier: str, target_identifier: str) -> str:
+        """
+        Copy a file to another location using a server-side copy.
+
+        The managed copy issues CopyObject (or multipart UploadPartCopy for
+        objects over 5 GB), so no file data is transferred to the client.
+
+        Args:
+            source_identifier: The identifier of the source file
+            target_identifier: The identifier to use for the copy
+
+        Returns:
+            str: Storage identifier of the copy
+
+        Raises:
+            StorageError: If file cannot be copied
+        """
+        try:
+            source_ext = Path(source_identifier).suffix
+            year_month = datetime.now().strftime("%Y/%m")
+            target_path = f"invoices/{year_month}/{target_identifier}{source_ext}"
+
+            copy_source = {"Bucket": self.bucket, "Key": source_identifier}
+            self.client.copy(CopySource=copy_source, Bucket=self.bucket, Key=target_path)
+
+            logger.info("File copied from %s to %s", source_identifier, target_path)
+            return target_path
+        except Exception as e:
+            error_msg = f"Failed to copy file: {str(e)}"
+            logger.error(error_msg)
+            raise StorageError(error_msg) from e
@@ -1,4 +1,5 @@
 import logging
+import re
 import secrets
 import base64
 import ssl
@@ -21,13 +22,15 @@ from config.settings.base import (
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+_HAS_NONSPACE = re.compile(r"\S").search
+
 
 def is_empty(text: str) -> bool:
     """Check if a string is None, empty, or contains only whitespace."""
-    if text is None:
+    if not text:
         return True
-    has_no_content = not text.strip()
-    return has_no_content
+    # Scan for a non-whitespace character instead of allocating a stripped copy
+    return _HAS_NONSPACE(text) is None
 
 
 class PontoProvider:
@@ -5,14 +5,23 @@ converting the visual content of PDF documents into machine-readable text.
 """
 
 from pathlib import Path
+from typing import BinaryIO, Union
 import pytesseract  # type: ignore
 from pdf2image import convert_from_path
 import pdfplumber
 from logging import getLogger
+from config.settings.base import PDF_TEXT_BACKEND
 
 # Module-level logger
 logger = getLogger(__name__)
 
+# PyMuPDF is optional: without it, text extraction falls back to pdfplumber
+try:
+    import pymupdf  # type: ignore
+except ImportError:
+    pymupdf = None
+    logger.warning("pymupdf module not available, falling back to pdfplumber for text extraction")
+
 
 class OCRError(Exception):
     """
@@ -68,11 +77,28 @@ class OCRService:
             logger.error("Failed to extract text from PDF: %s", str(e))
             raise OCRError(f"Failed to extract text from PDF: {str(e)}") from e
 
-    def extract_text_from_pdf(self, pdf_path: Path) -> str:
-        """Extract text from a PDF file using pdfplumber."""
+    def extract_text_from_pdf(self, pdf_path: Union[Path, BinaryIO]) -> str:
+        """Extract text from a PDF file, or an open binary stream.
+
+        Uses PyMuPDF when it is installed and selected by the
+        BILLIFY_PDF_BACKEND setting (the default), pdfplumber otherwise.
+        """
+        if pymupdf is not None and PDF_TEXT_BACKEND == "pymupdf":
+            return self._extract_text_with_pymupdf(pdf_path)
+
         logger.info("Extracting text from PDF using pdfplumber: %s", pdf_path)
         text = ""
         with pdfplumber.open(pdf_path) as pdf:
             for page in pdf.pages:
                 text += page.extract_text() + "\n"
         return text.strip()
+
+    def _extract_text_with_pymupdf(self, pdf_path: Union[Path, BinaryIO]) -> str:
+        """Extract text from a PDF file, or an open binary stream, using PyMuPDF."""
+        logger.info("Extracting text from PDF using pymupdf: %s", pdf_path)
+        if isinstance(pdf_path, Path):
+            document = pymupdf.open(pdf_path)
+        else:
+            document = pymupdf.open(stream=pdf_path.read(), filetype="pdf")
+        with document:
+            return "\n".join(page.get_text("text") for page in document).strip()
@@ -0,0 +1,77 @@
+"""Process pool for CPU-bound PDF transformation.
+
+PDF text extraction and analysis are pure Python and hold the GIL, so
+transforming concurrent uploads on request threads serializes them. The pool
+runs transformations in separate worker processes instead; each worker builds
+its PDFTransformer once and reuses it for every task it receives.
+
+Under gunicorn (or uvicorn with several workers) every worker process gets a
+pool of its own. The pool is only created on the first upload, so it is never
+started in the master process and inherited by forked workers, which would
+break it. When a worker exits, shutdown_pdf_pool runs from an atexit hook
+and stops the pool's processes. A server hook such as gunicorn's worker_exit
+may also call it directly.
+"""
+
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from integrations.transformers.pdf.transformer import get_pdf_transformer
+
+# Worker processes; parsing gains little beyond a handful of cores
+PDF_POOL_WORKERS = min(os.cpu_count() or 1, 4)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = Lock()
+
+
+def _transform_bytes(content: bytes, file_name: str) -> Dict[str, Any]:
+    """Run in a worker process: transform a PDF with the worker's transformer."""
+    return get_pdf_transformer().transform_bytes(content, file_name)
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by the whole process, creating it on first use.
+
+    Workers are spawned rather than forked, since the web process may already
+    run threads (e.g. the storage upload pool) when the pool starts.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=PDF_POOL_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(shutdown_pdf_pool)
+        return _pool
+
+
+def shutdown_pdf_pool() -> None:
+    """Shut down the shared process pool, if it was started.
+
+    Waits for running transformations and drops queued ones. A later
+    submit_transform call starts a new pool.
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def submit_transform(content: bytes, file_name: str) -> Future:
+    """Transform an in-memory PDF in the pool.
+
+    Args:
+        content: The PDF file content
+        file_name: Original name of the file, used for the file metadata
+
+    Returns:
+        Future: Resolves to the extracted invoice data, or raises
+            PDFTransformationError like PDFTransformer.transform_bytes
+    """
+    return get_pdf_pool().submit(_transform_bytes, content, file_name)
@@ -4,8 +4,10 @@ import os
 import re
 import mimetypes
 from decimal import Decimal
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict, Union
 from integrations.transformers.pdf.ocr import OCRService, OCRError
 from integrations.transformers.pdf.text_analysis import TextAnalyzer, TextAnalysisError
 from datetime import date
@@ -34,11 +36,13 @@ class PDFTransformer:
         self.ocr_service = OCRService()
         self.text_analyzer = TextAnalyzer()
 
-    def transform(self, pdf_path: Path) -> Dict[str, Any]:
+    def transform(self, pdf: Union[Path, BinaryIO, bytes]) -> Dict[str, Any]:
         """Transform a PDF into structured invoice data.
 
         Args:
-            pdf_path: Path to the PDF file
+            pdf: Path to the PDF file, an open binary file or the PDF content.
+                Prefer passing the file or its content when the caller already
+                holds it, so the PDF is not read back from (remote) storage.
 
         Returns:
             Dict containing extracted invoice data
@@ -46,21 +50,51 @@ class PDFTransformer:
         Raises:
             PDFTransformationError: If the PDF cannot be processed or data extraction fails
         """
-        try:
-            logger.info("Starting PDF transformation for: %s", pdf_path)
+        if isinstance(pdf, bytes):
+            return self.transform_bytes(pdf, "UNKNOWN")
+        if not isinstance(pdf, Path):
+            file_name = Path(getattr(pdf, "name", None) or "UNKNOWN").name
+            return self.transform_bytes(pdf.read(), file_name)
+
+        logger.info("Starting PDF transformation for: %s", pdf)
+        return self._transform(pdf, self.extract_file_metadata(pdf))
+
+    def transform_bytes(self, content: bytes, file_name: str) -> Dict[str, Any]:
+        """Transform an in-memory PDF into structured invoice data.
+
+        Same as transform, but reads the PDF from memory so callers holding
+        the upload do not need to write it to disk first.
+
+        Args:
+            content: The PDF file content
+            file_name: Original name of the file, used for the file metadata
+
+        Returns:
+            Dict containing extracted invoice data
 
+        Raises:
+            PDFTransformationError: If the PDF cannot be processed or data extraction fails
+        """
+        logger.info("Starting PDF transformation for in-memory file: %s", file_name)
+        file_metadata = {
+            "file_size": len(content),
+            "file_name": file_name,
+            "file_type": mimetypes.guess_type(file_name)[0] or "application/pdf",
+        }
+        return self._transform(BytesIO(content), file_metadata)
+
+    def _transform(self, source: Union[Path, BinaryIO], file_metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the OCR, analysis and standardization steps on a PDF source."""
+        try:
             # Step 1: Extract text using OCR
-            text_content = self.ocr_service.extract_text_from_pdf(pdf_path)
+            text_content = self.ocr_service.extract_text_from_pdf(source)
             logger.debug("Extracted text:\n%s", text_content)
 
             # Step 2: Analyze text to extract fields
             raw_data = self.text_analyzer.extract_fields(text_content)
             logger.debug("Extracted raw data:\n%s", raw_data)
 
-            # Step 3: Extract file metadata (size, type, name)
-            file_metadata = self.extract_file_metadata(pdf_path)
-
-            # Step 4: Standardize extracted invoice data
+            # Step 3: Standardize extracted invoice data
             standardized = self._standardize_data(raw_data, file_metadata)
             logger.info("Standardized data:\n%s", standardized)
 
@@ -173,8 +207,7 @@ class PDFTransformer:
                         logger.warning("Failed to parse date using dateutil: %s - %s", due_date, str(e))
 
             standardized: Dict[str, Any] = {
-                # File metadata
-                "file_path": file_metadata.get("file_name", "UNKNOWN"),
+                # File metadata; where the file is stored is up to the caller
                 "file_size": file_metadata.get("file_size"),
                 "file_type": file_metadata.get("file_type"),
                 # Default values for required fields
@@ -228,3 +261,14 @@ class PDFTransformer:
         if not isinstance(data.get("due_date"), date):
             logger.error("Invalid due date: %s", data.get("due_date"))
             raise PDFTransformationError("Invoice must have a valid due date")
+
+
+@lru_cache(maxsize=None)
+def get_pdf_transformer() -> PDFTransformer:
+    """Return the PDFTransformer shared by the whole process.
+
+    Building a transformer sets up the OCR service and the text analyzer's
+    pattern table. Neither keeps state between transform calls, so a single
+    instance is safe to share across requests and threads.
+    """
+    return PDFTransformer()